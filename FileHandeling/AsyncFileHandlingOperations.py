@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from FileHandeling.FileHandlingOperations import FileHandling
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFileHandling:
+    """
+    Asyncio front-end for FileHandling. Every method has the same name and
+    [ok, message, ...] result as its blocking counterpart, but runs it on a
+    bounded thread pool so the event loop never stalls (the batch helpers
+    without one, gatherOperations and readFiles, return a list of
+    results in input order). maxConcurrency caps
+    how many operations are queued on the pool at once; any number of
+    coroutines may wait for a slot.
+    """
+
+    # The operations gatherOperations() may run; everything else on
+    # FileHandling (menus, printing, close, ...) is rejected
+    OPERATIONS = frozenset((
+        "getAllFilesAndFolder", "createNewFile", "readFile", "readRange", "updateFile", "deleteTheFile",
+        "renameFile", "createNewFolder", "updateSearchIndex", "searchFiles",
+        "createNewFiles", "deleteFiles", "renameFiles",
+    ))
+
+    def __init__(self, base_path="./FileHandeling", maxWorkers=32, maxConcurrency=1024, fileHandling=None):
+        # A FileHandling passed in belongs to the caller and is not closed here
+        self.ownsFileHandling = fileHandling is None
+        self.fileHandling = fileHandling or FileHandling(base_path)
+        self.executor = ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix="AsyncFileHandling")
+        self.semaphore = asyncio.Semaphore(maxConcurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+        return False
+
+    async def close(self):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.executor.shutdown)
+        if self.ownsFileHandling:
+            self.fileHandling.close()
+
+    async def runBlocking(self, func, *args):
+        async with self.semaphore:
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+            except Exception as err:
+                logger.error("Async operation %s failed: %s", func.__name__, err)
+                return [False, str(err)]
+
+    # -------------------------------------------------------
+    # Single operations
+    # -------------------------------------------------------
+    async def getAllFilesAndFolder(self, myPath=""):
+        return await self.runBlocking(self.fileHandling.getAllFilesAndFolder, myPath)
+
+    async def createNewFile(self, name, content=""):
+        return await self.runBlocking(self.fileHandling.createNewFile, name, content)
+
+    async def readFile(self, name):
+        return await self.runBlocking(self.fileHandling.readFile, name)
+
+    async def readRange(self, name, offset, length):
+        return await self.runBlocking(self.fileHandling.readRange, name, offset, length)
+
+    async def updateFile(self, name, mode, oldContent, newContent):
+        return await self.runBlocking(self.fileHandling.updateFile, name, mode, oldContent, newContent)
+
+    async def deleteTheFile(self, name):
+        return await self.runBlocking(self.fileHandling.deleteTheFile, name)
+
+    async def renameFile(self, name, newName):
+        return await self.runBlocking(self.fileHandling.renameFile, name, newName)
+
+    async def createNewFolder(self, name):
+        return await self.runBlocking(self.fileHandling.createNewFolder, name)
+
+    async def updateSearchIndex(self, myPath=""):
+        return await self.runBlocking(self.fileHandling.updateSearchIndex, myPath)
+
+    async def searchFiles(self, query, limit=20, myPath="", refresh=False):
+        return await self.runBlocking(self.fileHandling.searchFiles, query, limit, myPath, refresh)
+
+    # -------------------------------------------------------
+    # Bulk operations (same [allOk, message, results] as FileHandling)
+    # -------------------------------------------------------
+    async def createNewFiles(self, files, workers=FileHandling.BULK_WORKERS):
+        """files is an iterable of (name, content) pairs."""
+        return await self.runBlocking(self.fileHandling.createNewFiles, list(files), workers)
+
+    async def deleteFiles(self, names, workers=FileHandling.BULK_WORKERS):
+        return await self.runBlocking(self.fileHandling.deleteFiles, list(names), workers)
+
+    async def renameFiles(self, pairs, workers=FileHandling.BULK_WORKERS):
+        """pairs is an iterable of (name, newName)."""
+        return await self.runBlocking(self.fileHandling.renameFiles, list(pairs), workers)
+
+    # -------------------------------------------------------
+    # Batch helpers (results come back in input order)
+    # -------------------------------------------------------
+    async def gatherOperations(self, operations):
+        """
+        Runs many operations concurrently. operations is an iterable of
+        (methodName, args) tuples, e.g. ("readFile", ("a.txt",)); only the
+        single and bulk operations above (OPERATIONS) are allowed, any other
+        name gives [False, "Unknown operation: ..."].
+        """
+        calls = []
+        for methodName, args in operations:
+            if methodName in AsyncFileHandling.OPERATIONS:
+                calls.append(self.runBlocking(getattr(self.fileHandling, methodName), *args))
+            else:
+                calls.append(asyncio.sleep(0, [False, f"Unknown operation: {methodName}"]))
+        return await asyncio.gather(*calls)
+
+    async def readFiles(self, names):
+        return await asyncio.gather(*(self.readFile(name) for name in names))
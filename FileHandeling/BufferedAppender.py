@@ -0,0 +1,127 @@
+import os
+import time
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+BUFFER_SIZE = 64 * 1024
+FLUSH_INTERVAL = 1.0
+SYNC_POLICIES = ("none", "flush", "always")
+
+
+# -------------------------------------------------------------------------
+# Buffered Appender
+# -------------------------------------------------------------------------
+class BufferedAppender:
+    """
+    Appends records to one file through a descriptor kept open (O_APPEND).
+    Records are collected in memory and written with a single os.write
+    once bufferSize bytes are pending or flushInterval seconds have passed
+    (a background thread handles quiet periods). sync is the fsync policy:
+    "none" leaves it to the OS, "flush" fsyncs every buffer flush and
+    "always" writes and fsyncs each record before append() returns.
+    Safe to share between threads; records keep their append order.
+
+        with BufferedAppender("events.log") as log:
+            log.append("started\n")
+    """
+
+    def __init__(self, path, bufferSize=BUFFER_SIZE, flushInterval=FLUSH_INTERVAL, sync="none", encoding="utf-8"):
+        if sync not in SYNC_POLICIES:
+            raise ValueError(f"sync must be one of {SYNC_POLICIES}, not {sync!r}")
+        self.path = os.fspath(path)
+        self.bufferSize = bufferSize
+        self.flushInterval = flushInterval
+        self.sync = sync
+        self.encoding = encoding
+
+        # lock guards the buffer; writeLock keeps flushes in order while appends continue
+        self.lock = threading.Lock()
+        self.writeLock = threading.Lock()
+        self.buffer = []
+        self.pending = 0
+        self.lastFlush = time.monotonic()
+        self.records = 0
+        self.bytes = 0
+        self.flushes = 0
+        self.syncs = 0
+
+        self.fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self.closed = threading.Event()
+        self.timer = None
+        if flushInterval and sync != "always":
+            self.timer = threading.Thread(target=self.flushPeriodically, name="BufferedAppender", daemon=True)
+            self.timer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    # ---------------------------------------------------------------------
+    # Appending
+    # ---------------------------------------------------------------------
+    def append(self, record):
+        """Queues one record (str or bytes); nothing is added between records."""
+        data = record.encode(self.encoding) if isinstance(record, str) else bytes(record)
+        with self.lock:
+            if self.closed.is_set():
+                raise ValueError("Appender is closed")
+            self.buffer.append(data)
+            self.pending += len(data)
+            self.records += 1
+            due = (self.sync == "always" or self.pending >= self.bufferSize
+                   or time.monotonic() - self.lastFlush >= self.flushInterval)
+        if due:
+            self.flush()
+
+    def appendMany(self, records):
+        for record in records:
+            self.append(record)
+
+    def flush(self):
+        """Writes everything queued so far with one write (and fsync, per policy)."""
+        with self.writeLock:
+            with self.lock:
+                data = b"".join(self.buffer)
+                self.buffer = []
+                self.pending = 0
+                self.lastFlush = time.monotonic()
+            if not data:
+                return
+            view = memoryview(data)
+            while view:
+                view = view[os.write(self.fd, view):]
+            self.bytes += len(data)
+            self.flushes += 1
+            if self.sync != "none":
+                os.fsync(self.fd)
+                self.syncs += 1
+
+    def flushPeriodically(self):
+        while not self.closed.wait(self.flushInterval):
+            try:
+                if self.pending and time.monotonic() - self.lastFlush >= self.flushInterval:
+                    self.flush()
+            except Exception as err:
+                logger.error("Background flush of %s failed: %s", self.path, err)
+
+    def close(self):
+        with self.lock:
+            if self.closed.is_set():
+                return
+            self.closed.set()
+        if self.timer is not None:
+            self.timer.join()
+        try:
+            self.flush()
+        finally:
+            os.close(self.fd)
+        logger.info("Appender for %s closed: %s record(s), %s flush(es)", self.path, self.records, self.flushes)
+
+    def stats(self):
+        return {"records": self.records, "bytes": self.bytes, "flushes": self.flushes, "syncs": self.syncs}
@@ -0,0 +1,145 @@
+import os
+import time
+import stat
+import errno
+import shutil
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+CHUNK_SIZE = 8 * 1024 * 1024
+# Files at least this large are copied by several threads at once
+PARALLEL_THRESHOLD = 64 * 1024 * 1024
+PARALLEL_WORKERS = 4
+# copy_file_range may refuse some file systems / kernels; fall back to pread/pwrite
+FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF}
+
+
+# -------------------------------------------------------------------------
+# Range copies (positional, so several threads can share the descriptors)
+# -------------------------------------------------------------------------
+def copyRange(srcFd, dstFd, offset, length, onBytes=None):
+    """Copies length bytes at offset in the kernel when possible. Returns bytes copied."""
+    end = offset + length
+    position = offset
+    useKernel = hasattr(os, "copy_file_range")
+
+    while position < end:
+        count = min(CHUNK_SIZE, end - position)
+        copied = 0
+        if useKernel:
+            try:
+                copied = os.copy_file_range(srcFd, dstFd, count, position, position)
+            except OSError as err:
+                if err.errno not in FALLBACK_ERRNOS:
+                    raise
+                useKernel = False
+            if copied == 0:
+                # Some file systems answer 0 instead of an error; pread tells a real end of file apart
+                useKernel = False
+        if not copied:
+            data = os.pread(srcFd, count, position)
+            copied = os.pwrite(dstFd, data, position) if data else 0
+        if copied == 0:
+            # Source shrank while copying
+            break
+        position += copied
+        if onBytes is not None:
+            onBytes(copied)
+
+    return position - offset
+
+
+def copyContents(srcFd, dstFd, size, onBytes=None, workers=PARALLEL_WORKERS):
+    """Copies a whole file, splitting large ones into one range per worker thread."""
+    if size < PARALLEL_THRESHOLD or workers < 2:
+        return copyRange(srcFd, dstFd, 0, size, onBytes)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Ranges start on chunk boundaries so every worker does whole chunks
+    part = -(-size // workers)
+    part = -(-part // CHUNK_SIZE) * CHUNK_SIZE
+    ranges = [(start, min(part, size - start)) for start in range(0, size, part)]
+    with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="FastMove") as pool:
+        futures = [pool.submit(copyRange, srcFd, dstFd, start, length, onBytes) for start, length in ranges]
+        return sum(future.result() for future in futures)
+
+
+def copyMetadata(source, destination, st):
+    """Copies mode, timestamps, extended attributes and (if permitted) ownership."""
+    shutil.copystat(source, destination, follow_symlinks=False)
+    try:
+        os.chown(destination, st.st_uid, st.st_gid, follow_symlinks=False)
+    except (PermissionError, NotImplementedError):
+        pass
+
+
+# -------------------------------------------------------------------------
+# Move
+# -------------------------------------------------------------------------
+def fastMove(source, destination, progress=None, workers=PARALLEL_WORKERS):
+    """
+    Moves source to destination. A rename is tried first; across file
+    systems (EXDEV) regular files are copied in the kernel with
+    copy_file_range (pread/pwrite fallback), large files in parallel
+    ranges, then metadata is copied, the copy fsynced and the source
+    removed. Folders and symlinks fall back to shutil.move.
+    progress(copiedBytes, totalBytes) is called as the copy advances.
+    Returns {"method", "bytes", "seconds", "bytesPerSec"}.
+    """
+    start = time.perf_counter()
+    try:
+        os.rename(source, destination)
+        return {"method": "rename", "bytes": 0, "seconds": time.perf_counter() - start, "bytesPerSec": 0.0}
+    except OSError as err:
+        if err.errno != errno.EXDEV:
+            raise
+
+    st = os.lstat(source)
+    if not stat.S_ISREG(st.st_mode):
+        shutil.move(source, destination)
+        seconds = time.perf_counter() - start
+        return {"method": "shutil", "bytes": 0, "seconds": seconds, "bytesPerSec": 0.0}
+
+    size = st.st_size
+    onBytes = None
+    if progress is not None:
+        lock = threading.Lock()
+        copied = [0]
+
+        def onBytes(count):
+            with lock:
+                copied[0] += count
+                done = copied[0]
+            progress(done, size)
+
+    srcFd = os.open(source, os.O_RDONLY)
+    try:
+        # O_EXCL: never clobber a file that appeared at the destination
+        dstFd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_EXCL, st.st_mode & 0o7777)
+        try:
+            if size:
+                os.ftruncate(dstFd, size)
+            total = copyContents(srcFd, dstFd, size, onBytes, workers)
+            if total != size:
+                # The source changed size under us; keep it and drop the partial copy
+                raise OSError(errno.EIO, f"Short copy: {total} of {size} bytes", source)
+            os.fsync(dstFd)
+        except BaseException:
+            os.close(dstFd)
+            os.unlink(destination)
+            raise
+        os.close(dstFd)
+    finally:
+        os.close(srcFd)
+
+    copyMetadata(source, destination, st)
+    os.unlink(source)
+
+    seconds = time.perf_counter() - start
+    rate = total / seconds if seconds else 0.0
+    logger.debug("Copied %s across file systems: %d bytes in %.3fs (%.1f MB/s)", source, total, seconds, rate / 1e6)
+    return {"method": "copy", "bytes": total, "seconds": seconds, "bytesPerSec": rate}
@@ -1,50 +1,54 @@
+import os
+import mmap
 import logging
+import itertools
+import contextlib
 from pathlib import Path
 
+from FileHandeling import LoggingSetup
+from FileHandeling.FastMove import fastMove
+from FileHandeling.StreamReplace import Replacer
+from FileHandeling.BufferedAppender import BufferedAppender
+from FileHandeling.SearchIndex import SearchIndex
+from FileHandeling.SidecarFiles import isRacy
+
+logger = logging.getLogger(__name__)
+hotLogger = LoggingSetup.hotPathLogger(__name__)
+
 
 # -------------------------------------------------------------------------
-# Ensure logs folder exists (Fix for missing log directory)
+# Logging setup (explicit, nothing happens on import)
 # -------------------------------------------------------------------------
-# Get the absolute path to the project root (PYTHONPROJECTS folder)
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-LOG_DIR = PROJECT_ROOT / "logs"
-LOG_DIR.mkdir(exist_ok=True)
-
-LOG_PATH = LOG_DIR / "fileHandeling.log"
-
-# Clear any existing handlers to avoid conflicts
-for handler in logging.root.handlers[:]:
-    logging.root.removeHandler(handler)
-
-# Configure logging
-logging.basicConfig(
-    filename=str(LOG_PATH),  # Convert Path to string
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    force=True  # Force reconfiguration
-)
-
-# Add console handler to see logs in terminal too (optional)
-console = logging.StreamHandler()
-console.setLevel(logging.INFO)
-console.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-logging.getLogger('').addHandler(console)
-
-logging.info("="*50)
-logging.info("FileHandeling logger initialized successfully")
-logging.info(f"Log file location: {LOG_PATH}")
-logging.info("="*50)
+def initLogging(logDir=None, **options):
+    """
+    Sends FileHandeling logs to <logDir>/fileHandeling.log and the console.
+    Applications call this once at startup (see main.py); importing the
+    module never touches the filesystem or the host's logging. Repeated
+    calls are no-ops. options are passed on to LoggingSetup.setupLogging.
+    """
+    return LoggingSetup.initPackageLogging("FileHandeling", "fileHandeling.log", logDir, **options)
+
 
 class FileHandling:
 
     def __init__(self, base_path="./FileHandeling"):
         self.base_path = Path(base_path)
-        Path(self.base_path).mkdir(exist_ok=True)
-        logging.info(f"Base directory set to: {self.base_path}")
+        # Created on first write, see ensureBaseDir()
+        self.baseReady = False
+        # abs dir -> (mtime_ns, entries, summary), see getListing()
+        self.listingCache = {}
+        # abs dir -> open SearchIndex, see getSearchIndex()
+        self.searchIndexes = {}
+        logger.info("Base directory set to: %s", self.base_path)
+
+    def ensureBaseDir(self):
+        if not self.baseReady:
+            self.base_path.mkdir(exist_ok=True)
+            self.baseReady = True
 
     def getPath(self, name=""):
         p = self.base_path / name #type: ignore
-        logging.debug(f"getPath({name}) -> {p}")
+        hotLogger.debug("getPath(%s) -> %s", name, p)
         return p
 
     def getAllFilesAndFolder(self, myPath=""):
@@ -60,33 +64,181 @@ class FileHandling:
             elif isinstance(myPath, Path):
                 target = myPath
             else:
-                logging.warning("Invalid path type passed to getAllFilesAndFolder")
+                logger.warning("Invalid path type passed to getAllFilesAndFolder")
                 return [False, "Invalid path type"]
 
             items = list(target.glob("*"))
-            logging.info(f"Contents of {target}: {items}")
+            logger.info("Listed %s items in %s", len(items), target)
             return [True, items]
 
         except Exception as err:
-            logging.error(f"Error in getAllFilesAndFolder: {err}")
+            logger.error("Error in getAllFilesAndFolder: %s", err)
+            return [False, str(err)]
+
+    def resolveDirectory(self, myPath=""):
+        if isinstance(myPath, str) and not myPath.strip():
+            return self.base_path
+        if isinstance(myPath, (Path, os.PathLike)):
+            return Path(myPath)
+        raise TypeError("Invalid path type")
+
+    def iterDirectory(self, myPath="", cursor=0):
+        """
+        Lazily yields os.DirEntry objects of a directory (same myPath rules
+        as getAllFilesAndFolder). Entries keep the type/stat info cached by
+        scandir, so entry.is_dir() / entry.stat() need no extra syscall.
+        cursor is the number of entries to skip, i.e. where a previous
+        page stopped; skipped entries are still read, so resuming costs
+        O(cursor). Use iterDirectoryPages to walk a whole directory.
+        """
+        target = self.resolveDirectory(myPath)
+        with os.scandir(target) as entries:
+            yield from itertools.islice(entries, cursor, None)
+
+    def getDirectoryPage(self, myPath="", pageSize=1000, cursor=0):
+        """
+        Returns [True, entries, nextCursor] holding at most pageSize entries.
+        nextCursor is None once the directory is exhausted.
+        The cursor is a best-effort position (an entry count), meant for
+        showing a page or two: every call rescans the directory up to it,
+        so paging through N entries costs O(N^2 / pageSize), and entries
+        created or deleted between calls can shift the following pages
+        (an entry may be skipped or shown twice). Code that processes a
+        whole directory should use iterDirectoryPages, a single scandir pass.
+        """
+        try:
+            entries = list(itertools.islice(self.iterDirectory(myPath, cursor), pageSize + 1))
+            nextCursor = None
+            if len(entries) > pageSize:
+                entries.pop()
+                nextCursor = cursor + pageSize
+
+            hotLogger.debug("Page of %s items at cursor %s", len(entries), cursor)
+            return [True, entries, nextCursor]
+
+        except Exception as err:
+            logger.error("Error in getDirectoryPage: %s", err)
+            return [False, str(err)]
+
+    def iterDirectoryPages(self, myPath="", pageSize=1000, cursor=0):
+        """
+        Yields lists of at most pageSize DirEntry objects from one scandir
+        pass: the scalable way to process a large directory page by page.
+        """
+        entries = self.iterDirectory(myPath, cursor)
+        while True:
+            page = list(itertools.islice(entries, pageSize))
+            if not page:
+                return
+            yield page
+
+    # -------------------------------------------------------
+    # Cached listings (menus, counts)
+    # -------------------------------------------------------
+    # Entries per page when printing a listing
+    PAGE_SIZE = 50
+
+    def getListing(self, myPath=""):
+        """
+        Returns [True, entries, summary] for a directory: entries is a sorted
+        tuple of (name, isDir) pairs, summary counts entries/files/folders.
+        Listings are cached per directory and reused while the directory's
+        mtime is unchanged and this object did not modify it, so a cache
+        hit costs one stat however large the directory is.
+        """
+        try:
+            target = self.resolveDirectory(myPath)
+            key = os.path.abspath(target)
+            mtime = os.stat(target).st_mtime_ns
+
+            cached = self.listingCache.get(key)
+            if cached is not None and cached[0] == mtime:
+                return [True, cached[1], cached[2]]
+
+            with os.scandir(target) as entries:
+                listing = tuple(sorted((entry.name, entry.is_dir()) for entry in entries))
+            folders = sum(1 for _, isDir in listing if isDir)
+            summary = {"entries": len(listing), "files": len(listing) - folders, "folders": folders}
+
+            if not isRacy(mtime):
+                self.listingCache[key] = (mtime, listing, summary)
+            else:
+                self.listingCache.pop(key, None)
+            logger.info("Listed %s items in %s", len(listing), target)
+            return [True, listing, summary]
+
+        except Exception as err:
+            logger.error("Error in getListing: %s", err)
             return [False, str(err)]
 
+    def getListingPage(self, myPath="", page=0, pageSize=PAGE_SIZE):
+        """Returns [True, entries, pageCount] for one page of the cached listing."""
+        result = self.getListing(myPath)
+        if not result[0]:
+            return result
+        listing = result[1]
+        pageCount = max(1, -(-len(listing) // pageSize))
+        return [True, listing[page * pageSize:(page + 1) * pageSize], pageCount]
+
+    def invalidateListing(self, *paths):
+        """Drops the cached listings of the folders holding paths."""
+        for path in paths:
+            self.listingCache.pop(os.path.dirname(os.path.abspath(path)), None)
+
+    def invalidateNames(self, names):
+        """Same as invalidateListing for names relative to the base folder, one pop per folder."""
+        for folder in {os.path.dirname(name) for name in names}:
+            self.listingCache.pop(os.path.abspath(self.base_path / folder), None)
+
+    def printListing(self, myPath="", pageSize=PAGE_SIZE, interactive=True, maxPages=None):
+        """
+        Prints a summary line and the listing page by page. Interactive
+        mode waits for Enter between pages (q stops); maxPages limits
+        how many pages are printed at all.
+        """
+        result = self.getListing(myPath)
+        if not result[0]:
+            print(result[1])
+            return result
+
+        listing, summary = result[1], result[2]
+        print(f"{summary['entries']} item(s): {summary['files']} file(s), {summary['folders']} folder(s)")
+        shown = 0
+        for page in itertools.count():
+            if maxPages is not None and page >= maxPages:
+                break
+            for name, isDir in listing[shown:shown + pageSize]:
+                shown += 1
+                print(f"{shown}. {name}{os.sep if isDir else ''}")
+            if shown >= len(listing):
+                break
+            if not interactive:
+                continue
+            more = input(f"-- {shown}/{len(listing)}, Enter for more, q to stop -- ").strip().lower()
+            if more == "q":
+                break
+        if shown < len(listing):
+            print(f"... {len(listing) - shown} more")
+        return [True, "Listing shown"]
+
     def createNewFile(self, name, content=""):
         try:
+            self.ensureBaseDir()
             p = self.getPath(name)
 
             if p.exists():
-                logging.warning(f"File already exists: {p}")
+                logger.warning("File already exists: %s", p)
                 return [False, "File already exists"]
 
             with open(p, "w") as fs:
                 fs.write(content)
+            self.invalidateListing(p)
 
-            logging.info(f"File created: {p}")
+            logger.info("File created: %s", p)
             return [True, "File created"]
 
         except Exception as err:
-            logging.error(f"Error creating file {name}: {err}")
+            logger.error("Error creating file %s: %s", name, err)
             return [False, str(err)]
 
     def readFile(self, name):
@@ -94,17 +246,126 @@ class FileHandling:
             p = self.getPath(name)
 
             if not p.exists():
-                logging.warning(f"Tried reading nonexistent file: {name}")
+                logger.warning("Tried reading nonexistent file: %s", name)
                 return [False, "File not found"]
 
             with open(p, "r") as fs:
                 data = fs.read()
 
-            logging.info(f"File read successfully: {name}")
+            logger.info("File read successfully: %s", name)
+            return [True, "Read success", data]
+
+        except Exception as err:
+            logger.error("Error reading file %s: %s", name, err)
+            return [False, str(err)]
+
+    # -------------------------------------------------------
+    # Streaming reads (constant memory for files of any size)
+    # -------------------------------------------------------
+    READ_CHUNK_SIZE = 1024 * 1024
+
+    def iterFileChunks(self, name, chunkSize=READ_CHUNK_SIZE, offset=0, length=None):
+        """
+        Lazily yields bytes chunks of at most chunkSize, starting at offset
+        and stopping after length bytes (the rest of the file if None).
+        """
+        with open(self.getPath(name), "rb", buffering=0) as fs:
+            if offset:
+                fs.seek(offset)
+            remaining = length
+            while remaining is None or remaining > 0:
+                size = chunkSize if remaining is None else min(chunkSize, remaining)
+                chunk = fs.read(size)
+                if not chunk:
+                    return
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    def iterFileLines(self, name, encoding="utf-8", errors="replace"):
+        """Lazily yields the lines of a text file (line endings kept)."""
+        with open(self.getPath(name), "r", encoding=encoding, errors=errors, buffering=self.READ_CHUNK_SIZE) as fs:
+            yield from fs
+
+    def readRange(self, name, offset, length):
+        """Returns [True, "Read success", data] with at most length bytes read at offset."""
+        try:
+            fd = os.open(self.getPath(name), os.O_RDONLY)
+            try:
+                data = os.pread(fd, length, offset)
+            finally:
+                os.close(fd)
+
+            hotLogger.info("Read %s byte(s) of %s at offset %s", len(data), name, offset)
             return [True, "Read success", data]
 
+        except FileNotFoundError:
+            logger.warning("Tried reading nonexistent file: %s", name)
+            return [False, "File not found"]
+
+        except Exception as err:
+            logger.error("Error reading range of file %s: %s", name, err)
+            return [False, str(err)]
+
+    @contextlib.contextmanager
+    def mapFile(self, name):
+        """
+        Read-only, zero-copy view of a whole file:
+
+            with fh.mapFile("big.log") as view:
+                header = bytes(view[:16])
+
+        view is a memoryview over an mmap; slices copy nothing until
+        converted. It is only valid inside the with block.
+        """
+        with open(self.getPath(name), "rb") as fs:
+            if os.fstat(fs.fileno()).st_size == 0:
+                # mmap cannot map an empty file
+                yield memoryview(b"")
+                return
+            with mmap.mmap(fs.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+    def printFile(self, name, pageSize=PAGE_SIZE, interactive=True, maxPages=None):
+        """
+        Prints a text file pageSize lines at a time while streaming it, so
+        only one page is ever held in memory. Interactive mode waits for
+        Enter between pages (q stops).
+        """
+        try:
+            if not self.getPath(name).is_file():
+                logger.warning("Tried reading nonexistent file: %s", name)
+                print("File not found")
+                return [False, "File not found"]
+
+            lines = self.iterFileLines(name)
+            shown = 0
+            for page in itertools.count():
+                if maxPages is not None and page >= maxPages:
+                    break
+                batch = list(itertools.islice(lines, pageSize))
+                for line in batch:
+                    print(line, end="" if line.endswith("\n") else "\n")
+                shown += len(batch)
+                if len(batch) < pageSize:
+                    break
+                if not interactive:
+                    continue
+                more = input(f"-- {shown} line(s), Enter for more, q to stop -- ").strip().lower()
+                if more == "q":
+                    break
+            lines.close()
+
+            logger.info("File read successfully: %s", name)
+            return [True, "Read success"]
+
         except Exception as err:
-            logging.error(f"Error reading file {name}: {err}")
+            logger.error("Error reading file %s: %s", name, err)
+            print(err)
             return [False, str(err)]
 
     def updateFile(self, name, mode, oldContent, newContent):
@@ -112,19 +373,17 @@ class FileHandling:
             p = self.getPath(name)
 
             if not p.exists():
-                logging.warning(f"Update attempted on nonexistent file: {name}")
+                logger.warning("Update attempted on nonexistent file: %s", name)
                 return [False, "File not found"]
 
-            with open(p, "r") as fs:
-                data = fs.read()
-
             if mode == 1:
-                if oldContent not in data:
-                    logging.warning(f"Old content '{oldContent}' not found in {name}")
+                # Streamed into a temp file and swapped in atomically (see StreamReplace)
+                result = Replacer([(oldContent, newContent)]).replaceFile(p)
+                if not result["replacements"]:
+                    logger.warning("Old content '%s' not found in %s", oldContent, name)
                     return [False, "Old text not found"]
-                newData = data.replace(oldContent, newContent)
-                with open(p, "w") as fs:
-                    fs.write(newData)
+                logger.info("File updated: %s, mode: 1, %s replacement(s)", name, result["replacements"])
+                return [True, f"Update success: {result['replacements']} replacement(s)", result["replacements"]]
 
             elif mode == 2:
                 with open(p, "a") as fs:
@@ -138,11 +397,34 @@ class FileHandling:
                 with open(p, "w") as fs:
                     fs.write("")
 
-            logging.info(f"File updated: {name}, mode: {mode}")
+            logger.info("File updated: %s, mode: %s", name, mode)
             return [True, "Update success"]
 
         except Exception as err:
-            logging.error(f"Error updating file {name}: {err}")
+            logger.error("Error updating file %s: %s", name, err)
+            return [False, str(err)]
+
+    def openAppender(self, name, **options):
+        """
+        Returns [True, message, appender]: a BufferedAppender that keeps the
+        file open and batches records, for callers appending many records
+        (updateFile mode 2 opens and closes the file on every call).
+        options: bufferSize, flushInterval, sync ("none", "flush", "always").
+        Close it (or use it as a context manager) to flush the rest.
+        """
+        try:
+            self.ensureBaseDir()
+            p = self.getPath(name)
+            created = not p.exists()
+            appender = BufferedAppender(p, **options)
+            if created:
+                self.invalidateListing(p)
+
+            logger.info("Appender opened: %s", name)
+            return [True, "Appender opened", appender]
+
+        except Exception as err:
+            logger.error("Error opening appender for %s: %s", name, err)
             return [False, str(err)]
 
     def deleteTheFile(self, name):
@@ -150,148 +432,406 @@ class FileHandling:
             p = self.getPath(name)
 
             if not p.exists():
-                logging.warning(f"Delete attempted on nonexistent file: {name}")
+                logger.warning("Delete attempted on nonexistent file: %s", name)
                 return [False, "File not found"]
 
             p.unlink()
-            logging.info(f"File deleted: {name}")
+            self.invalidateListing(p)
+            logger.info("File deleted: %s", name)
             return [True, "File deleted"]
 
         except Exception as err:
-            logging.error(f"Error deleting file {name}: {err}")
+            logger.error("Error deleting file %s: %s", name, err)
             return [False, str(err)]
 
-    def renameFile(self, name, newName):
+    def renameFile(self, name, newName, progress=None):
+        """
+        Renames (or moves) a file. Across file systems the data is copied in
+        the kernel; progress(copiedBytes, totalBytes) reports that copy.
+        """
         try:
             p = self.getPath(name)
 
             if not p.exists():
-                logging.warning(f"Rename attempted on nonexistent file: {name}")
+                logger.warning("Rename attempted on nonexistent file: %s", name)
                 return [False, "File not found"]
 
             newPath = self.getPath(newName)
 
             if newPath.exists():
-                logging.warning(f"Rename failed; new name exists: {newName}")
+                logger.warning("Rename failed; new name exists: %s", newName)
                 return [False, "New file already exists"]
 
-            p.rename(newPath)
+            result = fastMove(p, newPath, progress)
+            self.invalidateListing(p, newPath)
 
-            logging.info(f"File renamed from {name} to {newName}")
+            if result["method"] == "copy":
+                logger.info(
+                    "File moved across file systems from %s to %s (%d bytes, %.1f MB/s)",
+                    name, newName, result['bytes'], result['bytesPerSec'] / 1e6,
+                )
+            else:
+                logger.info("File renamed from %s to %s", name, newName)
             return [True, "Rename success"]
 
         except Exception as err:
-            logging.error(f"Error renaming file {name}: {err}")
+            logger.error("Error renaming file %s: %s", name, err)
             return [False, str(err)]
 
     def createNewFolder(self, name):
         try:
+            self.ensureBaseDir()
             p = self.getPath(name)
 
             if p.exists():
-                logging.warning(f"Folder already exists: {name}")
+                logger.warning("Folder already exists: %s", name)
                 return [False, "Folder already exists"]
 
             p.mkdir()
-            logging.info(f"Folder created: {name}")
+            self.invalidateListing(p)
+            logger.info("Folder created: %s", name)
 
             return [True, "Folder created"]
 
         except Exception as err:
-            logging.error(f"Error creating folder {name}: {err}")
+            logger.error("Error creating folder %s: %s", name, err)
             return [False, str(err)]
 
     # -------------------------------------------------------
-    # RUN METHOD WITH LOGGING
+    # Bulk operations (one call, per-item results in input order)
     # -------------------------------------------------------
-    def run(self):
-        logging.info("Program started")
-
-        while True:
-            try:
-                print("1 Create\n2 Read\n3 Update\n4 Delete\n5 Rename\n6 Exit")
-                choice = int(input("Selection: "))
-                logging.info(f"User selected: {choice}")
-
-            except ValueError:
-                print("Invalid input! Please enter a number.")
-                logging.warning("Invalid non-numeric menu choice")
-                continue
-
-            except Exception as err:
-                print(f"Unexpected error: {err}")
-                logging.error(f"Unexpected error at menu selection: {err}")
-                continue
+    BULK_WORKERS = 8
 
+    def directorySnapshot(self, names):
+        """Set of the given names that exist, from one scandir per distinct parent folder."""
+        existing = set()
+        for folder in {os.path.dirname(name) for name in names}:
             try:
-                match choice:
-                    case 1:
-                        name = input("Enter filename: ")
-                        content = input("Enter content: ")
-                        logging.info(f"Create operation for: {name}")
-
-                        result = self.createNewFile(name, content)
-                        logging.info(f"Create result: {result}")
-
-                        print(result[1])
-
-                    case 2:
-                        name = input("Enter filename: ")
-                        logging.info(f"Read operation for: {name}")
-
-                        result = self.readFile(name)
-                        logging.info(f"Read result: {result}")
-
-                        print(result[1] if not result[0] else result[2])
-
-                    case 3:
-                        name = input("File to update: ")
-                        mode = int(input("Select Mode\n1 replace\n2 append\n3 overwrite\n4 clear\n"))
-                        logging.info(f"Update requested: {name}, mode: {mode}")
-
-                        oldVal = input("Old: ") if mode == 1 else None
-                        newVal = input("New: ")
+                with os.scandir(self.getPath(folder)) as entries:
+                    if folder:
+                        existing.update(os.path.join(folder, entry.name) for entry in entries)
+                    else:
+                        existing.update(entry.name for entry in entries)
+            except (FileNotFoundError, NotADirectoryError):
+                pass
+        return existing
+
+    @staticmethod
+    def runBulk(func, items, workers):
+        """Applies func to every item on a thread pool; results keep the input order."""
+        if workers <= 1 or len(items) < 2:
+            return [func(item) for item in items]
+        from concurrent.futures import ThreadPoolExecutor
+
+        # One contiguous slice per task keeps the per-item cost at a plain call
+        size = -(-len(items) // (workers * 4))
+        slices = [items[start:start + size] for start in range(0, len(items), size)]
+        with ThreadPoolExecutor(max_workers=min(workers, len(slices)), thread_name_prefix="FileHandlingBulk") as pool:
+            results = []
+            for part in pool.map(lambda part: [func(item) for item in part], slices):
+                results.extend(part)
+            return results
+
+    @staticmethod
+    def bulkSummary(action, results):
+        failed = sum(1 for result in results if not result[0])
+        if failed:
+            logger.warning("%s: %s of %s item(s) failed", action, failed, len(results))
+        else:
+            logger.info("%s: %s item(s)", action, len(results))
+        return [not failed, f"{action}: {len(results) - failed} ok, {failed} failed", results]
+
+    def createNewFiles(self, files, workers=BULK_WORKERS):
+        """
+        Creates many files. files is an iterable of (name, content) pairs.
+        Each file is opened with O_EXCL, so an existing file is reported
+        instead of overwritten without a separate exists() check.
+        Returns [allOk, message, results] with one [ok, message] per file.
+        """
+        try:
+            self.ensureBaseDir()
+            base = os.fspath(self.base_path)
+            files = [(os.path.normpath(name), content) for name, content in files]
+
+            def create(item):
+                name, content = item
+                try:
+                    data = content.encode() if isinstance(content, str) else bytes(content)
+                    fd = os.open(os.path.join(base, name), os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                    try:
+                        while data:
+                            data = data[os.write(fd, data):]
+                    finally:
+                        os.close(fd)
+                    hotLogger.info("File created: %s", name)
+                    return [True, "File created"]
+                except FileExistsError:
+                    return [False, "File already exists"]
+                except Exception as err:
+                    return [False, str(err)]
+
+            results = FileHandling.runBulk(create, files, workers)
+            self.invalidateNames(name for name, _ in files)
+            return FileHandling.bulkSummary("Create files", results)
 
-                        result = self.updateFile(name, mode, oldVal, newVal)
-                        logging.info(f"Update result: {result}")
+        except Exception as err:
+            logger.error("Error creating files: %s", err)
+            return [False, str(err)]
 
-                        print(result[1])
+    def deleteFiles(self, names, workers=BULK_WORKERS):
+        """
+        Deletes many files. Missing names are answered from one directory
+        snapshot without a syscall each. Returns [allOk, message, results].
+        """
+        try:
+            base = os.fspath(self.base_path)
+            names = [os.path.normpath(name) for name in names]
+            existing = self.directorySnapshot(names)
+
+            def delete(name):
+                if name not in existing:
+                    return [False, "File not found"]
+                try:
+                    os.unlink(os.path.join(base, name))
+                    hotLogger.info("File deleted: %s", name)
+                    return [True, "File deleted"]
+                except FileNotFoundError:
+                    return [False, "File not found"]
+                except Exception as err:
+                    return [False, str(err)]
+
+            results = FileHandling.runBulk(delete, names, workers)
+            self.invalidateNames(names)
+            return FileHandling.bulkSummary("Delete files", results)
 
-                    case 4:
-                        name = input("File to delete: ")
-                        logging.info(f"Delete requested for: {name}")
+        except Exception as err:
+            logger.error("Error deleting files: %s", err)
+            return [False, str(err)]
 
-                        result = self.deleteTheFile(name)
-                        logging.info(f"Delete result: {result}")
+    def renameFiles(self, pairs, workers=BULK_WORKERS):
+        """
+        Renames many files. pairs is an iterable of (name, newName).
+        Sources and targets are checked against one directory snapshot
+        (including targets claimed earlier in the same call), then the
+        renames run on a worker pool. Returns [allOk, message, results].
+        """
+        try:
+            base = os.fspath(self.base_path)
+            pairs = [(os.path.normpath(name), os.path.normpath(newName)) for name, newName in pairs]
+            existing = self.directorySnapshot([name for pair in pairs for name in pair])
+
+            # Conflicts are decided up front, in input order, so results are deterministic.
+            # A rename onto a name freed earlier in the batch has to wait for that rename.
+            planned = []
+            deferred = []
+            freed = set()
+            for index, (name, newName) in enumerate(pairs):
+                if name not in existing:
+                    planned.append((name, newName, [False, "File not found"]))
+                elif newName in existing:
+                    planned.append((name, newName, [False, "New file already exists"]))
+                else:
+                    existing.discard(name)
+                    existing.add(newName)
+                    freed.add(name)
+                    if newName in freed:
+                        deferred.append(index)
+                    planned.append((name, newName, None))
+
+            def rename(item):
+                if item is None:
+                    return None
+                name, newName, result = item
+                if result is not None:
+                    return result
+                try:
+                    fastMove(os.path.join(base, name), os.path.join(base, newName))
+                    hotLogger.info("File renamed from %s to %s", name, newName)
+                    return [True, "Rename success"]
+                except Exception as err:
+                    return [False, str(err)]
+
+            # Deferred renames are skipped on the pool and run afterwards, in input order
+            waiting = set(deferred)
+            items = [None if index in waiting else item for index, item in enumerate(planned)]
+            results = FileHandling.runBulk(rename, items, workers)
+            for index in deferred:
+                results[index] = rename(planned[index])
+            self.invalidateNames(name for pair in pairs for name in pair)
+            return FileHandling.bulkSummary("Rename files", results)
 
-                        print(result[1])
+        except Exception as err:
+            logger.error("Error renaming files: %s", err)
+            return [False, str(err)]
 
-                    case 5:
-                        name = input("Old name: ")
-                        newName = input("New name: ")
-                        logging.info(f"Rename requested: {name} → {newName}")
+    # -------------------------------------------------------
+    # Full-text search (SQLite FTS5 index next to the folder)
+    # -------------------------------------------------------
+    def getSearchIndex(self, myPath=""):
+        """Open SearchIndex of a folder, shared by later calls on the same folder."""
+        target = os.path.abspath(self.resolveDirectory(myPath))
+        index = self.searchIndexes.get(target)
+        if index is None:
+            # The base folder keeps its index inside, its parent is not ours to write to
+            opened = SearchIndex(target, inside=target == os.path.abspath(self.base_path))
+            opened.open()
+            # Another thread may have opened the same folder meanwhile
+            index = self.searchIndexes.setdefault(target, opened)
+            if index is not opened:
+                opened.close()
+        return index
+
+    def updateSearchIndex(self, myPath=""):
+        """
+        Brings the folder's search index up to date; only files that are
+        new or changed (size/mtime) since the last update are read.
+        Returns [True, message, stats].
+        """
+        try:
+            stats = self.getSearchIndex(myPath).update()
+            message = (f"Index updated: {stats['added']} added, {stats['updated']} updated, "
+                       f"{stats['removed']} removed, {stats['unchanged']} unchanged")
+            return [True, message, stats]
 
-                        result = self.renameFile(name, newName)
-                        logging.info(f"Rename result: {result}")
+        except Exception as err:
+            logger.error("Error updating search index: %s", err)
+            return [False, str(err)]
 
-                        print(result[1])
+    def searchFiles(self, query, limit=20, myPath="", refresh=False):
+        """
+        Returns [True, message, results] with {"path", "snippet"} dicts for
+        the text files matching an FTS5 query, best first. Results come from
+        the index; pass refresh=True (or call updateSearchIndex) to pick up
+        changes first.
+        """
+        try:
+            index = self.getSearchIndex(myPath)
+            if refresh:
+                index.update()
+            results = index.search(query, limit)
+            logger.info("Search '%s': %s result(s)", query, len(results))
+            return [True, f"{len(results)} result(s)", results]
 
-                    case 6:
-                        print("Exiting…")
-                        logging.info("Program exited by user")
-                        break
+        except Exception as err:
+            logger.error("Error searching for '%s': %s", query, err)
+            return [False, str(err)]
 
-                    case _:
-                        print("Invalid choice")
-                        logging.warning(f"Invalid menu option selected: {choice}")
+    def close(self):
+        """Closes the search indexes opened by searches; the next search reopens them."""
+        indexes, self.searchIndexes = self.searchIndexes, {}
+        for index in indexes.values():
+            index.close()
 
-            except ValueError:
-                print("Invalid data provided")
-                logging.warning("ValueError in run operation")
+    # -------------------------------------------------------
+    # RUN METHOD WITH LOGGING
+    # -------------------------------------------------------
+    def run(self):
+        logger.info("Program started")
+        self.ensureBaseDir()
 
-            except Exception as err:
-                print(f"Unexpected error occurred: {err}")
-                logging.error(f"Unexpected error in operation: {err}")
+        try:
+            while True:
+                try:
+                    print("1 Create\n2 Read\n3 Update\n4 Delete\n5 Rename\n6 Exit\n7 List\n8 Search")
+                    choice = int(input("Selection: "))
+                    logger.info("User selected: %s", choice)
+
+                except ValueError:
+                    print("Invalid input! Please enter a number.")
+                    logger.warning("Invalid non-numeric menu choice")
+                    continue
+
+                except Exception as err:
+                    print(f"Unexpected error: {err}")
+                    logger.error("Unexpected error at menu selection: %s", err)
+                    continue
+
+                try:
+                    match choice:
+                        case 1:
+                            name = input("Enter filename: ")
+                            content = input("Enter content: ")
+                            logger.info("Create operation for: %s", name)
+
+                            result = self.createNewFile(name, content)
+                            logger.info("Create result: %s", result)
+
+                            print(result[1])
+
+                        case 2:
+                            name = input("Enter filename: ")
+                            logger.info("Read operation for: %s", name)
+
+                            # Streams the file a page at a time instead of printing it whole
+                            result = self.printFile(name)
+                            logger.info("Read result: %s", result)
+
+                        case 3:
+                            name = input("File to update: ")
+                            mode = int(input("Select Mode\n1 replace\n2 append\n3 overwrite\n4 clear\n"))
+                            logger.info("Update requested: %s, mode: %s", name, mode)
+
+                            oldVal = input("Old: ") if mode == 1 else None
+                            newVal = input("New: ")
+
+                            result = self.updateFile(name, mode, oldVal, newVal)
+                            logger.info("Update result: %s", result)
+
+                            print(result[1])
+
+                        case 4:
+                            name = input("File to delete: ")
+                            logger.info("Delete requested for: %s", name)
+
+                            result = self.deleteTheFile(name)
+                            logger.info("Delete result: %s", result)
+
+                            print(result[1])
+
+                        case 5:
+                            name = input("Old name: ")
+                            newName = input("New name: ")
+                            logger.info("Rename requested: %s → %s", name, newName)
+
+                            result = self.renameFile(name, newName)
+                            logger.info("Rename result: %s", result)
+
+                            print(result[1])
+
+                        case 6:
+                            print("Exiting…")
+                            logger.info("Program exited by user")
+                            break
+
+                        case 7:
+                            self.printListing()
+
+                        case 8:
+                            query = input("Search for: ")
+                            logger.info("Search requested: %s", query)
+
+                            result = self.searchFiles(query, refresh=True)
+                            if result[0]:
+                                print(result[1])
+                                for hit in result[2]:
+                                    print(f"{hit['path']}: {hit['snippet']}")
+                            else:
+                                print(result[1])
+
+                        case _:
+                            print("Invalid choice")
+                            logger.warning("Invalid menu option selected: %s", choice)
+
+                except ValueError:
+                    print("Invalid data provided")
+                    logger.warning("ValueError in run operation")
+
+                except Exception as err:
+                    print(f"Unexpected error occurred: {err}")
+                    logger.error("Unexpected error in operation: %s", err)
+        finally:
+            # Search indexes stay open between searches; release them with the menu
+            self.close()
 
 
 
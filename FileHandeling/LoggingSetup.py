@@ -0,0 +1,146 @@
+import os
+import queue
+import atexit
+import logging
+import threading
+from pathlib import Path
+
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+# Per-file messages of hot loops go to "<module>.hotpath" child loggers
+HOT_PATH_SUFFIX = ".hotpath"
+# Environment overrides, e.g. FILEHANDLING_LOG_LEVELS="FileOrganizer.MoveEngine=WARNING"
+LEVELS_ENV = "FILEHANDLING_LOG_LEVELS"
+QUIET_ENV = "FILEHANDLING_QUIET_HOT_PATH"
+
+configured = {}
+initialized = {}
+initLock = threading.Lock()
+# Default log folder: <project root>/logs
+DEFAULT_LOG_DIR = Path(__file__).parent.parent / "logs"
+
+
+def hotPathLogger(moduleName):
+    """Logger for per-item messages of hot loops (one line per file/move)."""
+    logger = logging.getLogger(moduleName + HOT_PATH_SUFFIX)
+    if isQuietHotPath(moduleName.split(".")[0]):
+        logger.setLevel(logging.WARNING)
+    return logger
+
+
+def parseLevels(spec):
+    """Parses "FileOrganizer.MoveEngine=WARNING,FileHandeling=DEBUG" into a dict."""
+    levels = {}
+    for part in (spec or "").split(","):
+        if "=" in part:
+            name, level = part.split("=", 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setQuietHotPath(packageName, quiet=True):
+    """
+    Quiet hot path mode: per-item lines are dropped and only the
+    aggregated summary line of each batch is written.
+    """
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith(packageName) and name.endswith(HOT_PATH_SUFFIX):
+            logging.getLogger(name).setLevel(logging.WARNING if quiet else logging.NOTSET)
+    configured.setdefault(packageName, {})["quiet"] = quiet
+
+
+def isQuietHotPath(packageName):
+    return configured.get(packageName, {}).get("quiet", False)
+
+
+def setupLogging(packageName, logFile, level=logging.INFO, moduleLevels=None,
+                 console=True, background=True, quietHotPath=False):
+    """
+    Sends the records of one package logger (e.g. "FileOrganizer") to
+    logFile and, optionally, the console. With background=True the calling
+    thread only puts records on a queue; a QueueListener thread formats and
+    writes them. moduleLevels maps logger names to levels, e.g.
+    {"FileOrganizer.MoveEngine": "WARNING"}; FILEHANDLING_LOG_LEVELS and
+    FILEHANDLING_QUIET_HOT_PATH=1 override them from the environment.
+    Calling it again for the same
+    package replaces the previous configuration. The package logger does
+    not propagate to the root logger, so the host's own logging is untouched.
+    """
+    # Only needed once logging is actually configured, keeps imports light
+    import logging.handlers
+
+    shutdownLogging(packageName)
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler(str(logFile), delay=True)]
+    if console:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    logger = logging.getLogger(packageName)
+    listener = None
+    if background:
+        records = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+        listener.start()
+        logger.addHandler(logging.handlers.QueueHandler(records))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
+
+    logger.setLevel(level)
+    logger.propagate = False
+    levels = dict(moduleLevels or {})
+    levels.update(parseLevels(os.environ.get(LEVELS_ENV)))
+    for name, moduleLevel in levels.items():
+        logging.getLogger(name).setLevel(moduleLevel)
+
+    configured[packageName] = {"listener": listener, "handlers": handlers, "quiet": False}
+    quiet = quietHotPath or os.environ.get(QUIET_ENV, "") not in ("", "0")
+    setQuietHotPath(packageName, quiet)
+    return logger
+
+
+def initPackageLogging(packageName, fileName, logDir=None, **options):
+    """
+    Idempotent one-time setup used by the packages' initLogging(): creates
+    the log folder, configures the package logger and writes the banner.
+    Later calls return the same log path without touching anything.
+    """
+    with initLock:
+        if packageName in initialized:
+            return initialized[packageName]
+
+        logDir = Path(logDir) if logDir else DEFAULT_LOG_DIR.resolve()
+        logDir.mkdir(exist_ok=True)
+        logPath = logDir / fileName
+        setupLogging(packageName, logPath, **options)
+
+        logger = logging.getLogger(packageName)
+        logger.info("="*50)
+        logger.info("%s logger initialized successfully", packageName)
+        logger.info("Log file location: %s", logPath)
+        logger.info("="*50)
+
+        initialized[packageName] = logPath
+        return logPath
+
+
+def shutdownLogging(packageName=None):
+    """Flushes and detaches the handlers installed by setupLogging."""
+    names = [packageName] if packageName else list(configured)
+    for name in names:
+        state = configured.pop(name, None)
+        if not state or "handlers" not in state:
+            continue
+        if state["listener"] is not None:
+            state["listener"].stop()
+        logger = logging.getLogger(name)
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+        for handler in state["handlers"]:
+            handler.close()
+
+
+atexit.register(shutdownLogging)
@@ -0,0 +1,195 @@
+import os
+import time
+import logging
+import threading
+from pathlib import Path
+
+from FileHandeling import LoggingSetup
+from FileHandeling.SidecarFiles import SEARCH_INDEX_SUFFIX, sidecarPath, isSidecarName, relativePath, isRacy, connectSqlite
+
+logger = logging.getLogger(__name__)
+hotLogger = LoggingSetup.hotPathLogger(__name__)
+
+
+# Plain-text documents and source code; binary formats (pdf, docx) are not indexed
+TEXT_EXTENSIONS = frozenset({
+    ".txt", ".md", ".rst", ".csv", ".tsv", ".log", ".json", ".xml", ".yaml", ".yml", ".ini", ".cfg",
+    ".toml", ".html", ".css", ".js", ".ts", ".py", ".java", ".c", ".h", ".cpp", ".hpp", ".cs",
+    ".php", ".rb", ".swift", ".go", ".kt", ".rs", ".sh", ".bat", ".sql",
+})
+MAX_FILE_SIZE = 16 * 1024 * 1024
+
+
+# -------------------------------------------------------------------------
+# Search Index
+# -------------------------------------------------------------------------
+class SearchIndex:
+    """
+    Full-text index of a folder's text files in SQLite FTS5, kept next to
+    the folder (".<folder>.searchIndex.sqlite", inside it with inside=True).
+    update() walks the tree
+    and only reads files that are new or whose size/mtime changed since
+    the last update; deleted files are dropped. search() answers FTS5
+    queries ("error AND disk", "\"exact phrase\"", "conf*") from the
+    index alone, best matches (bm25) first. One connection is shared by
+    all threads behind a lock.
+    """
+    SUFFIX = SEARCH_INDEX_SUFFIX
+    # Files that look binary (NUL in the first bytes) are skipped
+    SNIFF_BYTES = 8192
+
+    def __init__(self, root, extensions=TEXT_EXTENSIONS, maxFileSize=MAX_FILE_SIZE, inside=False):
+        self.root = Path(root)
+        self.path = sidecarPath(self.root, SearchIndex.SUFFIX, inside)
+        self.extensions = frozenset(ext.lower() for ext in extensions)
+        self.maxFileSize = maxFileSize
+        self.lock = threading.Lock()
+        self.conn = None
+
+    @staticmethod
+    def isIndexFile(name):
+        return isSidecarName(name, SearchIndex.SUFFIX)
+
+    # ---------------------------------------------------------------------
+    # Open / Close
+    # ---------------------------------------------------------------------
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def open(self):
+        self.conn = connectSqlite(self.path)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY, path TEXT UNIQUE, size INTEGER, mtime_ns INTEGER
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(body, prefix='2 3');
+            """
+        )
+        self.conn.commit()
+        logger.info("Search index opened: %s", self.path)
+
+    def close(self):
+        if self.conn is not None:
+            with self.lock:
+                self.conn.commit()
+                self.conn.close()
+                self.conn = None
+
+    # ---------------------------------------------------------------------
+    # Updates
+    # ---------------------------------------------------------------------
+    def relative(self, path):
+        return relativePath(path, self.root)
+
+    def iterTextFiles(self):
+        """Yields (relative path, DirEntry) of indexable files; folder symlinks are not followed."""
+        stack = [str(self.root)]
+        while stack:
+            folder = stack.pop()
+            try:
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif (entry.is_file(follow_symlinks=False)
+                              and os.path.splitext(entry.name)[1].lower() in self.extensions):
+                            yield self.relative(entry.path), entry
+            except OSError as err:
+                logger.error("Cannot scan directory '%s': %s", folder, err)
+
+    def readText(self, path, size):
+        """File text for the index, or None for oversized or binary files."""
+        if size > self.maxFileSize:
+            return None
+        with open(path, "rb") as fs:
+            data = fs.read()
+        if b"\0" in data[:SearchIndex.SNIFF_BYTES]:
+            return None
+        return data.decode("utf-8", errors="replace")
+
+    def update(self):
+        """Indexes new and changed files and drops deleted ones. Returns stats."""
+        start = time.perf_counter()
+        added = updated = removed = skipped = scanned = 0
+
+        with self.lock:
+            known = {path: (fileId, size, mtime) for fileId, path, size, mtime
+                     in self.conn.execute("SELECT id, path, size, mtime_ns FROM files")}  # type: ignore
+            now = time.time()
+            with self.conn:  # type: ignore
+                for rel, entry in self.iterTextFiles():
+                    scanned += 1
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    previous = known.pop(rel, None)
+                    if previous is not None and previous[1:] == (st.st_size, st.st_mtime_ns):
+                        continue
+
+                    try:
+                        text = self.readText(entry.path, st.st_size)
+                    except OSError as err:
+                        # Not recorded, so the next update tries again
+                        hotLogger.warning("Cannot index %s: %s", entry.path, err)
+                        skipped += 1
+                        if previous is not None:
+                            self.conn.execute("DELETE FROM docs WHERE rowid = ?", (previous[0],))  # type: ignore
+                            self.conn.execute("DELETE FROM files WHERE id = ?", (previous[0],))  # type: ignore
+                            removed += 1
+                        continue
+
+                    # A racy mtime is stored as NULL so the next update reads the file again.
+                    # Binary and oversized files get a files row but no docs row, so they are
+                    # not read again until they change
+                    mtime = None if isRacy(st.st_mtime_ns, now) else st.st_mtime_ns
+                    if previous is None:
+                        fileId = self.conn.execute(  # type: ignore
+                            "INSERT INTO files (path, size, mtime_ns) VALUES (?, ?, ?)", (rel, st.st_size, mtime)
+                        ).lastrowid
+                    else:
+                        fileId = previous[0]
+                        self.conn.execute("DELETE FROM docs WHERE rowid = ?", (fileId,))  # type: ignore
+                        self.conn.execute(  # type: ignore
+                            "UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?", (st.st_size, mtime, fileId)
+                        )
+                    if text is None:
+                        skipped += 1
+                        continue
+                    if previous is None:
+                        added += 1
+                    else:
+                        updated += 1
+                    self.conn.execute("INSERT INTO docs (rowid, body) VALUES (?, ?)", (fileId, text))  # type: ignore
+                    hotLogger.debug("Indexed %s", rel)
+
+                # Whatever was not seen on disk is gone
+                for fileId, _, _ in known.values():
+                    self.conn.execute("DELETE FROM docs WHERE rowid = ?", (fileId,))  # type: ignore
+                    self.conn.execute("DELETE FROM files WHERE id = ?", (fileId,))  # type: ignore
+                removed += len(known)
+
+        seconds = time.perf_counter() - start
+        stats = {"scanned": scanned, "added": added, "updated": updated, "removed": removed,
+                 "skipped": skipped, "unchanged": scanned - added - updated - skipped, "seconds": seconds}
+        logger.info("Search index %s updated: %s", self.path, stats)
+        return stats
+
+    # ---------------------------------------------------------------------
+    # Search
+    # ---------------------------------------------------------------------
+    def search(self, query, limit=20):
+        """Returns [{"path", "snippet"}] for an FTS5 query, best matches first."""
+        with self.lock:
+            rows = self.conn.execute(  # type: ignore
+                "SELECT files.path, snippet(docs, 0, '[', ']', '...', 12) FROM docs "
+                "JOIN files ON files.id = docs.rowid WHERE docs MATCH ? ORDER BY rank LIMIT ?",
+                (query, limit),
+            ).fetchall()
+        return [{"path": path, "snippet": snippet} for path, snippet in rows]
@@ -0,0 +1,103 @@
+"""
+Helpers for the files kept alongside a managed folder (indexes, caches,
+journals): where they live, how they are recognized, relative paths,
+atomic writes and the "racy timestamp" rule.
+"""
+import os
+import time
+import contextlib
+from pathlib import Path
+
+
+# Timestamps this close to "now" may still change within the same tick,
+# so they are not trusted to detect later changes
+RACY_SECONDS = 2.0
+
+ORGANIZE_INDEX_SUFFIX = ".organizeIndex.sqlite"
+SNIFF_CACHE_SUFFIX = ".sniffCache.json"
+JOURNAL_SUFFIX = ".organizeJournal"
+SEARCH_INDEX_SUFFIX = ".searchIndex.sqlite"
+RESOLVER_CACHE_SUFFIX = ".resolver-cache"
+REPLACE_TEMP_SUFFIX = ".replace.tmp"
+SUFFIXES = (
+    ORGANIZE_INDEX_SUFFIX, SNIFF_CACHE_SUFFIX, JOURNAL_SUFFIX, SEARCH_INDEX_SUFFIX, RESOLVER_CACHE_SUFFIX,
+)
+SQLITE_EXTRAS = ("-wal", "-shm", "-journal")
+
+
+def sidecarPath(root, suffix, inside=False):
+    """
+    Path of the ".<folder><suffix>" file kept for folder root: next to the
+    folder, or inside it with inside=True (for a base folder whose parent
+    is not managed).
+    """
+    root = Path(root)
+    name = f".{root.resolve().name}{suffix}"
+    return root / name if inside else root.parent / name
+
+
+def isSidecarName(name, suffix):
+    """
+    True if name is exactly a ".<name><suffix>" sidecar, one of SQLite's
+    -wal/-shm/-journal files next to it or an atomicWrite() temp of it
+    ("<sidecar>.<pid>.tmp"). A user's "a<suffix>.bak" is not.
+    """
+    if name.endswith(".tmp"):
+        head, _, pid = name[:-4].rpartition(".")
+        if pid.isdigit():
+            name = head
+    for extra in SQLITE_EXTRAS:
+        if name.endswith(extra):
+            name = name[:-len(extra)]
+            break
+    return name.startswith(".") and len(name) > len(suffix) + 1 and name.endswith(suffix)
+
+
+def isReplaceTemp(name):
+    """True for StreamReplace's ".<name>.<pid>.replace.tmp" temp files."""
+    if not name.startswith(".") or not name.endswith(REPLACE_TEMP_SUFFIX):
+        return False
+    head, _, pid = name[:-len(REPLACE_TEMP_SUFFIX)].rpartition(".")
+    return len(head) > 1 and pid.isdigit()
+
+
+def isSidecarFile(name):
+    """True for any index, cache, journal or temp file this package writes next to user files."""
+    return isReplaceTemp(name) or any(isSidecarName(name, suffix) for suffix in SUFFIXES)
+
+
+def relativePath(path, root):
+    """path relative to root with "/" separators; "" for root itself."""
+    rel = os.path.relpath(path, root)
+    return "" if rel == "." else rel.replace(os.sep, "/")
+
+
+def isRacy(mtime_ns, now=None):
+    return (now if now is not None else time.time()) - mtime_ns / 1e9 < RACY_SECONDS
+
+
+def atomicWrite(path, data):
+    """
+    Writes str or bytes to path through a temp file and os.replace, so a
+    concurrent reader never sees half a file. Raises OSError.
+    """
+    path = Path(path)
+    temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp, "wb" if isinstance(data, bytes) else "w") as fs:
+            fs.write(data)
+        os.replace(temp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp)
+        raise
+
+
+def connectSqlite(path):
+    """Opens an SQLite database in WAL mode; sqlite3 is only imported by the features that need it."""
+    import sqlite3
+
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
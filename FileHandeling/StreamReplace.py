@@ -0,0 +1,215 @@
+import os
+import re
+import mmap
+import time
+import logging
+
+from FileHandeling.FastMove import copyRange
+from FileHandeling.SidecarFiles import REPLACE_TEMP_SUFFIX
+
+logger = logging.getLogger(__name__)
+
+
+CHUNK_SIZE = 4 * 1024 * 1024
+
+
+# -------------------------------------------------------------------------
+# Replacer
+# -------------------------------------------------------------------------
+class Replacer:
+    """
+    Replaces several literal patterns in one pass over a file's bytes.
+    replacements is a dict or an iterable of (old, new) pairs, str (UTF-8)
+    or bytes. Like str.replace, matches are leftmost and non-overlapping;
+    where patterns overlap at the same position the longest one wins.
+    A Replacer is compiled once and can be pickled to worker processes.
+    """
+
+    def __init__(self, replacements):
+        if isinstance(replacements, dict):
+            replacements = replacements.items()
+        self.mapping = {}
+        for old, new in replacements:
+            old = old.encode() if isinstance(old, str) else bytes(old)
+            new = new.encode() if isinstance(new, str) else bytes(new)
+            if not old:
+                raise ValueError("Cannot replace empty text")
+            self.mapping[old] = new
+        if not self.mapping:
+            raise ValueError("No replacements given")
+
+        alternatives = sorted(self.mapping, key=len, reverse=True)
+        self.pattern = re.compile(b"|".join(re.escape(old) for old in alternatives))
+        self.maxLen = len(alternatives[0])
+        self.sameLength = all(len(old) == len(new) for old, new in self.mapping.items())
+        # With a single pattern a literal template keeps subn entirely in C
+        self.template = None
+        if len(self.mapping) == 1:
+            self.template = next(iter(self.mapping.values())).replace(b"\\", b"\\\\")
+
+    def lookup(self, match):
+        return self.mapping[match.group()]
+
+    # ---------------------------------------------------------------------
+    # Scanning
+    # ---------------------------------------------------------------------
+    def firstMatch(self, fd):
+        """Offset of the first match in the open file, or None. Scans an mmap, no copies."""
+        if os.fstat(fd).st_size == 0:
+            return None
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+            match = self.pattern.search(mapped)
+            return match.start() if match else None
+
+    def countFile(self, path):
+        """Number of matches in a file (nothing is written)."""
+        with open(path, "rb") as fs:
+            if os.fstat(fs.fileno()).st_size == 0:
+                return 0
+            with mmap.mmap(fs.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return sum(1 for _ in self.pattern.finditer(mapped))
+
+    # ---------------------------------------------------------------------
+    # Replacing
+    # ---------------------------------------------------------------------
+    def cutPoint(self, buffer, end):
+        """
+        Largest position <= end (looking back a few pattern lengths) that no
+        occurrence of any pattern spans, or None. Everything before such a
+        point can be replaced without seeing the bytes after it.
+        """
+        for cut in range(end, max(0, end - 4 * self.maxLen) - 1, -1):
+            for start in range(max(0, cut - self.maxLen + 1), cut):
+                match = self.pattern.match(buffer, start)
+                if match and match.end() > cut:
+                    break
+            else:
+                return cut
+        return None
+
+    def replaceStream(self, read, write, chunkSize=CHUNK_SIZE):
+        """
+        Copies read() chunks to write() with every match replaced. Each
+        buffer is replaced up to a cut point no match can span; the rest is
+        carried into the next chunk, so patterns crossing chunk boundaries
+        are found exactly as in a single pass. Returns the number of
+        replacements.
+        """
+        count = 0
+        carry = b""
+        while True:
+            chunk = read(chunkSize)
+            final = not chunk
+            buffer = carry + chunk
+            # Matches starting at or past `safe` might continue in the next chunk
+            safe = len(buffer) if final else len(buffer) - self.maxLen + 1
+            cut = safe if final else self.cutPoint(buffer, safe) if safe > 0 else 0
+            if cut is not None:
+                out, found = self.pattern.subn(self.template if self.template is not None else self.lookup, buffer[:cut])
+                write(out)
+                count += found
+                carry = buffer[cut:]
+            else:
+                # Matches chained across the whole look-back window: walk them one by one
+                position = 0
+                out = []
+                for match in self.pattern.finditer(buffer):
+                    if match.start() >= safe:
+                        break
+                    out.append(buffer[position:match.start()])
+                    out.append(self.mapping[match.group()])
+                    position = match.end()
+                    count += 1
+                keep = max(position, safe)
+                out.append(buffer[position:keep])
+                write(b"".join(out))
+                carry = buffer[keep:]
+            if final:
+                return count
+
+    def replaceInPlace(self, fd, chunkSize=CHUNK_SIZE):
+        """
+        Equal-length fast path: runs replaceStream over a shared mmap of the
+        file, writing each replaced window back at the offset it was read
+        from. Windows without a change are not written. Returns the count.
+        """
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_WRITE) as mapped:
+            offsets = [0, 0]
+
+            def read(size):
+                data = mapped[offsets[0]:offsets[0] + size]
+                offsets[0] += len(data)
+                return data
+
+            def write(data):
+                start = offsets[1]
+                offsets[1] += len(data)
+                if mapped[start:offsets[1]] != data:
+                    mapped[start:offsets[1]] = data
+
+            count = self.replaceStream(read, write, chunkSize)
+            mapped.flush()
+        return count
+
+    def replaceFile(self, path, chunkSize=CHUNK_SIZE, inPlace=True, sync=True):
+        """
+        Applies the replacements to a file in constant memory.
+        The file is first scanned through an mmap; files without a match
+        are left untouched. If every replacement has the same length as
+        its pattern (and inPlace is set) matches are overwritten in place.
+        Otherwise the text before the first match is copied in the kernel,
+        the rest is streamed through replaceStream into a temp file in the
+        same folder, fsynced and renamed over the original (os.replace),
+        so a crash leaves either the old or the new file. A symlink is
+        followed: its target is rewritten and the link kept.
+        Returns {"replacements", "method", "bytesIn", "bytesOut", "seconds"}.
+        """
+        start = time.perf_counter()
+        # Through a symlink the target is rewritten; os.replace on the link would turn it into a file
+        path = os.path.realpath(os.fspath(path))
+        fd = os.open(path, os.O_RDWR if inPlace and self.sameLength else os.O_RDONLY)
+        try:
+            st = os.fstat(fd)
+            first = self.firstMatch(fd)
+            if first is None:
+                return {"replacements": 0, "method": "none", "bytesIn": st.st_size, "bytesOut": 0,
+                        "seconds": time.perf_counter() - start}
+
+            if inPlace and self.sameLength:
+                count = self.replaceInPlace(fd, chunkSize)
+                if sync:
+                    os.fsync(fd)
+                return {"replacements": count, "method": "mmap", "bytesIn": st.st_size, "bytesOut": st.st_size,
+                        "seconds": time.perf_counter() - start}
+
+            folder, name = os.path.split(path)
+            temp = os.path.join(folder, f".{name}.{os.getpid()}{REPLACE_TEMP_SUFFIX}")
+            tempFd = os.open(temp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, st.st_mode & 0o7777)
+            try:
+                copyRange(fd, tempFd, 0, first)
+                os.lseek(fd, first, os.SEEK_SET)
+                os.lseek(tempFd, first, os.SEEK_SET)
+                with open(tempFd, "wb", closefd=False) as out:
+                    count = self.replaceStream(lambda size: os.read(fd, size), out.write, chunkSize)
+                size = os.lseek(tempFd, 0, os.SEEK_CUR)
+                try:
+                    os.fchown(tempFd, st.st_uid, st.st_gid)
+                except PermissionError:
+                    pass
+                if sync:
+                    os.fsync(tempFd)
+                os.close(tempFd)
+                tempFd = None
+                os.replace(temp, path)
+            except BaseException:
+                if tempFd is not None:
+                    os.close(tempFd)
+                os.unlink(temp)
+                raise
+        finally:
+            os.close(fd)
+
+        seconds = time.perf_counter() - start
+        logger.debug("Replaced %s match(es) in %s by streaming in %.3fs", count, path, seconds)
+        return {"replacements": count, "method": "stream", "bytesIn": st.st_size, "bytesOut": size,
+                "seconds": seconds}
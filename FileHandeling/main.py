@@ -1,3 +1,4 @@
 from FileHandeling import FileHandlingOperations as fh
 
+fh.initLogging()
 fh.FileHandling().run()
@@ -0,0 +1,195 @@
+"""
+Organizes many root folders at once, one root per process.
+
+    python -m FileOrganizer.BatchOrganizer "/srv/drop/*" --mapping FileOrganizer/fileExtensions.json --processes 8
+"""
+import os
+import sys
+import glob
+import json
+import time
+import logging
+import argparse
+
+from FileHandeling import LoggingSetup
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------
+# Worker side
+# -------------------------------------------------------------------------
+def initWorker(logDir):
+    # Spawned workers start with no logging; they append to the parent's log files
+    if logDir:
+        from FileOrganizer.Organizer import initLogging
+        initLogging(logDir, console=False, background=False)
+
+
+def organizeRoot(root, mappingFile, options):
+    """Organizes one root. Never raises; returns a per-root result dict."""
+    start = time.perf_counter()
+    try:
+        from FileOrganizer.Organizer import FileOrganizer
+
+        organizer = FileOrganizer(os.path.dirname(root))
+        result = organizer.organizeMyFolder(root, mappingFile, **options)
+        stats = result[2] if len(result) > 2 else {}
+        return {"root": root, "ok": result[0], "message": result[1], "stats": stats,
+                "seconds": time.perf_counter() - start}
+    except Exception as err:
+        return {"root": root, "ok": False, "message": str(err), "stats": {}, "seconds": time.perf_counter() - start}
+
+
+# -------------------------------------------------------------------------
+# Batch Organizer
+# -------------------------------------------------------------------------
+def expandRoots(roots):
+    """Expands glob patterns (folders only) and drops duplicates; keeps the given order."""
+    if isinstance(roots, str):
+        roots = [roots]
+    expanded = []
+    seen = set()
+    for pattern in roots:
+        pattern = os.path.expanduser(str(pattern))
+        if glob.has_magic(pattern):
+            matches = sorted(match for match in glob.glob(pattern) if os.path.isdir(match))
+        else:
+            matches = [pattern]
+        for root in matches:
+            root = os.path.abspath(root)
+            if root not in seen:
+                seen.add(root)
+                expanded.append(root)
+    return expanded
+
+
+def organizeRoots(roots, mappingFile, processes=None, maxConcurrency=None, **options):
+    """
+    Organizes every root (a list of folders and/or glob patterns) with
+    organizeMyFolder in a process pool of `processes` workers. A failing
+    or crashing root only fails its own entry. maxConcurrency caps the
+    move workers of all processes together (each root gets
+    maxConcurrency // processes threads). options are passed on to
+    organizeMyFolder (recursive, incremental, duplicates, ...).
+    Returns [ok, message, report] with per-root results and totals.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    try:
+        started = time.perf_counter()
+        mappingFile = os.path.abspath(mappingFile)
+        roots = expandRoots(roots)
+        processes = max(1, min(int(processes or os.cpu_count() or 1), len(roots) or 1))
+        if maxConcurrency:
+            processes = min(processes, int(maxConcurrency))
+            options["workers"] = max(1, int(maxConcurrency) // processes)
+        options.setdefault("workers", 1)
+
+        results = {}
+        pending = []
+        for root in roots:
+            if os.path.isdir(root):
+                pending.append(root)
+            else:
+                results[root] = {"root": root, "ok": False, "message": "Not a folder", "stats": {}, "seconds": 0.0}
+
+        logPath = LoggingSetup.initialized.get("FileOrganizer")
+        logDir = str(logPath.parent) if logPath else None
+        logger.info("Organizing %s root(s) on %s process(es), %s worker(s) each", len(pending), processes, options['workers'])
+
+        if pending:
+            # spawn: workers must not inherit the parent's logging/pool threads
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(processes, mp_context=context, initializer=initWorker, initargs=(logDir,)) as pool:
+                futures = {root: pool.submit(organizeRoot, root, mappingFile, options) for root in pending}
+                for root, future in futures.items():
+                    try:
+                        results[root] = future.result()
+                    except Exception as err:
+                        results[root] = {"root": root, "ok": False, "message": f"Worker failed: {err}",
+                                         "stats": {}, "seconds": 0.0}
+                    entry = results[root]
+                    if entry["ok"]:
+                        logger.info("Organized %s: %s file(s) moved", root, entry['stats'].get('moved', 0))
+                    else:
+                        logger.error("Organizing %s failed: %s", root, entry['message'])
+
+        report = aggregate([results[root] for root in roots], time.perf_counter() - started)
+        message = f"Organized {report['succeeded']} of {report['roots']} root(s), {report['moved']} file(s) moved"
+        return [report["failed"] == 0, message, report]
+
+    except Exception as err:
+        logger.error("Batch organize failed: %s", err)
+        return [False, str(err)]
+
+
+def aggregate(results, seconds):
+    totals = {"moved": 0, "failedMoves": 0, "movedBytes": 0, "copiedBytes": 0}
+    for entry in results:
+        stats = entry["stats"]
+        totals["moved"] += stats.get("moved", 0)
+        totals["failedMoves"] += stats.get("failed", 0)
+        totals["movedBytes"] += stats.get("movedBytes", 0)
+        totals["copiedBytes"] += stats.get("copiedBytes", 0)
+
+    succeeded = sum(1 for entry in results if entry["ok"])
+    return dict(
+        totals,
+        roots=len(results),
+        succeeded=succeeded,
+        failed=len(results) - succeeded,
+        seconds=seconds,
+        filesPerSec=totals["moved"] / seconds if seconds else 0.0,
+        bytesPerSec=totals["movedBytes"] / seconds if seconds else 0.0,
+        results=results,
+    )
+
+
+# -------------------------------------------------------------------------
+# CLI
+# -------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("roots", nargs="+", help="Folders or glob patterns (quote them)")
+    parser.add_argument("--mapping", default=os.path.join(os.path.dirname(__file__), "fileExtensions.json"))
+    parser.add_argument("--processes", type=int, default=None, help="Roots organized at once (default: CPUs)")
+    parser.add_argument("--max-concurrency", type=int, default=None, help="Move workers across all processes")
+    parser.add_argument("--recursive", action="store_true")
+    parser.add_argument("--incremental", action="store_true")
+    parser.add_argument("--duplicates", choices=["skip", "delete", "hardlink"], default=None)
+    parser.add_argument("--sniff", action="store_true", help="Classify unknown extensions by content")
+    parser.add_argument("--no-journal", action="store_true", help="Do not write undo journals")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    args = parser.parse_args(argv)
+
+    from FileOrganizer.Organizer import initLogging
+    initLogging(console=False)
+
+    result = organizeRoots(
+        args.roots, args.mapping, args.processes, args.max_concurrency,
+        recursive=args.recursive, incremental=args.incremental, duplicates=args.duplicates,
+        sniff=args.sniff, journal=not args.no_journal,
+    )
+    if len(result) < 3:
+        print(result[1])
+        return 1
+
+    report = result[2]
+    if args.json:
+        print(json.dumps(report, indent=2, default=str))
+    else:
+        for entry in report["results"]:
+            status = "ok" if entry["ok"] else "FAILED"
+            print(f"{status:6} {entry['root']}: {entry['message']}")
+        print(
+            f"{report['succeeded']}/{report['roots']} root(s) ok, {report['moved']} file(s), "
+            f"{report['movedBytes'] / 1e6:.1f} MB in {report['seconds']:.2f}s "
+            f"({report['filesPerSec']:.1f} files/s, {report['bytesPerSec'] / 1e6:.1f} MB/s)"
+        )
+    return 0 if result[0] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
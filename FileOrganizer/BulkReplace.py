@@ -0,0 +1,128 @@
+import os
+import time
+import fnmatch
+import logging
+
+from FileHandeling import LoggingSetup
+from FileHandeling.StreamReplace import Replacer
+from FileHandeling.SidecarFiles import isSidecarFile
+from FileOrganizer.TreeWalker import TreeWalker
+
+logger = logging.getLogger(__name__)
+hotLogger = LoggingSetup.hotPathLogger(__name__)
+
+
+# Files per task sent to a worker process
+BATCH_SIZE = 64
+# Below this many files the pool start-up costs more than it saves
+INLINE_LIMIT = 256
+
+
+# -------------------------------------------------------------------------
+# Worker side
+# -------------------------------------------------------------------------
+def replaceBatch(paths, replacer, dryRun):
+    """Returns [(path, replacements, error)] for a batch of files; never raises."""
+    results = []
+    for path in paths:
+        try:
+            if dryRun:
+                count = replacer.countFile(path)
+            else:
+                count = replacer.replaceFile(path)["replacements"]
+            if count:
+                hotLogger.info("%s %s match(es) in %s", "Found" if dryRun else "Replaced", count, path)
+            results.append((path, count, None))
+        except Exception as err:
+            results.append((path, 0, str(err)))
+    return results
+
+
+# -------------------------------------------------------------------------
+# Bulk Replace
+# -------------------------------------------------------------------------
+def collectFiles(root, recursive=False, include=None, exclude=(), maxDepth=None):
+    """
+    Regular files under root (subfolders too if recursive) whose name or
+    relative path matches an include glob (all files if None) and no
+    exclude glob. Symlinks and index, cache and journal files are skipped.
+    """
+    walker = TreeWalker(maxDepth=maxDepth if recursive else 0, exclude=exclude)
+    include = tuple(include or ())
+    paths = []
+    for _, _, entries in walker.walk(root):
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False) or isSidecarFile(entry.name):
+                continue
+            if include:
+                relative = os.path.relpath(entry.path, root).replace(os.sep, "/")
+                if not any(fnmatch.fnmatch(entry.name, pattern) or fnmatch.fnmatch(relative, pattern)
+                           for pattern in include):
+                    continue
+            paths.append(entry.path)
+    return paths
+
+
+def bulkReplace(root, replacements, recursive=False, include=None, exclude=(), maxDepth=None,
+                processes=None, dryRun=False):
+    """
+    Replaces every (old, new) pair of replacements in all matching files
+    of root in a single pass per file (see StreamReplace.Replacer); files
+    without a match are skipped after an mmap scan and never rewritten.
+    Files are spread over a process pool of `processes` workers in
+    batches. dryRun only counts matches. Returns [ok, message, report].
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    try:
+        started = time.perf_counter()
+        root = os.path.abspath(root)
+        replacer = Replacer(replacements)
+        paths = collectFiles(root, recursive, include, exclude, maxDepth)
+        batches = [paths[start:start + BATCH_SIZE] for start in range(0, len(paths), BATCH_SIZE)]
+        processes = max(1, min(int(processes or os.cpu_count() or 1), len(batches) or 1))
+
+        results = []
+        if processes == 1 or len(paths) < INLINE_LIMIT:
+            for batch in batches:
+                results.extend(replaceBatch(batch, replacer, dryRun))
+        else:
+            from FileOrganizer.BatchOrganizer import initWorker
+
+            logPath = LoggingSetup.initialized.get("FileOrganizer")
+            logDir = str(logPath.parent) if logPath else None
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(processes, mp_context=context, initializer=initWorker, initargs=(logDir,)) as pool:
+                for batchResults in pool.map(replaceBatch, batches, [replacer] * len(batches), [dryRun] * len(batches)):
+                    results.extend(batchResults)
+
+        report = summarize(root, results, dryRun, time.perf_counter() - started)
+        action = "Found" if dryRun else "Replaced"
+        message = f"{action} {report['replacements']} match(es) in {report['filesMatched']} of {report['files']} file(s)"
+        if report["errors"]:
+            message += f", {len(report['errors'])} file(s) failed"
+            logger.warning("Bulk replace in %s: %s", root, message)
+        else:
+            logger.info("Bulk replace in %s: %s", root, message)
+        return [not report["errors"], message, report]
+
+    except Exception as err:
+        logger.error("Bulk replace in %s failed: %s", root, err)
+        return [False, str(err)]
+
+
+def summarize(root, results, dryRun, seconds):
+    matched = [(os.path.relpath(path, root), count) for path, count, error in results if count]
+    errors = [(os.path.relpath(path, root), error) for path, _, error in results if error]
+    return {
+        "root": root,
+        "dryRun": dryRun,
+        "files": len(results),
+        "filesMatched": len(matched),
+        "replacements": sum(count for _, count in matched),
+        "matched": matched,
+        "errors": errors,
+        "seconds": seconds,
+        "filesPerSec": len(results) / seconds if seconds else 0.0,
+    }
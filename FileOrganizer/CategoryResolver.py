@@ -0,0 +1,128 @@
+import os
+import json
+import logging
+from pathlib import Path
+
+from FileHandeling.SidecarFiles import RESOLVER_CACHE_SUFFIX, atomicWrite
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------
+# Category Resolver
+# -------------------------------------------------------------------------
+class CategoryResolver:
+    """
+    Longest-match extension table. Handles compound extensions such as
+    ".tar.gz" or ".min.js" by probing at most `maxParts` suffixes of the
+    lower-cased name (one dict lookup each), longest match wins.
+    The validated table is cached next to the JSON file, keyed on the
+    JSON's mtime/size and SHA-256, so later processes skip re-validation.
+    """
+    CACHE_VERSION = 1
+
+    def __init__(self, table):
+        self.table = dict(table)
+        self.maxParts = max((ext.count(".") for ext in self.table), default=1)
+
+    def match(self, name):
+        """Returns (category, suffixStart) for the longest known suffix, or (None, None)."""
+        lowered = name.lower()
+        category = None
+        start = None
+        pos = len(lowered)
+        for _ in range(self.maxParts):
+            # Searching from index 1 keeps ".bashrc"-style names extensionless
+            pos = lowered.rfind(".", 1, pos)
+            if pos < 1:
+                break
+            found = self.table.get(lowered[pos:])
+            if found is not None:
+                category, start = found, pos
+        return category, start
+
+    def resolve(self, name):
+        return self.match(name)[0]
+
+    def splitName(self, name):
+        """Splits name into (stem, ext) using the longest known suffix when there is one."""
+        start = self.match(name)[1]
+        if start is None:
+            return os.path.splitext(name)
+        return name[:start], name[start:]
+
+    # ---------------------------------------------------------------------
+    # Cached loading
+    # ---------------------------------------------------------------------
+    @staticmethod
+    def cachePathFor(jsonPath):
+        jsonPath = Path(jsonPath)
+        return jsonPath.with_name(f".{jsonPath.name}{RESOLVER_CACHE_SUFFIX}")
+
+    @classmethod
+    def load(cls, jsonPath, validate):
+        """
+        Returns [True, resolver] for the mapping in jsonPath. validate is the
+        dict -> [ok, table] check (FileOrganizer.extensionToCategory); it only
+        runs when the JSON content changed since the cache was written.
+        """
+        import hashlib
+
+        try:
+            jsonPath = Path(jsonPath)
+            st = jsonPath.stat()
+            cachePath = cls.cachePathFor(jsonPath)
+            cached = cls.readCache(cachePath)
+
+            if cached and cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+                logger.debug("Extension mapping loaded from cache %s", cachePath)
+                return [True, cls(cached["table"])]
+
+            raw = jsonPath.read_bytes()
+            digest = hashlib.sha256(raw).hexdigest()
+
+            if cached and cached["sha256"] == digest:
+                # Touched but not changed: keep the table, refresh the key
+                table = cached["table"]
+            else:
+                result = validate(json.loads(raw))
+                if not result[0]:
+                    return result
+                table = result[1]
+
+            cls.writeCache(cachePath, {
+                "version": cls.CACHE_VERSION,
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "sha256": digest,
+                "table": table,
+            })
+            return [True, cls(table)]
+
+        except FileNotFoundError:
+            return [False, f"JSON file '{jsonPath.name}' not found"]
+
+        except json.JSONDecodeError as err:
+            return [False, f"Invalid JSON format: {err}"]
+
+        except Exception as err:
+            logger.error("Error loading extension mapping: %s", err)
+            return [False, str(err)]
+
+    @classmethod
+    def readCache(cls, cachePath):
+        try:
+            with open(cachePath, "r") as fs:
+                cached = json.load(fs)
+            if cached.get("version") == cls.CACHE_VERSION:
+                return cached
+        except (OSError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def writeCache(cachePath, data):
+        try:
+            atomicWrite(cachePath, json.dumps(data))
+        except OSError as err:
+            logger.warning("Could not write resolver cache %s: %s", cachePath, err)
@@ -0,0 +1,201 @@
+import os
+import json
+import stat
+import logging
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+from FileHandeling import LoggingSetup
+from FileHandeling.SidecarFiles import SNIFF_CACHE_SUFFIX, sidecarPath, isSidecarName, atomicWrite
+
+logger = logging.getLogger(__name__)
+hotLogger = LoggingSetup.hotPathLogger(__name__)
+
+
+DEFAULT_SIGNATURES = Path(__file__).parent / "fileSignatures.json"
+
+
+# -------------------------------------------------------------------------
+# Content Sniffer
+# -------------------------------------------------------------------------
+class ContentSniffer:
+    """
+    Classifies files without a known extension by their magic bytes.
+    Only the first headerBytes bytes of a file are read, and the signature
+    table comes from fileSignatures.json: each signature names an extension
+    (resolved through the run's mapping) or a category, plus the
+    (offset, hex bytes) parts that must all match. Categories are matched
+    case-insensitively against the mapping's; a category the mapping does
+    not have is ignored rather than creating a new folder.
+    Results are cached by (device, inode, size, mtime_ns), optionally in a
+    cache file, so a re-run never reopens a file it already looked at.
+    Cache misses of a batch are read on a thread pool.
+    """
+    CACHE_SUFFIX = SNIFF_CACHE_SUFFIX
+    CACHE_VERSION = 1
+
+    def __init__(self, signatureFile=None, workers=4, cachePath=None):
+        self.workers = max(1, int(workers))
+        self.cachePath = Path(cachePath) if cachePath else None
+        self.headerBytes = 0
+        self.signatures = []
+        self.cache = {}
+        self.touched = set()
+        self.sniffed = 0
+        self.cacheHits = 0
+        self.matched = 0
+        self.unknownCategories = set()
+
+        result = self.loadSignatures(signatureFile or DEFAULT_SIGNATURES)
+        if not result[0]:
+            raise ValueError(result[1])
+        if self.cachePath is not None:
+            self.loadCache()
+
+    @staticmethod
+    def isCacheFile(name):
+        return isSidecarName(name, ContentSniffer.CACHE_SUFFIX)
+
+    @staticmethod
+    def cachePathFor(folder, inside=False):
+        return sidecarPath(folder, ContentSniffer.CACHE_SUFFIX, inside)
+
+    # ---------------------------------------------------------------------
+    # Signature table
+    # ---------------------------------------------------------------------
+    def loadSignatures(self, signatureFile):
+        try:
+            with open(signatureFile, "r") as fs:
+                data = json.load(fs)
+
+            signatures = []
+            for item in data["signatures"]:
+                label = item.get("ext") or item.get("category")
+                if not isinstance(label, str) or not label:
+                    return [False, f"Signature {item} needs an 'ext' or a 'category'"]
+                if "ext" in item:
+                    label = label.lower()
+                parts = tuple((int(offset), bytes.fromhex(magic)) for offset, magic in item["parts"])
+                signatures.append((label, parts))
+
+            # Most specific signatures first, so RIFF/WEBP wins over a bare prefix
+            signatures.sort(key=lambda sig: -sum(len(magic) for _, magic in sig[1]))
+            self.signatures = signatures
+            needed = max((offset + len(magic) for _, parts in signatures for offset, magic in parts), default=0)
+            self.headerBytes = max(int(data.get("headerBytes", 0)), needed)
+            logger.info("Loaded %s content signature(s) from %s", len(signatures), signatureFile)
+            return [True, "Signatures loaded"]
+
+        except (OSError, KeyError, TypeError, ValueError) as err:
+            logger.error("Invalid signature file '%s': %s", signatureFile, err)
+            return [False, f"Invalid signature file '{signatureFile}': {err}"]
+
+    def matchHeader(self, header):
+        """Returns the label ('.ext' or category) of the first matching signature, or ''."""
+        for label, parts in self.signatures:
+            for offset, magic in parts:
+                if header[offset:offset + len(magic)] != magic:
+                    break
+            else:
+                return label
+        return ""
+
+    # ---------------------------------------------------------------------
+    # Classification
+    # ---------------------------------------------------------------------
+    def readHeader(self, path):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return os.read(fd, self.headerBytes)
+        finally:
+            os.close(fd)
+
+    def sniff(self, path):
+        try:
+            return self.matchHeader(self.readHeader(path))
+        except OSError as err:
+            hotLogger.debug("Could not read header of %s: %s", path, err)
+            return None
+
+    def classify(self, items, mapping):
+        """
+        Returns {path: category} for the items (Path or os.DirEntry) whose
+        header matches a signature. mapping is the run's MappingSnapshot,
+        used to turn '.ext' labels into categories.
+        """
+        labels = {}
+        misses = []
+        for item in items:
+            path = os.fspath(item)
+            try:
+                st = item.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            key = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+            self.touched.add(key)
+            label = self.cache.get(key)
+            if label is None:
+                misses.append((path, key))
+            else:
+                self.cacheHits += 1
+                labels[path] = label
+
+        if misses:
+            paths = [path for path, _ in misses]
+            if len(misses) > 1 and self.workers > 1:
+                with ThreadPoolExecutor(max_workers=min(self.workers, len(misses))) as pool:
+                    found = list(pool.map(self.sniff, paths))
+            else:
+                found = [self.sniff(path) for path in paths]
+            self.sniffed += len(misses)
+
+            for (path, key), label in zip(misses, found):
+                if label is None:
+                    continue
+                self.cache[key] = label
+                labels[path] = label
+
+        known = {category.casefold(): category for category in mapping.categories}
+        categories = {}
+        for path, label in labels.items():
+            if not label:
+                continue
+            if label.startswith("."):
+                category = mapping.resolver.table.get(label)
+            else:
+                category = known.get(label.casefold())
+                if category is None and label not in self.unknownCategories:
+                    self.unknownCategories.add(label)
+                    logger.warning("Signature category '%s' is not in the mapping, ignoring it", label)
+            if category:
+                self.matched += 1
+                categories[path] = category
+                hotLogger.info("Content of '%s' looks like '%s' -> '%s'", os.path.basename(path), label, category)
+        return categories
+
+    # ---------------------------------------------------------------------
+    # Cache file
+    # ---------------------------------------------------------------------
+    def loadCache(self):
+        try:
+            with open(self.cachePath, "r") as fs:  # type: ignore
+                data = json.load(fs)
+            if data.get("version") == ContentSniffer.CACHE_VERSION:
+                self.cache = {tuple(row[:4]): row[4] for row in data["entries"]}
+        except (OSError, ValueError, KeyError, TypeError, IndexError):
+            self.cache = {}
+
+    def save(self):
+        """Writes the entries seen in this session back to the cache file."""
+        if self.cachePath is None:
+            return
+        entries = [[*key, label] for key, label in self.cache.items() if key in self.touched]
+        try:
+            atomicWrite(self.cachePath, json.dumps({"version": ContentSniffer.CACHE_VERSION, "entries": entries}))
+        except OSError as err:
+            logger.warning("Could not write sniff cache %s: %s", self.cachePath, err)
+
+    def stats(self):
+        return {"sniffed": self.sniffed, "sniffCacheHits": self.cacheHits, "sniffMatched": self.matched}
@@ -0,0 +1,223 @@
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from FileHandeling import LoggingSetup
+
+logger = logging.getLogger(__name__)
+hotLogger = LoggingSetup.hotPathLogger(__name__)
+
+
+SAMPLE_SIZE = 8 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+
+# -------------------------------------------------------------------------
+# Hash helpers (hashlib releases the GIL, so they run well on threads)
+# -------------------------------------------------------------------------
+def quickHash(path, size):
+    """Hashes the first and last SAMPLE_SIZE bytes; small files are hashed whole."""
+    import hashlib
+
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(path, "rb") as fs:
+        if size <= 2 * SAMPLE_SIZE:
+            digest.update(fs.read())
+        else:
+            digest.update(fs.read(SAMPLE_SIZE))
+            fs.seek(-SAMPLE_SIZE, os.SEEK_END)
+            digest.update(fs.read(SAMPLE_SIZE))
+    return digest.hexdigest()
+
+
+def fullHash(path, size=None):
+    import hashlib
+
+    digest = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as fs:
+        for chunk in iter(lambda: fs.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# -------------------------------------------------------------------------
+# Deduplicator
+# -------------------------------------------------------------------------
+class Deduplicator:
+    """
+    Finds files of an organize batch whose content already exists in their
+    target category folder (or earlier in the run). Candidates are grouped
+    by size, then by a head+tail hash, and only files that still collide
+    get a full streaming hash. Duplicates are then skipped (left in place),
+    deleted, or moved into their category folder as a hard link to the
+    kept copy (named by namer, the run's DestinationNamer).
+    """
+    POLICIES = ("skip", "delete", "hardlink")
+
+    def __init__(self, policy="skip", workers=1, namer=None):
+        if policy not in Deduplicator.POLICIES:
+            raise ValueError(f"Invalid duplicate policy '{policy}'. Expected one of {Deduplicator.POLICIES}")
+        self.policy = policy
+        self.workers = max(1, int(workers))
+        self.namer = namer
+        self.sizes = {}
+        self.quickCache = {}
+        self.fullCache = {}
+        self.pending = []
+        self.batchSizes = {}
+        self.duplicates = 0
+        self.duplicateBytes = 0
+
+    # ---------------------------------------------------------------------
+    # Size index of category folders (built once per folder per run)
+    # ---------------------------------------------------------------------
+    def folderSizes(self, folder):
+        folder = str(folder)
+        if folder not in self.sizes:
+            sizes = {}
+            if os.path.isdir(folder):
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            sizes.setdefault(entry.stat().st_size, []).append(entry.path)
+            self.sizes[folder] = sizes
+        return self.sizes[folder]
+
+    # ---------------------------------------------------------------------
+    # Hashing with per-run caches
+    # ---------------------------------------------------------------------
+    def hashAll(self, paths, sizes, cache, hasher):
+        missing = [path for path in dict.fromkeys(paths) if path not in cache]
+        if len(missing) > 1 and self.workers > 1:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                digests = pool.map(self.safeHash, [hasher] * len(missing), missing, [sizes[p] for p in missing])
+                cache.update(zip(missing, digests))
+        else:
+            for path in missing:
+                cache[path] = self.safeHash(hasher, path, sizes[path])
+        return {path: cache[path] for path in paths}
+
+    @staticmethod
+    def safeHash(hasher, path, size):
+        try:
+            return hasher(path, size)
+        except OSError as err:
+            logger.warning("Cannot hash '%s': %s", path, err)
+            # Unreadable files never match anything
+            return f"unreadable:{path}"
+
+    @staticmethod
+    def regroup(groups, digests):
+        result = []
+        for group in groups:
+            byDigest = {}
+            for path in group:
+                byDigest.setdefault(digests[path], []).append(path)
+            result.extend(members for members in byDigest.values() if len(members) > 1)
+        return result
+
+    # ---------------------------------------------------------------------
+    # Filter / Apply
+    # ---------------------------------------------------------------------
+    def filter(self, targets):
+        """
+        Takes planned (item, categoryFolder) pairs and returns the ones to
+        move. Duplicates are remembered and handled by apply() after the
+        batch was moved.
+        """
+        sizes = {}
+        groups = {}
+        for item, folder in targets:
+            source = os.fspath(item)
+            try:
+                size = os.stat(source).st_size
+            except OSError:
+                continue
+            sizes[source] = size
+            key = (str(folder), size)
+            if key not in groups:
+                # Existing files of the category folder come first, they are kept
+                groups[key] = list(self.folderSizes(folder).get(size, []))
+                for path in groups[key]:
+                    sizes[path] = size
+            groups[key].append(source)
+
+        self.batchSizes = sizes
+        candidates = [group for group in groups.values() if len(group) > 1]
+        if not candidates:
+            return targets
+
+        paths = [path for group in candidates for path in group]
+        candidates = self.regroup(candidates, self.hashAll(paths, sizes, self.quickCache, quickHash))
+
+        # Small files were hashed whole by quickHash, only big ones need a full pass
+        needFull = [g for g in candidates if sizes[g[0]] > 2 * SAMPLE_SIZE]
+        identical = [g for g in candidates if sizes[g[0]] <= 2 * SAMPLE_SIZE]
+        if needFull:
+            paths = [path for group in needFull for path in group]
+            identical += self.regroup(needFull, self.hashAll(paths, sizes, self.fullCache, fullHash))
+
+        duplicateOf = {}
+        for group in identical:
+            for path in group[1:]:
+                duplicateOf[path] = group[0]
+
+        kept = []
+        for item, folder in targets:
+            source = os.fspath(item)
+            if source in duplicateOf:
+                hotLogger.info("Duplicate found: '%s' is identical to '%s'", source, duplicateOf[source])
+                self.pending.append((source, duplicateOf[source], sizes[source], str(folder)))
+            else:
+                kept.append((item, folder))
+        return kept
+
+    def apply(self, moves, failed=()):
+        """Handles the duplicates found by the last filter() once its batch has been moved."""
+        destinations = {str(src): str(dst) for src, dst in moves}
+        failed = set(failed)
+
+        # Moved files can be duplicates of later batches too
+        for src, dst in destinations.items():
+            if src in failed:
+                continue
+            size = self.batchSizes.get(src)
+            if size is not None:
+                self.folderSizes(os.path.dirname(dst)).setdefault(size, []).append(dst)
+                for cache in (self.quickCache, self.fullCache):
+                    if src in cache:
+                        cache[dst] = cache.pop(src)
+
+        pending, self.pending = self.pending, []
+        for source, original, size, folder in pending:
+            kept = original if original in failed else destinations.get(original, original)
+            try:
+                if self.policy == "delete":
+                    os.unlink(source)
+                elif self.policy == "hardlink":
+                    self.linkIntoFolder(source, kept, folder)
+            except OSError as err:
+                logger.warning("Could not %s duplicate '%s': %s", self.policy, source, err)
+                continue
+            self.duplicates += 1
+            self.duplicateBytes += size
+
+    def linkIntoFolder(self, source, kept, folder):
+        """Hard links kept into the category folder under source's name, then removes source."""
+        name = os.path.basename(source)
+        if self.namer is not None:
+            destination = self.namer.reserve(folder, name)
+        else:
+            os.makedirs(folder, exist_ok=True)
+            destination = os.path.join(folder, name)
+        # os.link never replaces an existing file
+        os.link(kept, destination)
+        os.unlink(source)
+        hotLogger.info("Linked duplicate '%s' → '%s'", source, destination)
+
+    def stats(self):
+        return {
+            "duplicatePolicy": self.policy,
+            "duplicates": self.duplicates,
+            "duplicateBytes": self.duplicateBytes,
+        }
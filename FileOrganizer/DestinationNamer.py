@@ -0,0 +1,89 @@
+import os
+import logging
+import threading
+from pathlib import Path
+
+from FileHandeling import LoggingSetup
+
+logger = logging.getLogger(__name__)
+hotLogger = LoggingSetup.hotPathLogger(__name__)
+
+
+# -------------------------------------------------------------------------
+# Destination Namer
+# -------------------------------------------------------------------------
+class DestinationNamer:
+    """
+    Hands out conflict-free destination names inside category folders.
+    Each folder is listed once (the first time it is used) into a name set,
+    and a per-(stem, ext) counter remembers the next "(n)" suffix to try,
+    so finding a free name costs O(1) instead of one stat per attempt.
+    reserve() is thread-safe; concurrent planners get distinct names.
+    With createFolders=False missing folders are treated as empty instead of
+    being created (used for dry-run planning).
+    """
+
+    def __init__(self, createFolders=True):
+        self.createFolders = createFolders
+        self.lock = threading.Lock()
+        self.folderLocks = {}
+        self.names = {}
+        self.counters = {}
+
+    def folderState(self, folder):
+        with self.lock:
+            folderLock = self.folderLocks.get(folder)
+            if folderLock is None:
+                folderLock = self.folderLocks[folder] = threading.Lock()
+        return folderLock
+
+    def loadFolder(self, folder):
+        # Caller holds the folder lock
+        if not self.createFolders and not os.path.isdir(folder):
+            self.names[folder] = set()
+            self.counters[folder] = {}
+            return
+        Path(folder).mkdir(exist_ok=True)
+        with os.scandir(folder) as entries:
+            self.names[folder] = {entry.name for entry in entries}
+        self.counters[folder] = {}
+        hotLogger.debug("Indexed %s existing names in %s", len(self.names[folder]), folder)
+
+    def reserve(self, folder, name, ext=None):
+        """
+        Returns a destination path in folder for name that nobody else has
+        taken. ext overrides the suffix kept after "(n)", e.g. ".tar.gz".
+        """
+        folder = str(folder)
+        with self.folderState(folder):
+            if folder not in self.names:
+                self.loadFolder(folder)
+            names = self.names[folder]
+
+            if name not in names:
+                names.add(name)
+                return Path(folder) / name
+
+            if ext and name.endswith(ext) and len(ext) < len(name):
+                stem = name[:-len(ext)]
+            else:
+                stem, ext = os.path.splitext(name)
+            counters = self.counters[folder]
+            conflict = counters.get((stem, ext), 1)
+            newName = f"{stem}({conflict}){ext}"
+            # Only names that already existed before the run can be skipped here
+            while newName in names:
+                conflict += 1
+                newName = f"{stem}({conflict}){ext}"
+
+            counters[(stem, ext)] = conflict + 1
+            names.add(newName)
+            hotLogger.info("Conflict detected → using new name: %s", newName)
+            return Path(folder) / newName
+
+    def release(self, folder, name):
+        """Forgets a reserved name again (e.g. when its move failed)."""
+        folder = str(folder)
+        with self.folderState(folder):
+            if folder in self.names:
+                self.names[folder].discard(name)
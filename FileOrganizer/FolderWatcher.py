@@ -0,0 +1,191 @@
+import os
+import sys
+import time
+import struct
+import select
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------
+# inotify through ctypes (Linux only)
+# -------------------------------------------------------------------------
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def loadInotify():
+    """Returns libc with inotify symbols, or None when inotify is unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (ImportError, OSError, AttributeError):
+        return None
+
+
+class InotifySource:
+    """Reports names of files closed-after-write or moved into one folder."""
+
+    def __init__(self, libc, folder):
+        import ctypes
+
+        self.fd = libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = libc.inotify_add_watch(self.fd, os.fsencode(folder), IN_CLOSE_WRITE | IN_MOVED_TO)
+        if wd < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {folder}")
+
+    def poll(self, timeout):
+        """Returns (names, overflow) for events that arrived within timeout seconds."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return [], False
+
+        buf = os.read(self.fd, 64 * 1024)
+        names = []
+        overflow = False
+        offset = 0
+        while offset < len(buf):
+            _, mask, _, length = EVENT_HEADER.unpack_from(buf, offset)
+            offset += EVENT_HEADER.size
+            name = buf[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+            elif name and not mask & IN_ISDIR:
+                names.append(os.fsdecode(name))
+        return names, overflow
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingSource:
+    """
+    Stdlib-only fallback: rescans the folder and reports files whose size
+    and mtime did not change between two scans (i.e. writing has settled).
+    """
+
+    def __init__(self, folder, interval=1.0):
+        self.folder = folder
+        self.interval = interval
+        self.previous = {}
+        self.reported = {}
+
+    def poll(self, timeout):
+        time.sleep(min(timeout, self.interval))
+        current = {}
+        names = []
+        with os.scandir(self.folder) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                key = (st.st_size, st.st_mtime_ns)
+                current[entry.name] = key
+                if self.previous.get(entry.name) == key and self.reported.get(entry.name) != key:
+                    names.append(entry.name)
+                    self.reported[entry.name] = key
+        self.previous = current
+        # Forget reports for files that are gone (e.g. moved by the organizer)
+        self.reported = {name: key for name, key in self.reported.items() if name in current}
+        return names, False
+
+    def close(self):
+        self.previous = {}
+        self.reported = {}
+
+
+# -------------------------------------------------------------------------
+# Folder Watcher
+# -------------------------------------------------------------------------
+class FolderWatcher:
+    """
+    Collects finished files of a folder into micro-batches and hands each
+    batch to `handler(names)`. A batch is flushed once it holds batchSize
+    names or its oldest name has waited `latency` seconds.
+    """
+
+    def __init__(self, folder, handler, batchSize=500, latency=1.0, forcePolling=False):
+        self.folder = str(folder)
+        self.handler = handler
+        self.batchSize = max(1, int(batchSize))
+        self.latency = latency
+        self.forcePolling = forcePolling
+        self.stopEvent = threading.Event()
+
+    def openSource(self):
+        libc = None if self.forcePolling else loadInotify()
+        if libc is not None:
+            try:
+                logger.info("Watching '%s' with inotify", self.folder)
+                return InotifySource(libc, self.folder)
+            except OSError as err:
+                logger.warning("inotify unavailable (%s), falling back to polling", err)
+        logger.info("Watching '%s' by polling every %ss", self.folder, self.latency)
+        return PollingSource(self.folder, self.latency)
+
+    def stop(self):
+        self.stopEvent.set()
+
+    def watch(self, onOverflow=None):
+        """Blocks until stop() is called (or KeyboardInterrupt). Returns the number of batches handled."""
+        source = self.openSource()
+        pending = {}
+        firstPending = 0.0
+        batches = 0
+
+        try:
+            while not self.stopEvent.is_set():
+                timeout = self.latency
+                if pending:
+                    timeout = max(0.0, firstPending + self.latency - time.monotonic())
+
+                names, overflow = source.poll(timeout)
+                if overflow:
+                    logger.warning("inotify queue overflowed, running a full pass")
+                    pending.clear()
+                    if onOverflow is not None:
+                        onOverflow()
+
+                for name in names:
+                    if not pending:
+                        firstPending = time.monotonic()
+                    pending[name] = None
+
+                # Flush full batches right away, a partial one once it is old enough
+                while len(pending) >= self.batchSize or (
+                    pending and time.monotonic() - firstPending >= self.latency
+                ):
+                    batch = list(pending)[:self.batchSize]
+                    for name in batch:
+                        del pending[name]
+                    firstPending = time.monotonic()
+                    self.handler(batch)
+                    batches += 1
+
+        except KeyboardInterrupt:
+            logger.info("Watch on '%s' interrupted by user", self.folder)
+
+        finally:
+            source.close()
+
+        return batches
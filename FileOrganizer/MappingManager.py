@@ -0,0 +1,128 @@
+import os
+import time
+import logging
+import threading
+from types import MappingProxyType
+from pathlib import Path
+
+from FileOrganizer.CategoryResolver import CategoryResolver
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------
+# Mapping Snapshot
+# -------------------------------------------------------------------------
+class MappingSnapshot:
+    """
+    One immutable, versioned view of the extension mapping. Runs take a
+    snapshot when they start and use it until they finish, so a reload in
+    the middle of a run never mixes two mappings.
+    """
+    __slots__ = ("version", "table", "resolver", "categories", "source")
+
+    def __init__(self, version, resolver, source=None):
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "resolver", resolver)
+        object.__setattr__(self, "table", MappingProxyType(resolver.table))
+        object.__setattr__(self, "categories", frozenset(resolver.table.values()))
+        object.__setattr__(self, "source", source)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("MappingSnapshot is immutable")
+
+    def resolve(self, name):
+        return self.resolver.resolve(name)
+
+
+# -------------------------------------------------------------------------
+# Mapping Manager
+# -------------------------------------------------------------------------
+class MappingManager:
+    """
+    Keeps the current MappingSnapshot of one JSON file. snapshot() is a
+    plain attribute read; at most every checkInterval seconds it also stats
+    the file and, if its mtime or size moved, loads and validates the new
+    mapping and swaps it in as the next version. A broken edit keeps the
+    previous snapshot in service. Managers are shared per file path.
+    """
+    CHECK_INTERVAL = 1.0
+
+    managers = {}
+    managersLock = threading.Lock()
+    tableSnapshot = None
+
+    def __init__(self, path, validate, checkInterval=CHECK_INTERVAL):
+        self.path = Path(path)
+        self.validate = validate
+        self.checkInterval = checkInterval
+        self.current = None
+        self.statKey = None
+        self.lastError = None
+        self.nextCheck = 0.0
+        self.lock = threading.Lock()
+
+    @classmethod
+    def forPath(cls, path, validate, checkInterval=CHECK_INTERVAL):
+        key = os.path.abspath(path)
+        with cls.managersLock:
+            manager = cls.managers.get(key)
+            if manager is None:
+                manager = cls.managers[key] = cls(key, validate, checkInterval)
+        return manager
+
+    @classmethod
+    def fromTable(cls, table):
+        """Snapshot (version 0) for a mapping dict that did not come from a file."""
+        snapshot = cls.tableSnapshot
+        if snapshot is None or snapshot.source is not table:
+            snapshot = MappingSnapshot(0, CategoryResolver(table), table)
+            cls.tableSnapshot = snapshot
+        return snapshot
+
+    # ---------------------------------------------------------------------
+    # Reads
+    # ---------------------------------------------------------------------
+    def snapshot(self):
+        """Returns the current snapshot (None if the file never loaded)."""
+        current = self.current
+        if current is not None and time.monotonic() < self.nextCheck:
+            return current
+        self.refresh()
+        return self.current
+
+    # ---------------------------------------------------------------------
+    # Reload
+    # ---------------------------------------------------------------------
+    def refresh(self, force=False):
+        """Reloads the mapping if the file changed. Returns [ok, message]."""
+        with self.lock:
+            self.nextCheck = time.monotonic() + self.checkInterval
+            try:
+                st = self.path.stat()
+            except OSError as err:
+                return self.failed(f"JSON file '{self.path.name}' not found ({err.strerror})")
+
+            statKey = (st.st_mtime_ns, st.st_size)
+            if not force and self.current is not None and statKey == self.statKey:
+                return [True, f"Extension mapping unchanged (version {self.current.version})"]
+
+            result = CategoryResolver.load(self.path, self.validate)
+            if not result[0]:
+                return self.failed(result[1])
+
+            version = self.current.version + 1 if self.current is not None else 1
+            # Publishing is a single reference swap; readers never need the lock
+            self.current = MappingSnapshot(version, result[1], str(self.path))
+            self.statKey = statKey
+            self.lastError = None
+            logger.info("Extension mapping version %s loaded from %s", version, self.path)
+            return [True, f"Extension mapping loaded (version {version})"]
+
+    def failed(self, message):
+        self.lastError = message
+        if self.current is not None:
+            logger.warning("%s; keeping mapping version %s", message, self.current.version)
+        else:
+            logger.error(message)
+        return [False, message]
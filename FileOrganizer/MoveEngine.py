@@ -0,0 +1,141 @@
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from FileHandeling.FastMove import fastMove
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------
+# Worker side (module level functions, so process pools can pickle them)
+# -------------------------------------------------------------------------
+def workerName():
+    thread = threading.current_thread()
+    if thread is threading.main_thread():
+        return f"pid-{os.getpid()}"
+    return f"pid-{os.getpid()}/{thread.name}"
+
+
+def moveOne(source, destination):
+    """Move one file. Returns [ok, worker, seconds, source, error, copiedBytes, movedBytes]."""
+    start = time.perf_counter()
+    try:
+        # Never clobber a file that appeared after the destination was planned
+        if os.path.lexists(destination):
+            raise FileExistsError(f"Destination already exists: {destination}")
+        size = os.lstat(source).st_size
+        # Rename, or a kernel-side copy when the category folder is on another mount
+        result = fastMove(source, destination)
+        return [True, workerName(), time.perf_counter() - start, source, "", result["bytes"], size]
+    except Exception as err:
+        return [False, workerName(), time.perf_counter() - start, source, str(err), 0, 0]
+
+
+# -------------------------------------------------------------------------
+# Move Engine
+# -------------------------------------------------------------------------
+class MoveEngine:
+    """
+    Runs planned (source, destination) moves on a thread or process pool.
+    Use it as a context manager so one pool serves every batch of a run;
+    stats() aggregates throughput over all executed batches: files, bytes
+    moved and bytes copied for moves that crossed file systems.
+    progress(done, total, copiedBytes) is called in the calling thread as
+    the moves of a batch complete.
+    """
+    MODES = ("thread", "process")
+
+    def __init__(self, workers=1, mode="thread", progress=None):
+        if mode not in MoveEngine.MODES:
+            raise ValueError(f"Invalid mode '{mode}'. Expected one of {MoveEngine.MODES}")
+        self.workers = max(1, int(workers))
+        self.mode = mode
+        self.pool = None
+        self.perWorker = {}
+        self.failed = 0
+        # source -> worker of each failed move, see discountFailures()
+        self.failedBy = {}
+        self.copiedBytes = 0
+        self.movedBytes = 0
+        self.progress = progress
+        self.started = time.perf_counter()
+
+    def __enter__(self):
+        if self.workers > 1 and self.mode == "thread":
+            self.pool = ThreadPoolExecutor(max_workers=self.workers)
+        elif self.workers > 1:
+            # Imported on demand, it pulls in multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+        return False
+
+    def execute(self, moves):
+        """Moves one batch. Returns [ok, failures] where failures is a list of (source, error)."""
+        sources = [str(src) for src, _ in moves]
+        destinations = [str(dst) for _, dst in moves]
+
+        if self.pool is None or len(moves) < 2:
+            results = map(moveOne, sources, destinations)
+        else:
+            # Larger chunks keep pickling overhead low when using processes
+            chunk = max(1, len(moves) // (self.workers * 4))
+            results = self.pool.map(moveOne, sources, destinations, chunksize=chunk)
+
+        failures = []
+        for done, (ok, worker, seconds, source, error, copied, size) in enumerate(results, start=1):
+            stat = self.perWorker.setdefault(worker, {"files": 0, "failed": 0, "seconds": 0.0, "bytes": 0})
+            stat["bytes"] += copied
+            self.copiedBytes += copied
+            self.movedBytes += size
+            if ok:
+                stat["files"] += 1
+            else:
+                stat["failed"] += 1
+                self.failedBy[source] = worker
+                failures.append((source, error))
+                logger.error("Move failed for '%s': %s", source, error)
+            stat["seconds"] += seconds
+            if self.progress is not None:
+                self.progress(done, len(moves), self.copiedBytes)
+
+        self.failed += len(failures)
+        return [not failures, failures]
+
+    def discountFailures(self, sources):
+        """Stops counting the failed moves of sources, e.g. because they are retried (the retry counts on its own)."""
+        for source in sources:
+            worker = self.failedBy.pop(str(source), None)
+            if worker is not None:
+                self.perWorker[worker]["failed"] -= 1
+                self.failed -= 1
+
+    def stats(self):
+        perWorker = {}
+        for worker, stat in self.perWorker.items():
+            rate = stat["files"] / stat["seconds"] if stat["seconds"] else 0.0
+            perWorker[worker] = dict(stat, filesPerSec=rate)
+
+        elapsed = time.perf_counter() - self.started
+        moved = sum(stat["files"] for stat in perWorker.values())
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "moved": moved,
+            "failed": self.failed,
+            "seconds": elapsed,
+            "filesPerSec": moved / elapsed if elapsed else 0.0,
+            "movedBytes": self.movedBytes,
+            "copiedBytes": self.copiedBytes,
+            "bytesPerSec": self.copiedBytes / elapsed if elapsed else 0.0,
+            "perWorker": perWorker,
+        }
@@ -0,0 +1,122 @@
+import os
+import json
+import logging
+
+from FileHandeling.SidecarFiles import atomicWrite, relativePath
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------
+# Move Plan
+# -------------------------------------------------------------------------
+class MovePlan:
+    """
+    Serializable result of planning an organize run. Each move is a
+    (source, destination, category, size, device, inode) tuple with paths
+    relative to the plan's root, so plans stay compact and can be saved,
+    reviewed, split and applied later (see FileOrganizer.applyPlan).
+    Building a plan never touches the tree.
+    """
+    VERSION = 1
+
+    def __init__(self, root, moves=None):
+        self.root = os.path.abspath(root)
+        self.moves = list(moves or [])
+
+    def __len__(self):
+        return len(self.moves)
+
+    def __iter__(self):
+        return iter(self.moves)
+
+    def absolute(self, rel):
+        return os.path.join(self.root, *rel.split("/"))
+
+    def add(self, source, destination, category, size=0, device=0, inode=0):
+        self.moves.append((relativePath(source, self.root), relativePath(destination, self.root), category, size, device, inode))
+
+    # ---------------------------------------------------------------------
+    # Views
+    # ---------------------------------------------------------------------
+    def summary(self):
+        """Dry-run preview: number of files and bytes per category."""
+        categories = {}
+        for _, _, category, size, _, _ in self.moves:
+            stat = categories.setdefault(category, {"files": 0, "bytes": 0})
+            stat["files"] += 1
+            stat["bytes"] += size
+        return {
+            "root": self.root,
+            "files": len(self.moves),
+            "bytes": sum(stat["bytes"] for stat in categories.values()),
+            "categories": categories,
+        }
+
+    def orderedEntries(self, localitySort=True):
+        """The plan's move tuples, sorted by (device, inode) for disk locality if asked."""
+        return sorted(self.moves, key=lambda move: (move[4], move[5])) if localitySort else list(self.moves)
+
+    def orderedMoves(self, localitySort=True):
+        """Absolute (source, destination) pairs, in orderedEntries() order."""
+        return [(self.absolute(source), self.absolute(destination))
+                for source, destination, *_ in self.orderedEntries(localitySort)]
+
+    def checkSources(self, entries):
+        """
+        Splits move tuples by what is on disk now: [absolute (source,
+        destination) pairs still ready to run, (source, error) pairs whose
+        source is gone or is no longer the planned file (size, device or
+        inode changed)].
+        """
+        ready, changed = [], []
+        for source, destination, _, size, device, inode in entries:
+            source = self.absolute(source)
+            try:
+                st = os.lstat(source)
+            except OSError as err:
+                changed.append((source, f"Source is gone: {err.strerror}"))
+                continue
+            # Plans built by hand may leave device/inode at 0
+            if st.st_size != size or (inode and (st.st_dev, st.st_ino) != (device, inode)):
+                changed.append((source, "Source changed since planning"))
+                continue
+            ready.append((source, self.absolute(destination)))
+        return [ready, changed]
+
+    def split(self, parts):
+        """Splits the plan into at most `parts` plans of similar size."""
+        parts = max(1, min(int(parts), len(self.moves) or 1))
+        return [MovePlan(self.root, self.moves[i::parts]) for i in range(parts)]
+
+    # ---------------------------------------------------------------------
+    # Serialization
+    # ---------------------------------------------------------------------
+    def toDict(self):
+        return {"version": MovePlan.VERSION, "root": self.root, "moves": [list(move) for move in self.moves]}
+
+    @classmethod
+    def fromDict(cls, data):
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported move plan version: {data.get('version')}")
+        return cls(data["root"], [tuple(move) for move in data["moves"]])
+
+    def save(self, path):
+        """Writes the plan as JSON. Returns [ok, message]."""
+        try:
+            atomicWrite(path, json.dumps(self.toDict(), separators=(",", ":")))
+            logger.info("Saved move plan with %s move(s) to %s", len(self.moves), path)
+            return [True, f"Plan saved to '{path}'"]
+        except Exception as err:
+            logger.error("Could not save move plan to '%s': %s", path, err)
+            return [False, str(err)]
+
+    @classmethod
+    def load(cls, path):
+        """Returns [True, plan] or [False, message]."""
+        try:
+            with open(path, "r") as fs:
+                return [True, cls.fromDict(json.load(fs))]
+        except Exception as err:
+            logger.error("Could not load move plan '%s': %s", path, err)
+            return [False, str(err)]
@@ -0,0 +1,176 @@
+import os
+import json
+import logging
+from pathlib import Path
+
+from FileHandeling.SidecarFiles import ORGANIZE_INDEX_SUFFIX, sidecarPath, isSidecarName, relativePath, isRacy, connectSqlite
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------
+# Organize Index
+# -------------------------------------------------------------------------
+class OrganizeIndex:
+    """
+    SQLite index kept next to an organized folder (".<folder>.organizeIndex.sqlite").
+    It remembers every file a run has looked at (path, size, mtime, inode and
+    the category it was assigned) plus each folder's mtime, so a re-run only
+    processes folders whose mtime moved and, inside them, files whose stat
+    changed. Paths are stored relative to the organized folder.
+    Only creating, deleting or renaming an entry changes a folder's mtime:
+    a file rewritten in place (e.g. an extensionless file that now has
+    different content for the sniffer) is not looked at again until
+    something else touches its folder.
+    """
+    SUFFIX = ORGANIZE_INDEX_SUFFIX
+    # Stay below SQLite's host parameter limit for IN (...) lookups
+    LOOKUP_CHUNK = 500
+
+    def __init__(self, root, mappingKey="", inside=False):
+        self.root = Path(root)
+        self.path = sidecarPath(self.root, OrganizeIndex.SUFFIX, inside)
+        self.mappingKey = mappingKey
+        self.conn = None
+
+    @staticmethod
+    def isIndexFile(name):
+        return isSidecarName(name, OrganizeIndex.SUFFIX)
+
+    @staticmethod
+    def mappingKeyFor(mapping):
+        import hashlib
+
+        data = json.dumps(mapping, sort_keys=True).encode()
+        return hashlib.sha1(data).hexdigest()
+
+    # ---------------------------------------------------------------------
+    # Open / Close
+    # ---------------------------------------------------------------------
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def open(self):
+        self.conn = connectSqlite(self.path)
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY, dir TEXT, size INTEGER,
+                mtime_ns INTEGER, inode INTEGER, category TEXT
+            );
+            CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, mtime_ns INTEGER);
+            """
+        )
+
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'mapping'").fetchone()
+        if row is None or row[0] != self.mappingKey:
+            # A different extension mapping can change any earlier decision
+            if row is not None:
+                logger.info("Extension mapping changed, resetting index %s", self.path)
+            self.conn.execute("DELETE FROM files")
+            self.conn.execute("DELETE FROM dirs")
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('mapping', ?)", (self.mappingKey,)
+            )
+        self.conn.commit()
+        logger.info("Organize index opened: %s", self.path)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    # ---------------------------------------------------------------------
+    # Lookups
+    # ---------------------------------------------------------------------
+    def relative(self, path):
+        return relativePath(path, self.root)
+
+    def isDirUnchanged(self, path):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return False
+        row = self.conn.execute(  # type: ignore
+            "SELECT mtime_ns FROM dirs WHERE path = ?", (self.relative(path),)
+        ).fetchone()
+        return row is not None and row[0] == mtime
+
+    def changedEntries(self, entries):
+        """Returns the entries that are new or whose size/mtime/inode differ from the index."""
+        files = [entry for entry in entries if not entry.is_dir()]
+        changed = [entry for entry in entries if entry.is_dir()]
+
+        for start in range(0, len(files), OrganizeIndex.LOOKUP_CHUNK):
+            chunk = files[start:start + OrganizeIndex.LOOKUP_CHUNK]
+            keys = [self.relative(entry.path) for entry in chunk]
+            marks = ",".join("?" * len(keys))
+            known = {
+                row[0]: row[1:]
+                for row in self.conn.execute(  # type: ignore
+                    f"SELECT path, size, mtime_ns, inode FROM files WHERE path IN ({marks})", keys
+                )
+            }
+            for key, entry in zip(keys, chunk):
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                if known.get(key) != (st.st_size, st.st_mtime_ns, st.st_ino):
+                    changed.append(entry)
+
+        return changed
+
+    # ---------------------------------------------------------------------
+    # Updates
+    # ---------------------------------------------------------------------
+    def recordBatch(self, entries, moves, categories, failed=()):
+        """
+        Records a processed batch: moved files under their destination,
+        files left in place under their own path. Failed moves are not
+        recorded so the next run retries them.
+        """
+        destinations = {str(src): dst for src, dst in moves}
+        failed = set(failed)
+        rows = []
+
+        for entry in entries:
+            if entry.is_dir() or entry.path in failed:
+                continue
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            path = destinations.get(entry.path, entry.path)
+            rel = self.relative(path)
+            rows.append((
+                rel, os.path.dirname(rel), st.st_size, st.st_mtime_ns, st.st_ino,
+                categories.get(entry.path, "others"),
+            ))
+
+        self.conn.executemany(  # type: ignore
+            "INSERT OR REPLACE INTO files (path, dir, size, mtime_ns, inode, category) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self.conn.commit()  # type: ignore
+
+    def recordDir(self, path):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+        # A racy folder mtime is not trusted for the next run
+        if isRacy(mtime):
+            mtime = None
+        self.conn.execute(  # type: ignore
+            "INSERT OR REPLACE INTO dirs (path, mtime_ns) VALUES (?, ?)", (self.relative(path), mtime)
+        )
+        self.conn.commit()  # type: ignore
@@ -0,0 +1,47 @@
+# -------------------------------------------------------------------------
+# Organize Options
+# -------------------------------------------------------------------------
+class OrganizeOptions:
+    """
+    Settings of one organizeMyFolder() run. Every field has a default, so
+    OrganizeOptions(workers=4, recursive=True) only names what differs;
+    replace() returns a copy with some fields changed.
+    """
+
+    def __init__(self, workers=1, mode="thread", batchSize=1000, recursive=False, maxDepth=None, exclude=(),
+                 incremental=False, namer=None, duplicates=None, sniff=False, progress=None, journal=True):
+        # Moves run on `workers` threads or processes (mode = "thread" | "process")
+        self.workers = workers
+        self.mode = mode
+        # The folder is streamed with scandir in batches of batchSize entries
+        self.batchSize = batchSize
+        # Nested folders too, scanned in parallel down to maxDepth levels;
+        # names/relative paths matching an exclude glob are skipped
+        self.recursive = recursive
+        self.maxDepth = maxDepth
+        self.exclude = exclude
+        # Skip folders and files unchanged since the last run (OrganizeIndex next to the folder).
+        # Folders are compared by mtime, so files rewritten in place are not re-checked
+        self.incremental = incremental
+        # A DestinationNamer shared with other runs on the same folder
+        self.namer = namer
+        # "skip" | "delete" | "hardlink" duplicates found in the category folders (None = off)
+        self.duplicates = duplicates
+        # True classifies files without a known extension by their first bytes;
+        # a ContentSniffer can be passed to share its cache
+        self.sniff = sniff
+        # progress(done, total, copiedBytes) as each batch's moves complete
+        self.progress = progress
+        # True journals the moves for undoOrganize(); an open UndoJournal is shared, False turns it off
+        self.journal = journal
+
+    def replace(self, **changes):
+        options = dict(vars(self))
+        unknown = set(changes) - set(options)
+        if unknown:
+            raise TypeError(f"Unknown organize option(s): {', '.join(sorted(unknown))}")
+        options.update(changes)
+        return OrganizeOptions(**options)
+
+    def __repr__(self):
+        return f"OrganizeOptions({', '.join(f'{name}={value!r}' for name, value in vars(self).items())})"
@@ -1,51 +1,54 @@
 from pathlib import Path
-import shutil
+import os
+import contextlib
 import logging
 from FileHandeling import FileHandlingOperations as m
+from FileHandeling import LoggingSetup
+from FileHandeling.SidecarFiles import isSidecarFile
+from FileOrganizer.MoveEngine import MoveEngine
+from FileOrganizer.TreeWalker import TreeWalker
+from FileOrganizer.OrganizeIndex import OrganizeIndex
+from FileOrganizer.FolderWatcher import FolderWatcher
+from FileOrganizer.DestinationNamer import DestinationNamer
+from FileOrganizer.Deduplicator import Deduplicator
+from FileOrganizer.ContentSniffer import ContentSniffer
+from FileOrganizer.MovePlan import MovePlan
+from FileOrganizer.OrganizeOptions import OrganizeOptions
+from FileOrganizer.UndoJournal import UndoJournal
+from FileOrganizer.MappingManager import MappingManager
+from FileOrganizer.TreeDeleter import TreeDeleter, isEmptyDir
+from FileOrganizer.BulkReplace import bulkReplace
 import json
 
+logger = logging.getLogger(__name__)
+hotLogger = LoggingSetup.hotPathLogger(__name__)
+
 # -------------------------------------------------------------------------
-# Ensure logs folder exists (Fix for missing log directory)
+# Logging setup (explicit, nothing happens on import)
 # -------------------------------------------------------------------------
-# Get the absolute path to the project root (PYTHONPROJECTS folder)
-PROJECT_ROOT = Path(__file__).resolve().parent.parent
-LOG_DIR = PROJECT_ROOT / "logs"
-LOG_DIR.mkdir(exist_ok=True)
-
-LOG_PATH = LOG_DIR / "fileOrganizer.log"
-
-# Clear any existing handlers to avoid conflicts
-for handler in logging.root.handlers[:]:
-    logging.root.removeHandler(handler)
-
-# Configure logging
-logging.basicConfig(
-    filename=str(LOG_PATH),  # Convert Path to string
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    force=True  # Force reconfiguration
-)
-
-# Add console handler to see logs in terminal too (optional)
-console = logging.StreamHandler()
-console.setLevel(logging.INFO)
-console.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-logging.getLogger('').addHandler(console)
-
-logging.info("="*50)
-logging.info("FileOrganizer logger initialized successfully")
-logging.info(f"Log file location: {LOG_PATH}")
-logging.info("="*50)
+def initLogging(logDir=None, **options):
+    """
+    Sends FileOrganizer logs to <logDir>/fileOrganizer.log (and FileHandeling
+    logs to fileHandeling.log) plus the console. Idempotent; importing the
+    module has no side effects.
+    """
+    m.initLogging(logDir, **options)
+    return LoggingSetup.initPackageLogging("FileOrganizer", "fileOrganizer.log", logDir, **options)
 
 
 class FileOrganizer:
+    # Read-only view of the most recently loaded mapping (kept for callers
+    # that read it directly); runs use their own MappingSnapshot instead
     extensionToCategoryData = {}
+    # Entries of the base directory shown above the menu
+    MENU_PREVIEW = 20
     def __init__(self, base_path):
         """Initialize object with base path + FileHandling instance."""
         self.base_path = base_path
         self.fileHandelingObj = m.FileHandling(self.base_path)
+        self.mappingManager = None
         
-        logging.info(f"FileOrganizer initialized at path: {self.base_path}")
+        logger.info("FileOrganizer initialized at path: %s", self.base_path)
 
 
     # -------------------------------------------------------------------------
@@ -56,21 +59,21 @@ class FileOrganizer:
         name = name.strip()
 
         if not name:
-            logging.warning("Attempted to create folder with empty name")
+            logger.warning("Attempted to create folder with empty name")
             return [False, "Folder name cannot be empty"]
 
         invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|']
         for ch in invalid_chars:
             if ch in name:
-                logging.warning(f"Invalid character '{ch}' in folder name: {name}")
+                logger.warning("Invalid character '%s' in folder name: %s", ch, name)
                 return [False, f"Folder name {name} contains invalid character: {ch}"]
 
         if name in [".", ".."]:
-            logging.warning("User entered reserved folder name")
+            logger.warning("User entered reserved folder name")
             return [False, "Invalid folder name"]
 
         if len(name) > 255:
-            logging.warning(f"Folder name too long: {name}")
+            logger.warning("Folder name too long: %s", name)
             return [False, f"Folder name '{name}' is too long"]
 
         return [True, "Valid folder name", name]
@@ -92,15 +95,15 @@ class FileOrganizer:
             elif inputType == str:
                 return [True, user_input.strip()]
             
-            logging.warning(f"Unsupported input type: {inputType}")
+            logger.warning("Unsupported input type: %s", inputType)
             return [False, "Unsupported input type"]
 
         except ValueError:
-            logging.error(f"Invalid input type. Expected {inputType.__name__}")
+            logger.error("Invalid input type. Expected %s", inputType.__name__)
             return [False, f"Invalid {inputType.__name__} value"]
 
         except Exception as err:
-            logging.error(f"Error in input: {err}")
+            logger.error("Error in input: %s", err)
             return [False, str(err)]
 
     # -------------------------------------------------------------------------
@@ -130,7 +133,7 @@ class FileOrganizer:
     def extensionToCategory(myDict):
         try:
             if not isinstance(myDict, dict):
-                logging.error(f"Invalid input type: expected dict, got {type(myDict).__name__}")
+                logger.error("Invalid input type: expected dict, got %s", type(myDict).__name__)
                 return [False, f"Invalid input: expected dictionary, got {type(myDict).__name__}"]
 
             result = {}
@@ -141,13 +144,13 @@ class FileOrganizer:
                 # Validate category
                 if not isinstance(category, str):
                     msg = f"Invalid category '{category}' (type {type(category).__name__}). Expected string."
-                    logging.error(msg)
+                    logger.error(msg)
                     return [False, msg]
 
                 # Validate extension list type
                 if not isinstance(extList, list):
                     msg = f"Extensions for category '{category}' must be a list. Found {type(extList).__name__}."
-                    logging.error(msg)
+                    logger.error(msg)
                     return [False, msg]
 
                 # Process extensions
@@ -156,31 +159,31 @@ class FileOrganizer:
                     # Validate extension type
                     if not isinstance(extension, str):
                         msg = f"Extension '{extension}' in category '{category}' must be a string."
-                        logging.error(msg)
+                        logger.error(msg)
                         return [False, msg]
 
                     # Validate extension format
                     if not extension.startswith("."):
                         msg = f"Extension '{extension}' in category '{category}' must start with '.'."
-                        logging.error(msg)
+                        logger.error(msg)
                         return [False, msg]
 
                     ext_lower = extension.lower()
 
                     # Duplicate extension check
                     if ext_lower in result:
-                        logging.warning(
-                            f"Duplicate extension '{extension}'. Already mapped to '{result[ext_lower]}'. "
-                            f"Ignoring duplicate under '{category}'."
+                        logger.warning(
+                            "Duplicate extension '%s'. Already mapped to '%s'. Ignoring duplicate under '%s'.",
+                            extension, result[ext_lower], category,
                         )
                     else:
                         result[ext_lower] = category.lower()
 
-            logging.info("Extension-to-category mapping created successfully.")
+            logger.info("Extension-to-category mapping created successfully.")
             return [True, result]
 
         except Exception as err:
-            logging.error(f"Unexpected error in extensionToCategory: {err}")
+            logger.error("Unexpected error in extensionToCategory: %s", err)
             return [False, str(err)]
 
     # -------------------------------------------------------------------------
@@ -190,22 +193,24 @@ class FileOrganizer:
         try:
             validName = FileOrganizer.validateFolderName(name)
             if not validName[0]:
-                logging.warning(f"Create folder failed: {validName[1]}")
+                logger.warning("Create folder failed: %s", validName[1])
                 return validName
 
             folder_name = validName[2]
+            self.fileHandelingObj.ensureBaseDir()
             p = self.fileHandelingObj.getPath(folder_name)
 
             if p.exists():
-                logging.warning(f"Folder already exists: {name}")
+                logger.warning("Folder already exists: %s", name)
                 return [False, f"Folder '{name}' already exists"]
 
             p.mkdir()
-            logging.info(f"Folder created: {name}")
+            self.fileHandelingObj.invalidateListing(p)
+            logger.info("Folder created: %s", name)
             return [True, f"Folder '{name}' created successfully"]
 
         except Exception as err:
-            logging.error(f"Create folder error: {err}")
+            logger.error("Create folder error: %s", err)
             return [False, str(err)]
 
     # -------------------------------------------------------------------------
@@ -215,20 +220,45 @@ class FileOrganizer:
         try:
             validName = FileOrganizer.validateFolderName(name)
             if not validName[0]:
-                logging.warning(f"Read folder failed: {validName[1]}")
+                logger.warning("Read folder failed: %s", validName[1])
                 return validName
 
             p = self.fileHandelingObj.getPath(validName[2])
 
             if not p.exists():
-                logging.warning(f"Folder does not exist: {name}")
+                logger.warning("Folder does not exist: %s", name)
                 return [False, f"Folder '{name}' does not exist"]
 
-            logging.info(f"Reading folder: {name}")
+            logger.info("Reading folder: %s", name)
             return self.fileHandelingObj.getAllFilesAndFolder(p) # type: ignore
 
         except Exception as err:
-            logging.error(f"Read folder error: {err}")
+            logger.error("Read folder error: %s", err)
+            return [False, str(err)]
+
+    def readFolderPage(self, name: str, pageSize: int = 100, cursor: int = 0) -> list:
+        """
+        Returns one page of a folder: [True, entries, nextCursor] with
+        os.DirEntry objects. Pass nextCursor back in to read the following
+        page (None = done); see FileHandling.getDirectoryPage for its limits.
+        """
+        try:
+            validName = FileOrganizer.validateFolderName(name)
+            if not validName[0]:
+                logger.warning("Read folder failed: %s", validName[1])
+                return validName
+
+            p = self.fileHandelingObj.getPath(validName[2])
+
+            if not p.exists():
+                logger.warning("Folder does not exist: %s", name)
+                return [False, f"Folder '{name}' does not exist"]
+
+            logger.info("Reading folder page: %s (cursor %s)", name, cursor)
+            return self.fileHandelingObj.getDirectoryPage(p, pageSize, cursor) # type: ignore
+
+        except Exception as err:
+            logger.error("Read folder error: %s", err)
             return [False, str(err)]
 
     # -------------------------------------------------------------------------
@@ -238,65 +268,79 @@ class FileOrganizer:
         try:
             valid = FileOrganizer.validateFolderName(newName)
             if not valid[0]:
-                logging.warning(f"Rename failed: {valid[1]}")
+                logger.warning("Rename failed: %s", valid[1])
                 return valid
 
             old_path = self.fileHandelingObj.getPath(name)
             if not old_path.exists():
-                logging.warning(f"Folder does not exist: {name}")
+                logger.warning("Folder does not exist: %s", name)
                 return [False, f"Folder '{name}' does not exist"]
 
             new_path = self.fileHandelingObj.getPath(newName)
             if new_path.exists():
-                logging.warning(f"New folder name already exists: {newName}")
+                logger.warning("New folder name already exists: %s", newName)
                 return [False, f"Folder '{newName}' already exists"]
 
             old_path.rename(new_path)
-            logging.info(f"Folder renamed: {name} → {newName}")
+            self.fileHandelingObj.invalidateListing(old_path, new_path)
+            logger.info("Folder renamed: %s → %s", name, newName)
             return [True, "Folder renamed successfully"]
 
         except Exception as err:
-            logging.error(f"Rename folder error: {err}")
+            logger.error("Rename folder error: %s", err)
             return [False, str(err)]
 
     # -------------------------------------------------------------------------
     # Delete Folder
     # -------------------------------------------------------------------------
-    def deleteFolder(self, name: str) -> list:
+    def deleteFolder(self, name: str, background: bool = False, workers: int = 4) -> list:
+        """
+        Deletes a folder; a non-empty one only after confirmation. Trees are
+        removed by TreeDeleter (fd-relative, parallel per subfolder); with
+        background=True (or menu choice 2) the folder is renamed away at once
+        and purged on a background thread.
+        """
         try:
             p = self.fileHandelingObj.getPath(name)
 
             if not p.exists():
-                logging.warning(f"Delete failed: folder does not exist: {name}")
+                logger.warning("Delete failed: folder does not exist: %s", name)
                 return [False, f"Folder '{name}' does not exist"]
 
-            result = self.fileHandelingObj.getAllFilesAndFolder(p) # type: ignore
-
-            if result[1]:  
+            if not isEmptyDir(p):
                 mode = FileOrganizer.getInput(
                     f"Folder '{name}' is not empty.\n"
-                    "Press 1 to delete everything OR 2 to cancel: ",
+                    "Press 1 to delete everything, 2 to delete in the background OR 3 to cancel: ",
                     int
                 )
 
                 if not mode[0]:
-                    logging.warning(f"User cancelled deletion of non-empty folder: {name}")
+                    logger.warning("User cancelled deletion of non-empty folder: %s", name)
                     return mode
 
-                if mode[1] == 1:
-                    shutil.rmtree(p)
-                    logging.info(f"Folder deleted with contents: {name}")
-                    return [True, f"Folder '{name}' deleted successfully"]
-
-                logging.info(f"User cancelled folder deletion: {name}")
+                if mode[1] in (1, 2):
+                    deleter = TreeDeleter(workers)
+                    if background or mode[1] == 2:
+                        result = deleter.trash(p)
+                    else:
+                        result = deleter.deleteTree(p)
+                    self.fileHandelingObj.invalidateListing(p)
+                    if not result[0]:
+                        logger.error("Delete folder %s failed: %s", name, result[1])
+                        return result[:2]
+                    logger.info("Folder deleted with contents: %s", name)
+                    return [True, f"Folder '{name}' deleted successfully", result[2]]
+
+                logger.info("User cancelled folder deletion: %s", name)
                 return [False, f"Folder '{name}' not deleted"]
 
             p.rmdir()
-            logging.info(f"Folder deleted: {name}")
+            self.fileHandelingObj.invalidateListing(p)
+            logger.info("Folder deleted: %s", name)
             return [True, f"Folder '{name}' deleted successfully"]
 
         except Exception as err:
-            logging.error(f"Delete folder error: {err}")
+            logger.error("Delete folder error: %s", err)
             return [False, str(err)]
     
     # -------------------------------------------------------------------------
@@ -309,145 +353,629 @@ class FileOrganizer:
 
             # Check folder exists
             if not p.exists():
-                logging.warning(f"Folder does not exist: {folderName}")
+                logger.warning("Folder does not exist: %s", folderName)
                 return [False, f"Folder '{folderName}' does not exist"]
 
             # Log start
-            logging.info(f"Reading folder: {folderName}")
+            logger.info("Reading folder: %s", folderName)
 
-            # Get files & folders
-            items = self.fileHandelingObj.getAllFilesAndFolder(p) #type: ignore
-            logging.info(f"Found {len(items)} items in folder '{folderName}'")
+            # Count from the cached listing (one stat when the folder is unchanged)
+            listing = self.fileHandelingObj.getListing(p) #type: ignore
+            if listing[0]:
+                logger.info("Found %s items in folder '%s'", listing[2]['entries'], folderName)
 
             # File operations (your run() has no return)
-            logging.info(f"Performing file handling operations on folder: {folderName}")
+            logger.info("Performing file handling operations on folder: %s", folderName)
             m.FileHandling(p).run() #type: ignore
 
             # Log success
-            logging.info(f"File handling completed for folder: {folderName}")
+            logger.info("File handling completed for folder: %s", folderName)
 
             return [True, "Operation completed"]
 
         except Exception as err:
-            logging.error(f"Error while processing folder '{folderName}': {err}")
+            logger.error("Error while processing folder '%s': %s", folderName, err)
             return [False, str(err)]
     # -------------------------------------------------------------------------
+    # Load Extension Mapping (hot-reloaded when the JSON file changes)
+    # -------------------------------------------------------------------------
+    def loadMapping(self, extensionFileName):
+        """
+        Returns [True, message, snapshot] with the current MappingSnapshot of
+        the JSON file. The file is re-read only when its mtime changed; a
+        run keeps using the snapshot it got here until it finishes.
+        """
+        path = self.fileHandelingObj.getPath(extensionFileName)
+        if self.mappingManager is None or self.mappingManager.path != Path(os.path.abspath(path)):
+            self.mappingManager = MappingManager.forPath(path, FileOrganizer.extensionToCategory)
+
+        snapshot = self.mappingManager.snapshot()
+        if snapshot is None:
+            return [False, self.mappingManager.lastError]
+
+        FileOrganizer.extensionToCategoryData = snapshot.table
+        return [True, f"Extension mapping version {snapshot.version} loaded", snapshot]
+
+    def currentMapping(self):
+        """Latest snapshot of this organizer's mapping (extensionToCategoryData if none was loaded)."""
+        if self.mappingManager is not None:
+            snapshot = self.mappingManager.snapshot()
+            if snapshot is not None:
+                return snapshot
+        return MappingManager.fromTable(FileOrganizer.extensionToCategoryData)
+
+    # -------------------------------------------------------------------------
     # Folder Organizer Category Helper Function
     # -------------------------------------------------------------------------
-    def getCategoryForFile(self,item):
-        ext = item.suffix.lower()
-        if ext == "":
-            logging.info(f"File '{item.name}' has no extension -> 'others'")
-            return "others"
-        # Determine category
-        if ext in FileOrganizer.extensionToCategoryData:
-            category = FileOrganizer.extensionToCategoryData[ext]
+    def getCategoryForFile(self,item, mapping=None):
+        # Works for Path and os.DirEntry alike (both expose .name)
+        mapping = mapping or self.currentMapping()
+        category = mapping.resolver.resolve(item.name)
+        if category is not None:
+            return category
+        ext = os.path.splitext(item.name)[1].lower()
+        if ext in ("", "."):
+            hotLogger.info("File '%s' has no extension -> 'others'", item.name)
         else:
-            logging.info(f"Unknown extension '{ext}' -> assigning to 'others'")
-            category = "others"
-        return category
+            hotLogger.info("Unknown extension '%s' -> assigning to 'others'", ext)
+        return "others"
+
+    def isBaseFolder(self, p):
+        """The base folder keeps its index, cache and journal inside it: its parent is not ours."""
+        return Path(p).resolve() == Path(self.base_path).resolve()
+
+    # -------------------------------------------------------------------------
+    # Folder Organizer Planning Helper Function
+    # -------------------------------------------------------------------------
+    def planMoves(self, p, entries, namer, categories=None, dedup=None, mapping=None, sniffer=None):
+        """
+        Returns (source, destination) pairs for a batch of entries of folder p.
+        Planning is sequential so destination naming stays deterministic;
+        namer (a DestinationNamer shared by the whole run) hands out free names.
+        If a categories dict is given it is filled with path -> category.
+        A Deduplicator drops duplicates before any name is handed out.
+        mapping is the run's MappingSnapshot (the current one if omitted).
+        A ContentSniffer classifies files without a known extension by content.
+        """
+        mapping = mapping or self.currentMapping()
+        assigned = []
+        for item in entries:
+
+            # Skip folders and the organizer's own index, cache and journal files
+            if item.is_dir() or isSidecarFile(item.name):
+                continue
+            assigned.append((item, self.getCategoryForFile(item, mapping)))
+
+        if sniffer is not None:
+            unknown = [item for item, category in assigned if category == "others" and mapping.resolve(item.name) is None]
+            if unknown:
+                sniffed = sniffer.classify(unknown, mapping)
+                assigned = [(item, sniffed.get(os.fspath(item), category)) for item, category in assigned]
+
+        targets = []
+        for item, category in assigned:
+            if categories is not None:
+                categories[os.fspath(item)] = category
+            # Skip categories you don't want to organize
+            if category in ["code", "others"]:
+                continue
+
+            targets.append((item, p / category))
+
+        if dedup is not None:
+            targets = dedup.filter(targets)
+
+        moves = []
+        resolver = mapping.resolver
+        for item, category_folder in targets:
+            # Final destination path (category folder is created on first use);
+            # compound extensions stay together: "a(1).tar.gz", not "a.tar(1).gz"
+            ext = resolver.splitName(item.name)[1]
+            destination = namer.reserve(category_folder, item.name, ext)
+
+            hotLogger.info("Moving '%s' → '%s'", item.name, category_folder)
+            moves.append((os.fspath(item), destination))
+
+        return moves
+
+    def organizeBatch(self, p, batch, engine, namer, index=None, dedup=None, mapping=None, sniffer=None,
+                      journal=None):
+        """
+        Plans and moves one batch; with an index only new/changed entries are
+        processed. Returns the number of files that were looked at.
+        """
+        if index is not None:
+            batch = index.changedEntries(batch)
+
+        categories = {}
+        moves = self.planMoves(p, batch, namer, categories, dedup, mapping, sniffer)
+        if journal is not None:
+            journal.record(moves)
+        result = engine.execute(moves)
+        if journal is not None:
+            journal.commit(result[1])
+        failures = result[1]
+        if failures:
+            moves, failures = self.retryFailedMoves(moves, failures, engine, namer, mapping, journal)
+        failed = [src for src, _ in failures]
+
+        if dedup is not None:
+            dedup.apply(moves, failed)
+
+        if index is not None:
+            index.recordBatch(batch, moves, categories, failed)
+
+        # One aggregated line per batch; per-file lines live on the hot path logger
+        logger.info(
+            "Batch done: %d file(s) checked, %d planned, %d failed", len(categories), len(moves), len(failed)
+        )
+        return len(categories)
+
+    def retryFailedMoves(self, moves, failures, engine, namer, mapping=None, journal=None):
+        """
+        Gives failed moves of a batch a second chance: a destination that
+        appeared after its name was reserved stays taken and the file gets
+        the next free name; other failures release their reserved name for
+        later files. Returns the batch's (moves, failures) after the retry.
+        """
+        def releaseFree(destination):
+            if not os.path.lexists(destination):
+                namer.release(*os.path.split(destination))
+
+        resolver = (mapping or self.currentMapping()).resolver
+        destinations = dict(moves)
+        retries = []
+        for source, _ in failures:
+            destination = destinations[source]
+            if os.path.lexists(destination) and os.path.lexists(source):
+                name = os.path.basename(source)
+                retries.append((source, namer.reserve(os.path.dirname(destination), name, resolver.splitName(name)[1])))
+            else:
+                releaseFree(destination)
+        if not retries:
+            return moves, failures
+
+        # The first attempts are no longer failures; a retry that fails again counts once
+        engine.discountFailures(source for source, _ in retries)
+        if journal is not None:
+            journal.record(retries)
+        result = engine.execute(retries)
+        if journal is not None:
+            journal.commit(result[1])
+        retried = dict(retries)
+        for source, _ in result[1]:
+            releaseFree(retried[source])
+        hotLogger.info("Retried %s move(s) under a new name, %s failed again", len(retries), len(result[1]))
+        moves = [(source, retried.get(source, destination)) for source, destination in moves]
+        failures = [failure for failure in failures if failure[0] not in retried] + result[1]
+        return moves, failures
+
     # -------------------------------------------------------------------------
     # Folder Organizer
     # -------------------------------------------------------------------------
 
-    def organizeMyFolder(self, folderName, extensionFileName):
+    def organizeMyFolder(self, folderName, extensionFileName, options=None, **overrides):
+        """
+        Organizes files of a folder into category folders, streaming it in
+        batches so memory stays flat. options is an OrganizeOptions (workers,
+        recursion, incremental runs, duplicates, sniffing, journaling);
+        keyword arguments override single fields of it.
+        Returns [ok, message, stats] where stats holds per-worker throughput
+        and, for recursive runs, files/directories visited per second.
+        """
         try:
+            options = (options or OrganizeOptions()).replace(**overrides)
+            workers = options.workers
+            batchSize = options.batchSize
+            duplicates = options.duplicates
+
             # Resolve path
             p = self.fileHandelingObj.getPath(folderName)
 
             # Check folder exists
             if not p.exists():
-                logging.warning(f"Folder does not exist: {folderName}")
+                logger.warning("Folder does not exist: %s", folderName)
                 return [False, f"Folder '{folderName}' does not exist"]
 
-            logging.info(f"Organizing folder: {folderName}")
+            logger.info("Organizing folder: %s", folderName)
 
             # ----------------------------------------------------
-            # Load JSON Mapping (only once)
+            # Load JSON Mapping (this run keeps the snapshot)
             # ----------------------------------------------------
-            if not FileOrganizer.extensionToCategoryData:
+            loaded = self.loadMapping(extensionFileName)
+            if not loaded[0]:
+                return loaded
+            mapping = loaded[2]
 
-                data = self.loadJSON(extensionFileName)
-                if not data[0]:
-                    logging.error(data[1])
-                    return data
+            # ----------------------------------------------------
+            # Stream folder contents, plan and move batch by batch
+            # ----------------------------------------------------
+            scanned = 0
+            processed = 0
+            walker = None
+            index = None
+            if options.incremental:
+                index = OrganizeIndex(p, OrganizeIndex.mappingKeyFor(dict(mapping.table)), self.isBaseFolder(p))
+
+            namer = options.namer or DestinationNamer()
+            dedup = Deduplicator(duplicates, workers, namer) if duplicates else None
+            sniff = options.sniff
+            sniffer = self.makeSniffer(p, mapping, workers, self.isBaseFolder(p)) if sniff is True else (sniff or None)
+            ownJournal = options.journal is True
+            journal = UndoJournal(p, self.isBaseFolder(p)) if ownJournal else (options.journal or None)
+            with MoveEngine(workers, options.mode, options.progress) as engine, index or contextlib.nullcontext(), \
+                    journal if ownJournal else contextlib.nullcontext():
+                if options.recursive:
+                    walker = TreeWalker(workers, options.maxDepth, options.exclude, skipTopLevel=mapping.categories)
+                    for path, _, files in walker.walk(p):
+                        scanned += len(files)
+                        if index is not None and index.isDirUnchanged(path):
+                            continue
+                        for start in range(0, len(files), batchSize):
+                            batch = files[start:start + batchSize]
+                            processed += self.organizeBatch(p, batch, engine, namer, index, dedup, mapping, sniffer, journal)
+                        # The root is recorded last, creating category folders touches it
+                        if index is not None and path != str(p):
+                            index.recordDir(path)
+                elif index is None or not index.isDirUnchanged(p):
+                    for batch in self.fileHandelingObj.iterDirectoryPages(p, batchSize):  # type: ignore
+                        scanned += len(batch)
+                        processed += self.organizeBatch(p, batch, engine, namer, index, dedup, mapping, sniffer, journal)
+
+                if index is not None:
+                    index.recordDir(p)
+
+            stats = engine.stats()
+            stats["scanned"] = scanned
+            stats["processed"] = processed
+            if sniffer is not None:
+                sniffer.save()
+                stats.update(sniffer.stats())
+            if journal is not None:
+                stats.update(journal.stats())
+            if dedup is not None:
+                stats.update(dedup.stats())
+                logger.info("Handled %s duplicate(s) with policy '%s'", stats['duplicates'], duplicates)
+            logger.info("Found %s items in folder '%s', processed %s", scanned, folderName, processed)
+            if walker is not None:
+                stats.update(walker.stats())
+                logger.info(
+                    "Visited %s file(s) and %s folder(s) (%.1f files/s, %.1f folders/s)",
+                    stats['filesVisited'], stats['dirsVisited'], stats['filesVisitedPerSec'], stats['dirsVisitedPerSec'],
+                )
+            logger.info(
+                "Moved %s file(s) in %.3fs (%.1f files/s, %s %s worker(s))",
+                stats['moved'], stats['seconds'], stats['filesPerSec'], stats['workers'], stats['mode'],
+            )
+            if stats["copiedBytes"]:
+                logger.info(
+                    "Copied %d byte(s) across file systems (%.1f MB/s)", stats['copiedBytes'], stats['bytesPerSec'] / 1e6
+                )
 
-                result = FileOrganizer.extensionToCategory(data[1])
-                if not result[0]:
-                    logging.error(result[1])
-                    return result
+            if stats["failed"]:
+                return [False, f"Folder '{folderName}' organized with {stats['failed']} failed move(s)", stats]
 
-                FileOrganizer.extensionToCategoryData = result[1]
-                logging.info("Extension mapping loaded successfully.")
+            return [True, f"Folder '{folderName}' organized successfully", stats]
 
-            # ----------------------------------------------------
-            # Read folder contents
-            # ----------------------------------------------------
-            items = self.fileHandelingObj.getAllFilesAndFolder(p)  # type: ignore
-            if not items[0]:
-                return items
+        except Exception as err:
+            logger.error("Error while organizing folder '%s': %s", folderName, err)
+            return [False, str(err)]
+    # -------------------------------------------------------------------------
+    # Plan / Apply (dry run and deferred execution)
+    # -------------------------------------------------------------------------
+    def planFolder(self, folderName, extensionFileName, batchSize=1000, recursive=False, maxDepth=None,
+                   exclude=(), sniff=False, workers=1):
+        """
+        Dry run of organizeMyFolder: returns [True, message, plan] where plan
+        is a MovePlan of (source, destination, category, size) for every file
+        that would move. Nothing is created, moved or written; plan.summary()
+        is the preview and applyPlan() executes the plan later. Duplicate
+        detection is not part of planning.
+        """
+        try:
+            p = self.fileHandelingObj.getPath(folderName)
 
-            all_items = items[1]
-            logging.info(f"Found {len(all_items)} items in folder '{folderName}'")
+            if not p.exists():
+                logger.warning("Folder does not exist: %s", folderName)
+                return [False, f"Folder '{folderName}' does not exist"]
 
-            # ----------------------------------------------------
-            # Organize each file
-            # ----------------------------------------------------
-            for item in all_items:
+            loaded = self.loadMapping(extensionFileName)
+            if not loaded[0]:
+                return loaded
+            mapping = loaded[2]
+
+            plan = MovePlan(p)
+            namer = DestinationNamer(createFolders=False)
+            # The sniff cache is read but never saved during a dry run
+            sniffer = self.makeSniffer(p, mapping, workers, self.isBaseFolder(p)) if sniff is True else (sniff or None)
+
+            def planBatch(batch):
+                categories = {}
+                entries = {os.fspath(entry): entry for entry in batch}
+                for source, destination in self.planMoves(p, batch, namer, categories, mapping=mapping, sniffer=sniffer):
+                    try:
+                        st = entries[source].stat(follow_symlinks=False)
+                    except OSError as err:
+                        hotLogger.info("Skipping '%s' in plan: %s", source, err)
+                        continue
+                    plan.add(source, destination, categories[source], st.st_size, st.st_dev, st.st_ino)
+
+            if recursive:
+                walker = TreeWalker(workers, maxDepth, exclude, skipTopLevel=mapping.categories)
+                for _, _, files in walker.walk(p):
+                    for start in range(0, len(files), batchSize):
+                        planBatch(files[start:start + batchSize])
+            else:
+                for batch in self.fileHandelingObj.iterDirectoryPages(p, batchSize):  # type: ignore
+                    planBatch(batch)
+
+            logger.info("Planned %s move(s) for folder '%s'", len(plan), folderName)
+            return [True, f"Planned {len(plan)} move(s) for folder '{folderName}'", plan]
 
-                
-                # Skip folders
-                if item.is_dir():
-                    continue
-                category = self.getCategoryForFile(item)
-                # Skip categories you don't want to organize
-                if category in ["code", "others"]:
-                    continue
+        except Exception as err:
+            logger.error("Error while planning folder '%s': %s", folderName, err)
+            return [False, str(err)]
 
-                # Build category folder
-                category_folder = p / category
-                category_folder.mkdir(exist_ok=True)
-
-                # Final destination path
-                destination = category_folder / item.name
-                
-                conflict = 1
-                # Check If File with same name already exists in the destination folder
-                while destination.exists():
-                    # Rename File
-                    ext = item.suffix 
-                    fileName = item.stem
-                    newName = f"{fileName}({conflict}){ext}"
-                    logging.info(f"Conflict detected → trying new name: {newName}")
-                    conflict += 1
-                    destination = category_folder / newName
-                    # logging.info(f"File {item.name} Renamed as {newName}")
-                    
-                logging.info(f"Moving '{item.name}' → '{category_folder}'")
-
-                # Move file
-                shutil.move(str(item), str(destination))
-
-            return [True, f"Folder '{folderName}' organized successfully"]
+    def applyPlan(self, plan, workers=1, mode="thread", batchSize=1000, localitySort=True, progress=None,
+                  journal=True):
+        """
+        Executes a MovePlan (or the path of a saved one) in batches of
+        batchSize moves on `workers` threads or processes. With
+        localitySort=True moves run in (device, inode) order for disk
+        locality. Right before each batch runs its sources are lstat'ed;
+        a file that is gone or whose size, device or inode changed since
+        planning fails instead of being moved, and an existing destination
+        is never overwritten. progress is passed on to MoveEngine; with
+        journal=True the moves are journaled for undoOrganize().
+        Returns [ok, message, stats].
+        """
+        try:
+            if not isinstance(plan, MovePlan):
+                loaded = MovePlan.load(plan)
+                if not loaded[0]:
+                    return loaded
+                plan = loaded[1]
+
+            entries = plan.orderedEntries(localitySort)
+            for folder in {os.path.dirname(plan.absolute(destination)) for _, destination, *_ in entries}:
+                os.makedirs(folder, exist_ok=True)
+
+            changedCount = 0
+            journal = UndoJournal(plan.root, self.isBaseFolder(plan.root)) if journal else None
+            with MoveEngine(workers, mode, progress) as engine, journal or contextlib.nullcontext():
+                for start in range(0, len(entries), batchSize):
+                    batch, changed = plan.checkSources(entries[start:start + batchSize])
+                    for source, error in changed:
+                        logger.error("Planned move of '%s' skipped: %s", source, error)
+                    changedCount += len(changed)
+                    if journal is not None:
+                        journal.record(batch)
+                    result = engine.execute(batch)
+                    if journal is not None:
+                        journal.commit(result[1])
+
+            stats = engine.stats()
+            stats["failed"] += changedCount
+            stats["changed"] = changedCount
+            stats["planned"] = len(entries)
+            if journal is not None:
+                stats.update(journal.stats())
+            logger.info(
+                "Applied plan for '%s': %s of %s move(s) in %.3fs (%.1f files/s)",
+                plan.root, stats['moved'], len(entries), stats['seconds'], stats['filesPerSec'],
+            )
+            if stats["failed"]:
+                return [False, f"Plan applied with {stats['failed']} failed move(s)", stats]
+            return [True, f"Applied {stats['moved']} move(s) from plan", stats]
+
+        except Exception as err:
+            logger.error("Error while applying move plan: %s", err)
+            return [False, str(err)]
+
+    # -------------------------------------------------------------------------
+    # Undo
+    # -------------------------------------------------------------------------
+    def undoOrganize(self, folderName, runId=None, workers=4, mode="thread", batchSize=1000):
+        """
+        Reverses the latest journaled organize run of a folder (or runId):
+        its successful moves are replayed backwards, in parallel batches,
+        and category folders left empty are removed. Files that were
+        changed or replaced since (size or mtime differ from the journal)
+        stay where they are and are reported as failed; the run is only
+        marked undone once nothing failed, so undo can be run again.
+        Returns [ok, message, stats].
+        """
+        try:
+            p = self.fileHandelingObj.getPath(folderName)
+            journal = UndoJournal(p, self.isBaseFolder(p))
+
+            found = journal.undoMoves(runId)
+            if not found[0]:
+                logger.info("Nothing to undo for folder '%s'", folderName)
+                return found
+            runId = found[1]
+            moves, restored, changed = UndoJournal.checkUndoMoves(found[2])
+            for destination, error in changed:
+                logger.error("Cannot undo move of '%s': %s", destination, error)
+
+            for folder in {os.path.dirname(source) for _, source in moves}:
+                os.makedirs(folder, exist_ok=True)
+
+            with MoveEngine(workers, mode) as engine:
+                for start in range(0, len(moves), batchSize):
+                    engine.execute(moves[start:start + batchSize])
+
+            stats = engine.stats()
+            stats["failed"] += len(changed)
+            stats["alreadyRestored"] = restored
+            stats["journalRun"] = runId
+            if not stats["failed"]:
+                journal.markUndone(runId)
+
+            # Category folders the run filled are removed again once empty
+            for folder in {os.path.dirname(destination) for destination, _, _, _ in found[2]}:
+                with contextlib.suppress(OSError):
+                    os.rmdir(folder)
+
+            logger.info("Undid run %s of '%s': %s of %s move(s) reversed", runId, folderName, stats['moved'], len(found[2]))
+            if stats["failed"]:
+                return [False, f"Undo of run {runId} finished with {stats['failed']} failed move(s)", stats]
+            return [True, f"Undid {stats['moved']} move(s) of run {runId}", stats]
+
+        except Exception as err:
+            logger.error("Error while undoing organize of '%s': %s", folderName, err)
+            return [False, str(err)]
+
+    @staticmethod
+    def makeSniffer(p, mapping, workers=1, inside=False):
+        """ContentSniffer for folder p using the signature table next to the mapping file."""
+        signatureFile = None
+        if isinstance(mapping.source, str):
+            candidate = Path(mapping.source).with_name("fileSignatures.json")
+            if candidate.exists():
+                signatureFile = candidate
+        return ContentSniffer(signatureFile, max(4, workers), ContentSniffer.cachePathFor(p, inside))
+
+    # -------------------------------------------------------------------------
+    # Organize Selected Files
+    # -------------------------------------------------------------------------
+    def organizeFiles(self, folderName, names, extensionFileName, workers=1, mode="thread", namer=None,
+                      sniffer=None, journal=None):
+        """
+        Categorizes and moves only the given file names of a folder (no
+        directory scan). Used by watch mode, which passes one namer for the
+        whole session, and an open UndoJournal to record the moves in;
+        returns [ok, message, stats].
+        """
+        try:
+            p = self.fileHandelingObj.getPath(folderName)
+
+            loaded = self.loadMapping(extensionFileName)
+            if not loaded[0]:
+                return loaded
+
+            # Files may be gone again (or be folders) by the time a batch is handled
+            items = [p / name for name in names if (p / name).is_file()]
+
+            with MoveEngine(workers, mode) as engine:
+                moves = self.planMoves(p, items, namer or DestinationNamer(), mapping=loaded[2], sniffer=sniffer)
+                if journal is not None:
+                    journal.record(moves)
+                result = engine.execute(moves)
+                if journal is not None:
+                    journal.commit(result[1])
+
+            stats = engine.stats()
+            logger.info("Organized batch of %s name(s), moved %s", len(names), stats['moved'])
+            if stats["failed"]:
+                return [False, f"{stats['failed']} move(s) failed in '{folderName}'", stats]
+            return [True, f"Organized {stats['moved']} file(s) in '{folderName}'", stats]
 
         except Exception as err:
-            logging.error(f"Error while organizing folder '{folderName}': {err}")
+            logger.error("Error while organizing files in '%s': %s", folderName, err)
             return [False, str(err)]
+
+    # -------------------------------------------------------------------------
+    # Watch Folder
+    # -------------------------------------------------------------------------
+    def watchFolder(self, folderName, extensionFileName, batchSize=500, latency=1.0,
+                    workers=1, mode="thread", initialPass=True, forcePolling=False, sniff=False):
+        """
+        Keeps organizing a folder as files are finished writing (inotify,
+        or polling when inotify is unavailable). Files are debounced into
+        micro-batches of at most batchSize names / latency seconds, and only
+        those files are categorized and moved. Blocks until Ctrl+C.
+        sniff=True shares one ContentSniffer across the session; all moves
+        of the session go to one UndoJournal run.
+        """
+        try:
+            p = self.fileHandelingObj.getPath(folderName)
+
+            if not p.is_dir():
+                logger.warning("Folder does not exist: %s", folderName)
+                return [False, f"Folder '{folderName}' does not exist"]
+
+            # One namer, journal run (and sniffer) for the whole session, shared with full passes
+            namer = DestinationNamer()
+            journal = UndoJournal(p, self.isBaseFolder(p))
+            sniffer = None
+            if sniff:
+                loaded = self.loadMapping(extensionFileName)
+                if not loaded[0]:
+                    return loaded
+                sniffer = self.makeSniffer(p, loaded[2], workers, self.isBaseFolder(p))
+
+            journal.open()
+            try:
+                if initialPass:
+                    result = self.organizeMyFolder(
+                        folderName, extensionFileName, workers=workers, mode=mode, namer=namer,
+                        sniff=sniffer or False, journal=journal,
+                    )
+                    if not result[0]:
+                        return result
+
+                watcher = FolderWatcher(
+                    p,
+                    lambda names: self.organizeFiles(
+                        folderName, names, extensionFileName, workers, mode, namer, sniffer, journal
+                    ),
+                    batchSize,
+                    latency,
+                    forcePolling,
+                )
+                batches = watcher.watch(
+                    onOverflow=lambda: self.organizeMyFolder(
+                        folderName, extensionFileName, workers=workers, mode=mode, namer=namer,
+                        sniff=sniffer or False, journal=journal,
+                    )
+                )
+                return [True, f"Stopped watching '{folderName}' after {batches} batch(es)"]
+            finally:
+                journal.close()
+                if sniffer is not None:
+                    sniffer.save()
+
+        except Exception as err:
+            logger.error("Error while watching folder '%s': %s", folderName, err)
+            return [False, str(err)]
+
+    # -------------------------------------------------------------------------
+    # Bulk Find and Replace
+    # -------------------------------------------------------------------------
+    def replaceInFolder(self, folderName, replacements, recursive=False, include=None, exclude=(),
+                        maxDepth=None, processes=None, dryRun=False):
+        """
+        Replaces every (old, new) pair (dict or list) in the files of a
+        folder, one pass per file, on a process pool. include / exclude are
+        glob patterns on names or relative paths; dryRun only counts
+        matches. Returns [ok, message, report] (see BulkReplace).
+        """
+        try:
+            p = self.fileHandelingObj.getPath(folderName)
+            if not p.is_dir():
+                logger.warning("Folder does not exist: %s", folderName)
+                return [False, f"Folder '{folderName}' does not exist"]
+
+            return bulkReplace(p, replacements, recursive, include, exclude, maxDepth, processes, dryRun)
+
+        except Exception as err:
+            logger.error("Error replacing in folder '%s': %s", folderName, err)
+            return [False, str(err)]
+
     # -------------------------------------------------------------------------
     # MAIN LOOP
     # -------------------------------------------------------------------------
     def run(self):
         try:
-            logging.info("FileOrganizer program started")
+            logger.info("FileOrganizer program started")
+            self.fileHandelingObj.ensureBaseDir()
 
             while True:
-                # Display current base directory contents
-                items = self.fileHandelingObj.getAllFilesAndFolder()
-                if items[0]:
-                    print("\n========== Current Directory ==========")
-                    for i, item in enumerate(items[1], start=1):
-                        print(f"{i}. {item.name}")
-                    print("=======================================\n")
+                # Summary and first page of the base directory (cached listing)
+                print("\n========== Current Directory ==========")
+                self.fileHandelingObj.printListing(pageSize=FileOrganizer.MENU_PREVIEW, interactive=False, maxPages=1)
+                print("=======================================\n")
 
                 # Menu
                 print("1. Create Folder")
@@ -456,7 +984,9 @@ class FileOrganizer:
                 print("4. Delete Folder")
                 print("5. File Operations (open folder in FileHandling)")
                 print("6. Organize Folder")
-                print("7. Exit\n")
+                print("7. Exit")
+                print("8. Watch Folder (Ctrl+C to stop)")
+                print("9. Undo Last Organize\n")
 
                 # Get user choice
                 choice = FileOrganizer.getInput("Selection: ", int)
@@ -474,14 +1004,11 @@ class FileOrganizer:
 
                     case 2:
                         name = input("Enter folder name to read: ").strip()
-                        result = self.readFolderContent(name)
+                        # Validates the name; the listing itself comes from the cache
+                        result = self.readFolderPage(name, 1)
                         if result[0]:
                             print("\n--- Folder Contents ---")
-                            if result[1]:
-                                for i, item in enumerate(result[1], start=1):
-                                    print(f"{i}. {item.name}")
-                            else:
-                                print(f"Folder '{name}' is empty")
+                            self.fileHandelingObj.printListing(self.fileHandelingObj.getPath(name))
                             print("------------------------\n")
                         else:
                             print(result[1])
@@ -508,15 +1035,25 @@ class FileOrganizer:
                         print(result[1])
 
                     case 7:
-                        logging.info("Program exited by user")
+                        logger.info("Program exited by user")
                         print("Exiting...")
                         break
 
+                    case 8:
+                        name = input("Enter the folder name you want to watch: ").strip()
+                        result = self.watchFolder(name, "fileExtensions.json")
+                        print(result[1])
+
+                    case 9:
+                        name = input("Enter the folder name to undo the last organize of: ").strip()
+                        result = self.undoOrganize(name)
+                        print(result[1])
+
                     case _:
                         print("Invalid choice. Please try again.")
 
         except Exception as err:
-            logging.error(f"Unexpected error in run(): {err}")
+            logger.error("Unexpected error in run(): %s", err)
             print("Unexpected Error:", err)
 
 
@@ -0,0 +1,164 @@
+import os
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from FileHandeling import LoggingSetup
+
+logger = logging.getLogger(__name__)
+hotLogger = LoggingSetup.hotPathLogger(__name__)
+
+
+TRASH_MARKER = ".trash-"
+
+
+def isEmptyDir(path):
+    """True if path has no entries; reads at most one entry."""
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
+
+# -------------------------------------------------------------------------
+# Tree Deleter
+# -------------------------------------------------------------------------
+class TreeDeleter:
+    """
+    Deletes directory trees with os.fwalk, unlinking every entry relative
+    to its parent's directory fd (no full-path lookups). The top-level
+    subdirectories are deleted in parallel on `workers` threads.
+    trash() renames the tree next to itself first, so the visible delete
+    is a single rename, and purges it on a background thread.
+    """
+
+    def __init__(self, workers=4):
+        self.workers = max(1, int(workers))
+        self.lock = threading.Lock()
+        self.files = 0
+        self.dirs = 0
+        self.errors = []
+        self.seconds = 0.0
+
+    # ---------------------------------------------------------------------
+    # Deletion
+    # ---------------------------------------------------------------------
+    def onError(self, path, err):
+        with self.lock:
+            self.errors.append((path, str(err)))
+        hotLogger.warning("Could not delete %s: %s", path, err)
+
+    def deleteSubtree(self, path):
+        files = 0
+        dirs = 0
+        for dirpath, dirnames, filenames, dirfd in os.fwalk(path, topdown=False, onerror=lambda err: self.onError(path, err)):
+            for name in filenames:
+                try:
+                    os.unlink(name, dir_fd=dirfd)
+                    files += 1
+                except OSError as err:
+                    self.onError(os.path.join(dirpath, name), err)
+            for name in dirnames:
+                try:
+                    os.rmdir(name, dir_fd=dirfd)
+                    dirs += 1
+                except NotADirectoryError:
+                    # Symlinks to folders are listed as folders but never followed
+                    try:
+                        os.unlink(name, dir_fd=dirfd)
+                        files += 1
+                    except OSError as err:
+                        self.onError(os.path.join(dirpath, name), err)
+                except OSError as err:
+                    self.onError(os.path.join(dirpath, name), err)
+        with self.lock:
+            self.files += files
+            self.dirs += dirs
+
+    def deleteTree(self, path):
+        """Deletes path and everything below it. Returns [ok, message, stats]."""
+        start = time.perf_counter()
+        try:
+            path = os.fspath(path)
+            subdirs = []
+            files = 0
+            rootFd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                with os.scandir(rootFd) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.name)
+                            continue
+                        try:
+                            os.unlink(entry.name, dir_fd=rootFd)
+                            files += 1
+                        except OSError as err:
+                            self.onError(os.path.join(path, entry.name), err)
+                with self.lock:
+                    self.files += files
+
+                if self.workers > 1 and len(subdirs) > 1:
+                    with ThreadPoolExecutor(max_workers=min(self.workers, len(subdirs))) as pool:
+                        list(pool.map(self.deleteSubtree, [os.path.join(path, name) for name in subdirs]))
+                else:
+                    for name in subdirs:
+                        self.deleteSubtree(os.path.join(path, name))
+
+                for name in subdirs:
+                    try:
+                        os.rmdir(name, dir_fd=rootFd)
+                        self.dirs += 1
+                    except OSError as err:
+                        self.onError(os.path.join(path, name), err)
+            finally:
+                os.close(rootFd)
+
+            if not self.errors:
+                os.rmdir(path)
+                self.dirs += 1
+
+        except OSError as err:
+            self.onError(path, err)
+
+        self.seconds += time.perf_counter() - start
+        stats = self.stats()
+        if self.errors:
+            return [False, f"{len(self.errors)} item(s) could not be deleted", stats]
+        logger.info("Deleted %s: %s file(s), %s folder(s) in %.3fs", path, stats['files'], stats['dirs'], stats['seconds'])
+        return [True, "Folder deleted", stats]
+
+    # ---------------------------------------------------------------------
+    # Rename to trash, purge in background
+    # ---------------------------------------------------------------------
+    def trash(self, path):
+        """
+        Renames path to a hidden ".<name>.trash-<ns>" sibling right away and
+        deletes that in a background (non-daemon) thread, so exiting the
+        program still finishes the purge. Returns [ok, message, thread].
+        """
+        try:
+            path = os.path.abspath(path)
+            trashPath = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}{TRASH_MARKER}{time.time_ns()}")
+            os.rename(path, trashPath)
+
+            def purge():
+                result = self.deleteTree(trashPath)
+                if not result[0]:
+                    logger.error("Background purge of %s incomplete: %s", trashPath, result[1])
+
+            thread = threading.Thread(target=purge, name="TreeDeleterPurge")
+            thread.start()
+            logger.info("Moved %s to %s, purging in background", path, trashPath)
+            return [True, "Folder moved to trash, purging in background", thread]
+
+        except Exception as err:
+            logger.error("Could not move %s to trash: %s", path, err)
+            return [False, str(err)]
+
+    def stats(self):
+        return {
+            "files": self.files,
+            "dirs": self.dirs,
+            "errors": list(self.errors),
+            "seconds": self.seconds,
+            "filesPerSec": self.files / self.seconds if self.seconds else 0.0,
+        }
@@ -0,0 +1,109 @@
+import os
+import time
+import fnmatch
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from FileHandeling import LoggingSetup
+
+logger = logging.getLogger(__name__)
+hotLogger = LoggingSetup.hotPathLogger(__name__)
+
+
+# -------------------------------------------------------------------------
+# Worker side
+# -------------------------------------------------------------------------
+def scanDirectory(path, depth):
+    """Scans one directory. Returns (path, depth, files, subdirs) sorted by name."""
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # Never follow directory symlinks, they can loop back into the tree
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry)
+                else:
+                    files.append(entry)
+    except OSError as err:
+        logger.error("Cannot scan directory '%s': %s", path, err)
+
+    files.sort(key=lambda entry: entry.name)
+    subdirs.sort(key=lambda entry: entry.name)
+    return path, depth, files, subdirs
+
+
+# -------------------------------------------------------------------------
+# Tree Walker
+# -------------------------------------------------------------------------
+class TreeWalker:
+    """
+    Walks a directory tree, scanning subtrees concurrently on a thread pool.
+    Directories are still yielded in a fixed breadth-first, name-sorted
+    order so anything planned from the walk stays deterministic; workers
+    only scan ahead of the consumer, bounded by a small prefetch window.
+    """
+
+    def __init__(self, workers=1, maxDepth=None, exclude=(), skipTopLevel=()):
+        self.workers = max(1, int(workers))
+        self.maxDepth = maxDepth
+        self.exclude = tuple(exclude)
+        self.skipTopLevel = set(skipTopLevel)
+        self.filesVisited = 0
+        self.dirsVisited = 0
+        self.seconds = 0.0
+
+    def isExcluded(self, root, entry):
+        if not self.exclude:
+            return False
+        relative = os.path.relpath(entry.path, root).replace(os.sep, "/")
+        return any(
+            fnmatch.fnmatch(entry.name, pattern) or fnmatch.fnmatch(relative, pattern)
+            for pattern in self.exclude
+        )
+
+    def walk(self, root):
+        """Yields (directory, depth, fileEntries) for root and every subdirectory it may enter."""
+        root = str(root)
+        # Only time spent inside the walk counts, not the consumer's work between yields
+        resumed = time.perf_counter()
+        window = self.workers * 4
+        pending = deque([(root, 0)])
+        inflight = deque()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while pending or inflight:
+                while pending and len(inflight) < window:
+                    path, depth = pending.popleft()
+                    inflight.append(pool.submit(scanDirectory, path, depth))
+
+                path, depth, files, subdirs = inflight.popleft().result()
+                self.dirsVisited += 1
+
+                for entry in subdirs:
+                    if depth == 0 and entry.name in self.skipTopLevel:
+                        continue
+                    if self.maxDepth is not None and depth >= self.maxDepth:
+                        continue
+                    if self.isExcluded(root, entry):
+                        hotLogger.debug("Excluded directory: %s", entry.path)
+                        continue
+                    pending.append((entry.path, depth + 1))
+
+                files = [entry for entry in files if not self.isExcluded(root, entry)]
+                self.filesVisited += len(files)
+                self.seconds += time.perf_counter() - resumed
+                yield path, depth, files
+                resumed = time.perf_counter()
+
+        self.seconds += time.perf_counter() - resumed
+
+    def stats(self):
+        return {
+            "filesVisited": self.filesVisited,
+            "dirsVisited": self.dirsVisited,
+            "walkSeconds": self.seconds,
+            "filesVisitedPerSec": self.filesVisited / self.seconds if self.seconds else 0.0,
+            "dirsVisitedPerSec": self.dirsVisited / self.seconds if self.seconds else 0.0,
+        }
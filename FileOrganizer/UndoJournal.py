@@ -0,0 +1,230 @@
+import os
+import time
+import logging
+from pathlib import Path
+
+from FileHandeling.SidecarFiles import JOURNAL_SUFFIX, sidecarPath, isSidecarName, relativePath
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------------
+# Undo Journal
+# -------------------------------------------------------------------------
+class UndoJournal:
+    """
+    Append-only journal of the moves organize runs perform, kept next to
+    the organized folder (".<folder>.organizeJournal"; inside it with
+    inside=True). Each run starts
+    with an "R" line; every batch is written ahead of its moves as one
+    block of "M source destination size mtime_ns" lines and fsynced once
+    (group commit). Once the batch has run, its failed sources get "F"
+    lines and the block is closed by a "C" line; only committed, successful
+    moves are ever undone, and size/mtime identify the moved file.
+    Paths are relative to the folder and a destination that keeps the
+    source's name is stored as just its folder ("images/"), so a 1M-file
+    run takes roughly 40-50 MB. Undone runs get a "U" line. Files removed
+    by duplicate handling are not journaled and cannot be restored.
+    """
+    SUFFIX = JOURNAL_SUFFIX
+
+    def __init__(self, root, inside=False):
+        self.root = Path(root)
+        self.path = sidecarPath(self.root, UndoJournal.SUFFIX, inside)
+        self.fd = None
+        self.runId = None
+        self.entries = 0
+        self.commits = 0
+        self.pending = False
+
+    @staticmethod
+    def isJournalFile(name):
+        return isSidecarName(name, UndoJournal.SUFFIX)
+
+    # ---------------------------------------------------------------------
+    # Line encoding (tabs, newlines and backslashes are escaped)
+    # ---------------------------------------------------------------------
+    @staticmethod
+    def escape(text):
+        return text.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n")
+
+    @staticmethod
+    def unescape(text):
+        if "\\" not in text:
+            return text
+        out = []
+        chars = iter(text)
+        for char in chars:
+            if char == "\\":
+                char = next(chars, "")
+                char = {"t": "\t", "n": "\n"}.get(char, char)
+            out.append(char)
+        return "".join(out)
+
+    def relative(self, path):
+        return relativePath(path, self.root)
+
+    def encodeMove(self, source, destination):
+        try:
+            st = os.lstat(source)
+            identity = f"{st.st_size}\t{st.st_mtime_ns}"
+        except OSError:
+            # The move will fail too; the batch's "F" line says so
+            identity = "-\t-"
+        source = self.relative(source)
+        destination = self.relative(destination)
+        folder, _, name = destination.rpartition("/")
+        if name == source.rpartition("/")[2]:
+            destination = folder + "/"
+        return f"M\t{UndoJournal.escape(source)}\t{UndoJournal.escape(destination)}\t{identity}\n"
+
+    # ---------------------------------------------------------------------
+    # Writing
+    # ---------------------------------------------------------------------
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def open(self):
+        self.fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self.runId = f"{time.time_ns():x}"
+        self.write(f"R\t{self.runId}\t{time.strftime('%Y-%m-%dT%H:%M:%S')}\n")
+        logger.info("Undo journal run %s opened: %s", self.runId, self.path)
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def write(self, text, sync=False):
+        data = text.encode("utf-8", "surrogateescape")
+        while data:
+            written = os.write(self.fd, data)  # type: ignore
+            data = data[written:]
+        if sync:
+            os.fsync(self.fd)  # type: ignore
+            self.commits += 1
+
+    def record(self, moves):
+        """Journals a batch of (source, destination) moves with a single fsync, before they run."""
+        if not moves:
+            return
+        self.write("".join(self.encodeMove(source, destination) for source, destination in moves), sync=True)
+        self.entries += len(moves)
+        self.pending = True
+
+    def commit(self, failures=()):
+        """
+        Closes the recorded batch once it has run: failures are the
+        (source, error) pairs MoveEngine.execute returned.
+        """
+        if not self.pending:
+            return
+        lines = [f"F\t{UndoJournal.escape(self.relative(source))}\n" for source, _ in failures]
+        lines.append("C\n")
+        self.write("".join(lines), sync=True)
+        self.pending = False
+
+    def stats(self):
+        return {"journalRun": self.runId, "journaled": self.entries, "journalCommits": self.commits}
+
+    # ---------------------------------------------------------------------
+    # Reading / Undo
+    # ---------------------------------------------------------------------
+    def runs(self):
+        """
+        Returns [(runId, startedAt, moves, undone)] where moves are the
+        committed, successful moves of the run as absolute
+        (source, destination, size, mtime_ns). A batch without its "C" line
+        (a crash while it ran) is left out: nothing says which moves happened.
+        """
+        runs = []
+        current = None
+        pending = []
+        failed = set()
+        undone = set()
+        if not self.path.exists():
+            return runs
+
+        with open(self.path, "r", encoding="utf-8", errors="surrogateescape") as fs:
+            for line in fs:
+                if not line.endswith("\n"):
+                    # A torn last line from a crash mid-write
+                    break
+                parts = line[:-1].split("\t")
+                if parts[0] == "R" and len(parts) == 3:
+                    current = (parts[1], parts[2], [])
+                    runs.append(current)
+                    pending, failed = [], set()
+                elif parts[0] == "M" and len(parts) == 5 and current is not None:
+                    if parts[3] == "-":
+                        continue
+                    source = UndoJournal.unescape(parts[1])
+                    destination = UndoJournal.unescape(parts[2])
+                    if destination.endswith("/"):
+                        destination += source.rpartition("/")[2]
+                    pending.append((source, destination, int(parts[3]), int(parts[4])))
+                elif parts[0] == "F" and len(parts) == 2:
+                    failed.add(UndoJournal.unescape(parts[1]))
+                elif parts[0] == "C" and current is not None:
+                    current[2].extend((self.absolute(source), self.absolute(destination), size, mtime)
+                                      for source, destination, size, mtime in pending if source not in failed)
+                    pending, failed = [], set()
+                elif parts[0] == "U" and len(parts) == 2:
+                    undone.add(parts[1])
+
+        return [(runId, startedAt, moves, runId in undone) for runId, startedAt, moves in runs]
+
+    def absolute(self, rel):
+        return os.path.join(self.root, *rel.split("/"))
+
+    def undoMoves(self, runId=None):
+        """
+        Returns [True, runId, moves] where moves are the
+        (destination, source, size, mtime_ns) that reverse a run (the latest
+        run not yet undone by default), newest first.
+        """
+        runs = [run for run in self.runs() if not run[3] and run[2]]
+        if runId is not None:
+            runs = [run for run in runs if run[0] == runId]
+        if not runs:
+            return [False, "Nothing to undo"]
+        runId, _, moves, _ = runs[-1]
+        return [True, runId, [(destination, source, size, mtime) for source, destination, size, mtime in reversed(moves)]]
+
+    @staticmethod
+    def checkUndoMoves(moves):
+        """
+        Splits the moves undoMoves returned by what is on disk now:
+        [ready (destination, source) pairs whose file still has the journaled
+        size and mtime, number already back at their source, (destination,
+        error) pairs for files that were changed, replaced or removed].
+        """
+        def unchanged(path, size, mtime):
+            try:
+                st = os.lstat(path)
+            except OSError:
+                return False
+            return st.st_size == size and st.st_mtime_ns == mtime
+
+        ready, restored, changed = [], 0, []
+        for destination, source, size, mtime in moves:
+            if unchanged(destination, size, mtime):
+                ready.append((destination, source))
+            elif unchanged(source, size, mtime):
+                restored += 1
+            else:
+                changed.append((destination, "File changed, replaced or removed since the run"))
+        return [ready, restored, changed]
+
+    def markUndone(self, runId):
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+        try:
+            os.write(fd, f"U\t{runId}\n".encode())
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -1,4 +1,5 @@
 from FileOrganizer import Organizer as org
 
+org.initLogging()
 myobj = org.FileOrganizer("./FileOrganizer")
-myobj.run()
\ No newline at end of file
+myobj.run()
@@ -0,0 +1,52 @@
+"""
+Append benchmark: writes N small records with updateFile mode 2 (open,
+append, close per record) and with one BufferedAppender per sync policy.
+
+    python benchmarks/appendRecords.py --records 100000
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from FileHandeling.FileHandlingOperations import FileHandling  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    records = [f"event-{i} status=ok" for i in range(args.records)]
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        fh = FileHandling(workdir)
+        fh.createNewFile("mode2.log")
+        start = time.perf_counter()
+        for record in records:
+            fh.updateFile("mode2.log", 2, None, record)
+        results["updateFile mode 2"] = time.perf_counter() - start
+
+        for sync in ("none", "flush"):
+            name = f"appender-{sync}.log"
+            start = time.perf_counter()
+            with fh.openAppender(name, sync=sync)[2] as appender:
+                for record in records:
+                    appender.append(" " + record)
+            results[f"appender sync={sync}"] = time.perf_counter() - start
+            # Same bytes as mode 2 produced
+            assert os.path.getsize(fh.getPath(name)) == os.path.getsize(fh.getPath("mode2.log"))
+
+    baseline = results["updateFile mode 2"]
+    for label, seconds in results.items():
+        print(f"{label:20}: {seconds:7.3f} s ({args.records / seconds:12,.0f} records/s, {baseline / seconds:6.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
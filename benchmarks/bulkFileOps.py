@@ -0,0 +1,60 @@
+"""
+Bulk file operations benchmark: provisions N small files with a Python loop
+over FileHandling.createNewFile and with one createNewFiles call, then
+deletes them with deleteTheFile vs deleteFiles. Best of --runs, each run in
+a fresh temporary folder.
+
+    python benchmarks/bulkFileOps.py --files 100000 --workers 8
+"""
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from FileHandeling.FileHandlingOperations import FileHandling  # noqa: E402
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def runOnce(count, workers):
+    names = [f"file_{i}.txt" for i in range(count)]
+    with tempfile.TemporaryDirectory() as workdir:
+        loop = FileHandling(Path(workdir) / "loop")
+        bulk = FileHandling(Path(workdir) / "bulk")
+        return {
+            "create loop": timed(lambda: [loop.createNewFile(name, "x") for name in names]),
+            "create bulk": timed(lambda: bulk.createNewFiles(((name, "x") for name in names), workers)),
+            "delete loop": timed(lambda: [loop.deleteTheFile(name) for name in names]),
+            "delete bulk": timed(lambda: bulk.deleteFiles(names, workers)),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=FileHandling.BULK_WORKERS)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    best = {}
+    for _ in range(args.runs):
+        for label, seconds in runOnce(args.files, args.workers).items():
+            best[label] = min(best.get(label, seconds), seconds)
+
+    for label, seconds in best.items():
+        print(f"{label:12}: {seconds:7.3f} s ({args.files / seconds:10,.0f} files/s)")
+    print(f"create speedup: {best['create loop'] / best['create bulk']:.2f}x")
+    print(f"delete speedup: {best['delete loop'] / best['delete bulk']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""
+Bulk replace benchmark: rewrites a token across --files text files (a
+third of them without the token) with an updateFile mode 1 loop and with
+one FileOrganizer.replaceInFolder call.
+
+    python benchmarks/bulkReplace.py --files 5000 --processes 4
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from FileOrganizer.Organizer import FileOrganizer  # noqa: E402
+
+
+def populate(folder, count):
+    os.makedirs(folder)
+    body = "host=old-db.internal port=5432 user=app\n" * 200
+    for i in range(count):
+        with open(os.path.join(folder, f"config_{i}.txt"), "w") as fs:
+            fs.write(body if i % 3 else body.replace("old-db", "cache"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+    # Files without the token make updateFile warn once each
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        organizer = FileOrganizer(workdir)
+        files = organizer.fileHandelingObj
+
+        populate(os.path.join(workdir, "loop"), args.files)
+        start = time.perf_counter()
+        for name in sorted(os.listdir(os.path.join(workdir, "loop"))):
+            files.updateFile(f"loop/{name}", 1, "old-db", "new-db")
+        loop = time.perf_counter() - start
+
+        populate(os.path.join(workdir, "bulk"), args.files)
+        start = time.perf_counter()
+        result = organizer.replaceInFolder("bulk", {"old-db": "new-db"}, processes=args.processes)
+        bulk = time.perf_counter() - start
+
+    print(f"updateFile loop : {loop:7.3f} s ({args.files / loop:10,.0f} files/s)")
+    print(f"replaceInFolder : {bulk:7.3f} s ({args.files / bulk:10,.0f} files/s)  {result[1]}")
+    print(f"speedup: {loop / bulk:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
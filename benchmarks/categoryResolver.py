@@ -0,0 +1,79 @@
+"""
+Category lookup benchmark: classifies N synthetic file names with the
+compiled CategoryResolver and with the old per-file lookup
+(Path(name).suffix.lower() into the extension dict), and times loading the
+mapping with a cold and a warm resolver cache.
+
+    python benchmarks/categoryResolver.py --names 1000000
+"""
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from FileOrganizer.Organizer import FileOrganizer  # noqa: E402
+from FileOrganizer.CategoryResolver import CategoryResolver  # noqa: E402
+
+
+def makeNames(count, table):
+    rng = random.Random(1)
+    extensions = list(table) + [".unknown", "", ".TXT", ".Tar.Gz", ".min.js"]
+    return [f"file_{i}{rng.choice(extensions)}" for i in range(count)]
+
+
+def dictLookup(names, table):
+    others = 0
+    for name in names:
+        if table.get(Path(name).suffix.lower()) is None:
+            others += 1
+    return others
+
+
+def resolverLookup(names, resolver):
+    others = 0
+    resolve = resolver.resolve
+    for name in names:
+        if resolve(name) is None:
+            others += 1
+    return others
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--names", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        jsonPath = Path(workdir) / "fileExtensions.json"
+        shutil.copy(PROJECT_ROOT / "FileOrganizer" / "fileExtensions.json", jsonPath)
+
+        cold = timed(CategoryResolver.load, jsonPath, FileOrganizer.extensionToCategory)
+        start = time.perf_counter()
+        resolver = CategoryResolver.load(jsonPath, FileOrganizer.extensionToCategory)[1]
+        warm = time.perf_counter() - start
+
+    names = makeNames(args.names, resolver.table)
+    oldSeconds = timed(dictLookup, names, resolver.table)
+    newSeconds = timed(resolverLookup, names, resolver)
+
+    print(f"mapping load     : cold {cold * 1000:7.2f} ms, cached {warm * 1000:7.2f} ms")
+    print(f"per-file dict    : {oldSeconds:7.3f} s  ({args.names / oldSeconds:12,.0f} names/s)")
+    print(f"CategoryResolver : {newSeconds:7.3f} s  ({args.names / newSeconds:12,.0f} names/s)")
+    print(f"speedup          : {oldSeconds / newSeconds:7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Startup-time benchmark for the FileHandeling / FileOrganizer packages.
+
+Measures how long a fresh interpreter needs to import the library (minus the
+bare interpreter startup) and checks that importing has no side effects:
+no files or folders created and the root logger left alone. Exits with
+status 1 when the import is slower than --budget-ms or has side effects, so
+it can run in CI to catch regressions.
+
+    python benchmarks/startupTime.py --runs 20 --budget-ms 80
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+MODULES = [
+    "FileHandeling.FileHandlingOperations",
+    "FileHandeling.AsyncFileHandlingOperations",
+    "FileOrganizer.Organizer",
+]
+
+IMPORT_PROBE = """
+import json, logging, os, time
+before = list(logging.root.handlers)
+start = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "rootHandlersChanged": list(logging.root.handlers) != before,
+    "cwdEntries": sorted(os.listdir(".")),
+}}))
+"""
+
+
+def timeProcess(code, cwd, env):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return elapsed, result.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=80.0, help="Max import time above bare startup")
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT), PYTHONDONTWRITEBYTECODE="1")
+    imports = "\n".join(f"import {name}" for name in MODULES)
+    probe = IMPORT_PROBE.format(imports=imports)
+
+    # Warm the bytecode cache once so every run measures the same thing
+    subprocess.run([sys.executable, "-c", imports], cwd=PROJECT_ROOT, env=dict(env, PYTHONDONTWRITEBYTECODE=""))
+
+    bare = []
+    loaded = []
+    inProcess = []
+    sideEffects = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for _ in range(args.runs):
+            bare.append(timeProcess("pass", workdir, env)[0])
+            elapsed, output = timeProcess(probe, workdir, env)
+            loaded.append(elapsed)
+            report = json.loads(output)
+            inProcess.append(report["seconds"])
+            if report["rootHandlersChanged"]:
+                sideEffects.append("root logger handlers changed")
+            if report["cwdEntries"]:
+                sideEffects.append(f"files created in working directory: {report['cwdEntries']}")
+
+    # Best-of-N is the least noisy estimate for startup work
+    overheadMs = (min(loaded) - min(bare)) * 1000
+    importMs = min(inProcess) * 1000
+    print(f"bare interpreter : {min(bare) * 1000:8.1f} ms")
+    print(f"with library     : {min(loaded) * 1000:8.1f} ms")
+    print(f"import overhead  : {overheadMs:8.1f} ms (in-process {importMs:.1f} ms, budget {args.budget_ms:.1f} ms)")
+
+    failed = False
+    if importMs > args.budget_ms:
+        print("FAIL: import time is over budget")
+        failed = True
+    for problem in sorted(set(sideEffects)):
+        print(f"FAIL: import has side effects: {problem}")
+        failed = True
+
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Replace benchmark: rewrites a --mb MB text file with the old read/replace/
+write approach and with StreamReplace.Replacer.replaceFile (streamed and
+equal-length in place), reporting time and peak Python heap (tracemalloc, separate run).
+
+    python benchmarks/streamReplace.py --mb 200
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from FileHandeling.StreamReplace import Replacer  # noqa: E402
+
+
+def makeFile(path, megabytes):
+    line = b"2024-01-01 INFO request handled by worker-17 in 12ms token=alpha\n"
+    with open(path, "wb") as fs:
+        block = line * (1024 * 1024 // len(line))
+        for _ in range(megabytes):
+            fs.write(block)
+
+
+def oldReplace(path, old, new):
+    with open(path, "r") as fs:
+        data = fs.read()
+    with open(path, "w") as fs:
+        fs.write(data.replace(old, new))
+
+
+def measure(func, path, megabytes):
+    # Timed and traced in separate runs: tracemalloc slows allocations down a lot
+    makeFile(path, megabytes)
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+
+    makeFile(path, megabytes)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mb", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "big.log")
+        cases = {
+            "read/replace/write": lambda: oldReplace(path, "alpha", "omega-2"),
+            "replaceFile stream": lambda: Replacer({"alpha": "omega-2"}).replaceFile(path),
+            "replaceFile mmap": lambda: Replacer({"alpha": "omega"}).replaceFile(path),
+        }
+        for label, func in cases.items():
+            seconds, peak = measure(func, path, args.mb)
+            print(f"{label:20}: {seconds:7.3f} s, peak heap {peak / 1e6:8.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+Tree deletion benchmark: builds a tree of --dirs x --subdirs folders with
+--files files each and deletes it with shutil.rmtree, TreeDeleter.deleteTree
+and TreeDeleter.trash (time until the folder is gone for the caller, and
+until the background purge finishes). Best of --runs.
+
+    python benchmarks/treeDelete.py --dirs 16 --subdirs 8 --files 500 --workers 8
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from FileOrganizer.TreeDeleter import TreeDeleter  # noqa: E402
+
+
+def build(root, dirs, subdirs, files):
+    for d in range(dirs):
+        for s in range(subdirs):
+            folder = os.path.join(root, f"d{d}", f"s{s}")
+            os.makedirs(folder)
+            for f in range(files):
+                os.close(os.open(os.path.join(folder, f"f{f}.txt"), os.O_WRONLY | os.O_CREAT))
+
+
+def runOnce(args):
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for label in ("rmtree", "deleteTree", "trash"):
+            root = os.path.join(workdir, label)
+            build(root, args.dirs, args.subdirs, args.files)
+            start = time.perf_counter()
+            if label == "rmtree":
+                shutil.rmtree(root)
+            elif label == "deleteTree":
+                TreeDeleter(args.workers).deleteTree(root)
+            else:
+                thread = TreeDeleter(args.workers).trash(root)[2]
+                results["trash (visible)"] = time.perf_counter() - start
+                thread.join()
+                label = "trash (purged)"
+            results[label] = time.perf_counter() - start
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dirs", type=int, default=16)
+    parser.add_argument("--subdirs", type=int, default=8)
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    total = args.dirs * args.subdirs * args.files
+    best = {}
+    for _ in range(args.runs):
+        for label, seconds in runOnce(args).items():
+            best[label] = min(best.get(label, seconds), seconds)
+
+    for label, seconds in best.items():
+        print(f"{label:16}: {seconds:8.4f} s ({total / seconds:12,.0f} files/s)")
+    print(f"deleteTree speedup: {best['rmtree'] / best['deleteTree']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,18 @@
+import sys
+import shutil
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@pytest.fixture
+def base(tmp_path):
+    """Base folder with the bundled extension mapping, like FileOrganizer/ ships it."""
+    folder = tmp_path / "base"
+    folder.mkdir()
+    shutil.copy(PROJECT_ROOT / "FileOrganizer" / "fileExtensions.json", folder)
+    return folder
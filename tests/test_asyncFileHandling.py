@@ -0,0 +1,31 @@
+import asyncio
+
+import pytest
+
+from FileHandeling.AsyncFileHandlingOperations import AsyncFileHandling
+
+
+def gather(base, operations):
+    async def main():
+        async with AsyncFileHandling(str(base)) as handling:
+            return await handling.gatherOperations(operations)
+
+    return asyncio.run(main())
+
+
+def testGatherRunsDocumentedOperations(base):
+    (base / "a.txt").write_text("hello")
+
+    results = gather(base, [("readFile", ("a.txt",)), ("createNewFiles", ([("b.txt", "new")],))])
+
+    assert results[0][0] and "hello" in str(results[0][1:])
+    assert results[1][0]
+    assert (base / "b.txt").read_text() == "new"
+
+
+@pytest.mark.parametrize("methodName", ["printListing", "printFile", "close", "ensureBaseDir", "run", "_missing"])
+def testGatherRejectsOtherMethods(base, methodName):
+    results = gather(base, [(methodName, ()), ("readFile", ("missing.txt",))])
+
+    assert results[0] == [False, f"Unknown operation: {methodName}"]
+    assert len(results) == 2
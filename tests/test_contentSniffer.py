@@ -0,0 +1,33 @@
+import json
+
+from FileOrganizer.Organizer import FileOrganizer
+from FileOrganizer.ContentSniffer import ContentSniffer
+
+
+def testElfGoesToTheMappingsExecutablesFolder(base):
+    folder = base / "in"
+    (folder / "executables").mkdir(parents=True)
+    (folder / "tool").write_bytes(b"\x7fELF" + bytes(60))
+
+    result = FileOrganizer(base).organizeMyFolder("in", "fileExtensions.json", sniff=True)
+
+    assert result[0], result[1]
+    assert [path.name for path in folder.iterdir()] == ["executables"]
+    assert (folder / "executables" / "tool").exists()
+
+
+def testUnknownSignatureCategoryIsIgnored(base, tmp_path):
+    signatures = tmp_path / "signatures.json"
+    signatures.write_text(json.dumps({"signatures": [{"category": "Gadgets", "parts": [[0, "CAFE"]]}]}))
+    folder = base / "in"
+    folder.mkdir()
+    (folder / "thing").write_bytes(bytes.fromhex("CAFE") + b"rest")
+    organizer = FileOrganizer(base)
+    mapping = organizer.loadMapping("fileExtensions.json")[2]
+
+    sniffer = ContentSniffer(signatures)
+    result = organizer.organizeMyFolder("in", "fileExtensions.json", sniff=sniffer)
+
+    assert result[0], result[1]
+    assert sniffer.classify([folder / "thing"], mapping) == {}
+    assert [path.name for path in folder.iterdir()] == ["thing"]
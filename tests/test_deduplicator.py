@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+from FileOrganizer.Organizer import FileOrganizer
+from FileOrganizer.Deduplicator import Deduplicator, SAMPLE_SIZE
+
+
+@pytest.fixture
+def folder(base):
+    """'in' holds two copies of images/keep.jpg, a file of the same size that differs, and a large duplicate."""
+    folder = base / "in"
+    (folder / "images").mkdir(parents=True)
+    (folder / "images" / "keep.jpg").write_text("same")
+    (folder / "dup.jpg").write_text("same")
+    (folder / "dup2.jpg").write_text("same")
+    (folder / "other.jpg").write_text("diff")
+    big = os.urandom(4 * SAMPLE_SIZE)
+    (folder / "big.jpg").write_bytes(big)
+    (folder / "bigCopy.jpg").write_bytes(big)
+    return folder
+
+
+def organize(base, policy):
+    result = FileOrganizer(base).organizeMyFolder("in", "fileExtensions.json", duplicates=policy)
+    assert result[0], result[1]
+    return result[2]
+
+
+def testSkipLeavesDuplicatesInPlace(base, folder):
+    stats = organize(base, "skip")
+
+    assert stats["duplicates"] == 3
+    assert sorted(os.listdir(folder / "images")) == ["big.jpg", "keep.jpg", "other.jpg"]
+    assert (folder / "dup.jpg").exists() and (folder / "dup2.jpg").exists() and (folder / "bigCopy.jpg").exists()
+
+
+def testDeleteRemovesDuplicates(base, folder):
+    stats = organize(base, "delete")
+
+    assert stats["duplicates"] == 3
+    assert sorted(os.listdir(folder / "images")) == ["big.jpg", "keep.jpg", "other.jpg"]
+    assert not any(entry.is_file() for entry in folder.iterdir())
+
+
+def testHardlinkPutsLinkInCategoryFolder(base, folder):
+    stats = organize(base, "hardlink")
+
+    images = folder / "images"
+    assert stats["duplicates"] == 3
+    assert sorted(os.listdir(images)) == ["big.jpg", "bigCopy.jpg", "dup.jpg", "dup2.jpg", "keep.jpg", "other.jpg"]
+    assert os.path.samefile(images / "dup.jpg", images / "keep.jpg")
+    assert os.path.samefile(images / "dup2.jpg", images / "keep.jpg")
+    assert os.path.samefile(images / "bigCopy.jpg", images / "big.jpg")
+    assert not os.path.samefile(images / "other.jpg", images / "keep.jpg")
+    assert not any(entry.is_file() for entry in folder.iterdir())
+
+
+def testHardlinkKeepsExistingNames(base, folder):
+    (folder / "images" / "dup.jpg").write_text("unrelated")
+
+    organize(base, "hardlink")
+
+    images = folder / "images"
+    assert (images / "dup.jpg").read_text() == "unrelated"
+    assert os.path.samefile(images / "dup(1).jpg", images / "keep.jpg")
+
+
+def testUnknownPolicyIsRejected():
+    with pytest.raises(ValueError):
+        Deduplicator("rename")
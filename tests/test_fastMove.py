@@ -0,0 +1,51 @@
+import os
+import errno
+
+import pytest
+
+from FileHandeling import FastMove
+from FileHandeling.FastMove import fastMove
+
+
+@pytest.fixture
+def crossDevice(monkeypatch):
+    """Makes every rename fail with EXDEV so fastMove takes the copy path."""
+    def rename(source, destination):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+    monkeypatch.setattr(FastMove.os, "rename", rename)
+
+
+def testCopyPathMovesFile(tmp_path, crossDevice):
+    source = tmp_path / "a.bin"
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    source.write_bytes(data)
+
+    result = fastMove(str(source), str(tmp_path / "b.bin"))
+
+    assert result["method"] == "copy" and result["bytes"] == len(data)
+    assert (tmp_path / "b.bin").read_bytes() == data
+    assert not source.exists()
+
+
+def testCopyFileRangeReturningZeroFallsBack(tmp_path, crossDevice, monkeypatch):
+    monkeypatch.setattr(FastMove.os, "copy_file_range", lambda *args: 0, raising=False)
+    source = tmp_path / "a.bin"
+    data = os.urandom(100000)
+    source.write_bytes(data)
+
+    fastMove(str(source), str(tmp_path / "b.bin"))
+
+    assert (tmp_path / "b.bin").read_bytes() == data
+    assert not source.exists()
+
+
+def testShortCopyKeepsSource(tmp_path, crossDevice, monkeypatch):
+    monkeypatch.setattr(FastMove, "copyContents", lambda *args, **kwargs: 0)
+    source = tmp_path / "a.bin"
+    source.write_bytes(b"important")
+
+    with pytest.raises(OSError):
+        fastMove(str(source), str(tmp_path / "b.bin"))
+
+    assert source.read_bytes() == b"important"
+    assert not (tmp_path / "b.bin").exists()
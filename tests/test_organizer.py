@@ -0,0 +1,70 @@
+from FileOrganizer import MoveEngine
+from FileOrganizer.Organizer import FileOrganizer
+
+
+def testRetryThatFailsAgainIsCountedOnce(base, monkeypatch):
+    folder = base / "in"
+    folder.mkdir()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (folder / name).write_text(name)
+    realMoveOne = MoveEngine.moveOne
+
+    def moveOne(source, destination):
+        # Somebody else always writes the destination first
+        with open(destination, "w") as fs:
+            fs.write("theirs")
+        return realMoveOne(source, destination)
+
+    monkeypatch.setattr(MoveEngine, "moveOne", moveOne)
+
+    result = FileOrganizer(base).organizeMyFolder("in", "fileExtensions.json")
+
+    assert not result[0]
+    assert result[1] == "Folder 'in' organized with 3 failed move(s)"
+    assert result[2]["failed"] == 3
+    assert sum(stat["failed"] for stat in result[2]["perWorker"].values()) == 3
+    assert sorted(path.name for path in folder.iterdir() if path.is_file()) == ["a.txt", "b.txt", "c.txt"]
+
+
+def testRetryUnderNewNameIsNotAFailure(base, monkeypatch):
+    folder = base / "in"
+    folder.mkdir()
+    (folder / "a.txt").write_text("mine")
+    realMoveOne = MoveEngine.moveOne
+
+    def moveOne(source, destination):
+        if destination.endswith("a.txt"):
+            with open(destination, "w") as fs:
+                fs.write("theirs")
+        return realMoveOne(source, destination)
+
+    monkeypatch.setattr(MoveEngine, "moveOne", moveOne)
+
+    result = FileOrganizer(base).organizeMyFolder("in", "fileExtensions.json")
+
+    assert result[0], result[1]
+    assert result[2]["failed"] == 0 and result[2]["moved"] == 1
+    assert (folder / "documents" / "a.txt").read_text() == "theirs"
+    assert (folder / "documents" / "a(1).txt").read_text() == "mine"
+
+
+def testApplyPlanSkipsSourcesChangedSincePlanning(base):
+    folder = base / "in"
+    folder.mkdir()
+    for name in ("a.txt", "b.txt", "c.txt", "d.txt"):
+        (folder / name).write_text(name)
+    organizer = FileOrganizer(base)
+    plan = organizer.planFolder("in", "fileExtensions.json")[2]
+
+    (folder / "a.txt").write_text("grown since planning")
+    (folder / "b.new").write_text("b.txt")
+    (folder / "b.new").replace(folder / "b.txt")  # same size, another inode
+    (folder / "c.txt").unlink()
+
+    result = organizer.applyPlan(plan, journal=False)
+
+    assert not result[0]
+    assert result[2]["failed"] == 3 and result[2]["changed"] == 3
+    assert result[2]["moved"] == 1 and result[2]["planned"] == 4
+    assert sorted(path.name for path in folder.iterdir() if path.is_file()) == ["a.txt", "b.txt"]
+    assert [path.name for path in (folder / "documents").iterdir()] == ["d.txt"]
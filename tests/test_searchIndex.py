@@ -0,0 +1,37 @@
+import os
+
+from FileHandeling.SearchIndex import SearchIndex
+
+
+def age(*paths):
+    # Recent mtimes are racy and always re-read
+    for path in paths:
+        os.utime(path, ns=(0, 10**18))
+
+
+def testSkippedFilesAreNotReadAgain(base, monkeypatch):
+    folder = base / "docs"
+    folder.mkdir()
+    (folder / "notes.txt").write_text("find the needle")
+    (folder / "binary.txt").write_bytes(b"needle\0\1\2")
+    (folder / "large.txt").write_text("needle " * 100)
+    age(folder / "notes.txt", folder / "binary.txt", folder / "large.txt")
+
+    with SearchIndex(folder, maxFileSize=200, inside=True) as index:
+        first = index.update()
+        assert (first["added"], first["skipped"]) == (1, 2)
+
+        reads = []
+        realReadText = index.readText
+        monkeypatch.setattr(index, "readText", lambda path, size: reads.append(path) or realReadText(path, size))
+        second = index.update()
+        assert reads == []
+        assert (second["added"], second["skipped"], second["unchanged"]) == (0, 0, 3)
+        assert [hit["path"] for hit in index.search("needle")] == ["notes.txt"]
+
+        (folder / "binary.txt").write_text("now a needle in text")
+        age(folder / "binary.txt")
+        third = index.update()
+        assert [os.path.basename(path) for path in reads] == ["binary.txt"]
+        assert (third["updated"], third["unchanged"]) == (1, 2)
+        assert sorted(hit["path"] for hit in index.search("needle")) == ["binary.txt", "notes.txt"]
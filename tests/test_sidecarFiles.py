@@ -0,0 +1,34 @@
+import pytest
+
+from FileHandeling.SidecarFiles import isSidecarFile
+
+
+@pytest.mark.parametrize("name", [
+    ".in.organizeIndex.sqlite",
+    ".in.organizeIndex.sqlite-wal",
+    ".in.organizeIndex.sqlite-shm",
+    ".base.searchIndex.sqlite-journal",
+    ".in.sniffCache.json",
+    ".in.sniffCache.json.4242.tmp",
+    ".in.organizeJournal",
+    ".fileExtensions.json.resolver-cache",
+    ".fileExtensions.json.resolver-cache.4242.tmp",
+    ".notes.txt.4242.replace.tmp",
+])
+def testSidecarNamesAreRecognized(name):
+    assert isSidecarFile(name)
+
+
+@pytest.mark.parametrize("name", [
+    "notes.replace.tmp.txt",
+    "notes.replace.tmp",
+    ".notes.replace.tmp",
+    "a.organizeJournal.bak",
+    "a.organizeJournal",
+    ".organizeJournal",
+    "report.searchIndex.sqlite",
+    ".in.sniffCache.json.bak.tmp",
+    "plain.txt",
+])
+def testUserFilesAreNotSidecars(name):
+    assert not isSidecarFile(name)
@@ -0,0 +1,97 @@
+import os
+import random
+
+import pytest
+
+from FileHandeling.StreamReplace import Replacer
+
+
+def referenceReplace(data, replacements):
+    """Leftmost, longest-first, non-overlapping replacement done the slow way."""
+    patterns = sorted(replacements, key=len, reverse=True)
+    out = []
+    position = 0
+    while position < len(data):
+        for old in patterns:
+            if data.startswith(old, position):
+                out.append(replacements[old])
+                position += len(old)
+                break
+        else:
+            out.append(data[position:position + 1])
+            position += 1
+    return b"".join(out)
+
+
+def testMmapPathReplacesInPlace(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"cat dog cat\n" * 1000)
+    inode = os.stat(path).st_ino
+
+    result = Replacer({"cat": "cow"}).replaceFile(path, chunkSize=64)
+
+    assert result["method"] == "mmap"
+    assert result["replacements"] == 2000
+    assert path.read_bytes() == b"cow dog cow\n" * 1000
+    assert os.stat(path).st_ino == inode
+
+
+def testStreamPathRewritesThroughTempFile(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"head " + b"abc-" * 5000)
+    os.chmod(path, 0o640)
+    inode = os.stat(path).st_ino
+
+    result = Replacer({"abc": "a much longer text"}).replaceFile(path, chunkSize=37)
+
+    assert result["method"] == "stream"
+    assert result["replacements"] == 5000
+    assert path.read_bytes() == b"head " + b"a much longer text-" * 5000
+    assert result["bytesOut"] == os.path.getsize(path)
+    assert os.stat(path).st_ino != inode
+    assert os.stat(path).st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == ["a.txt"]
+
+
+def testFileWithoutMatchIsNotRewritten(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes(b"nothing to see")
+    before = os.stat(path)
+
+    result = Replacer({"absent": "x"}).replaceFile(path)
+
+    assert result["method"] == "none" and result["replacements"] == 0
+    assert os.stat(path).st_mtime_ns == before.st_mtime_ns
+    assert os.stat(path).st_ino == before.st_ino
+
+
+@pytest.mark.parametrize("inPlace", [True, False])
+def testMatchesAcrossChunkBoundaries(tmp_path, inPlace):
+    rng = random.Random(7)
+    replacements = {b"ab": b"xy", b"aba": b"zzz", b"b": b"q"}
+    data = bytes(rng.choice(b"abc") for _ in range(20000))
+    path = tmp_path / "a.bin"
+    path.write_bytes(data)
+
+    result = Replacer(replacements).replaceFile(path, chunkSize=5, inPlace=inPlace, sync=False)
+
+    assert path.read_bytes() == referenceReplace(data, replacements)
+    assert result["method"] == ("mmap" if inPlace else "stream")
+
+
+def testEmptyPatternIsRejected():
+    with pytest.raises(ValueError):
+        Replacer({"": "x"})
+
+
+@pytest.mark.parametrize("new", ["dog", "a longer dog"])
+def testSymlinkTargetIsRewritten(tmp_path, new):
+    target = tmp_path / "target.txt"
+    target.write_bytes(b"cat and cat")
+    link = tmp_path / "link.txt"
+    link.symlink_to(target)
+
+    Replacer({"cat": new}).replaceFile(link)
+
+    assert link.is_symlink() and os.readlink(link) == str(target)
+    assert target.read_bytes() == f"{new} and {new}".encode()
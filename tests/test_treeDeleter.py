@@ -0,0 +1,63 @@
+import os
+
+from FileOrganizer.TreeDeleter import TreeDeleter, isEmptyDir
+
+
+def makeTree(root, depth=3, width=3, files=4):
+    for index in range(files):
+        (root / f"file{index}.txt").write_text("x" * index)
+    if depth:
+        for index in range(width):
+            child = root / f"dir{index}"
+            child.mkdir()
+            makeTree(child, depth - 1, width, files)
+
+
+def testDeleteTreeRemovesEverything(tmp_path):
+    root = tmp_path / "tree"
+    root.mkdir()
+    makeTree(root)
+
+    result = TreeDeleter(workers=4).deleteTree(root)
+
+    assert result[0], result[1]
+    assert not root.exists()
+    # 4 files in each of 1 + 3 + 9 + 27 folders
+    assert result[2]["files"] == 160 and result[2]["dirs"] == 40
+
+
+def testDeleteTreeDoesNotFollowSymlinks(tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("keep")
+    root = tmp_path / "tree"
+    (root / "sub").mkdir(parents=True)
+    os.symlink(outside, root / "linkToDir")
+    os.symlink(outside / "keep.txt", root / "sub" / "linkToFile")
+    os.symlink(tmp_path / "missing", root / "dangling")
+
+    result = TreeDeleter().deleteTree(root)
+
+    assert result[0], result[1]
+    assert not os.path.lexists(root)
+    assert (outside / "keep.txt").read_text() == "keep"
+
+
+def testTrashRenamesAtOnceAndPurgesInBackground(tmp_path):
+    root = tmp_path / "tree"
+    root.mkdir()
+    makeTree(root, depth=2)
+
+    result = TreeDeleter().trash(root)
+
+    assert result[0], result[1]
+    assert not root.exists()
+    result[2].join(timeout=30)
+    assert not result[2].is_alive()
+    assert os.listdir(tmp_path) == []
+
+
+def testIsEmptyDir(tmp_path):
+    assert isEmptyDir(tmp_path)
+    (tmp_path / "a").write_text("")
+    assert not isEmptyDir(tmp_path)
@@ -0,0 +1,74 @@
+from FileOrganizer.Organizer import FileOrganizer
+from FileOrganizer.MoveEngine import MoveEngine
+from FileOrganizer.UndoJournal import UndoJournal
+
+
+def writeFile(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def testUndoSkipsFailedMove(base):
+    folder = base / "in"
+    writeFile(folder / "a.txt", "mine a")
+    writeFile(folder / "b.txt", "mine b")
+    theirs = writeFile(folder / "documents" / "b.txt", "theirs")
+
+    moves = [(str(folder / "a.txt"), str(folder / "documents" / "a.txt")),
+             (str(folder / "b.txt"), str(folder / "documents" / "b.txt"))]
+    with UndoJournal(folder) as journal, MoveEngine() as engine:
+        journal.record(moves)
+        result = engine.execute(moves)
+        journal.commit(result[1])
+    assert [source for source, _ in result[1]] == [str(folder / "b.txt")]
+
+    result = FileOrganizer(base).undoOrganize("in")
+
+    assert result[0], result[1]
+    assert result[2]["moved"] == 1
+    assert (folder / "a.txt").read_text() == "mine a"
+    assert (folder / "b.txt").read_text() == "mine b"
+    assert theirs.read_text() == "theirs"
+
+
+def testUndoLeavesChangedFileAndKeepsRunOpen(base):
+    folder = base / "in"
+    writeFile(folder / "a.txt", "a")
+    writeFile(folder / "b.txt", "b")
+    organizer = FileOrganizer(base)
+    assert organizer.organizeMyFolder("in", "fileExtensions.json")[0]
+    (folder / "documents" / "b.txt").write_text("edited after the run")
+
+    result = organizer.undoOrganize("in")
+
+    assert not result[0]
+    assert result[2]["moved"] == 1 and result[2]["failed"] == 1
+    assert (folder / "a.txt").read_text() == "a"
+    assert (folder / "documents" / "b.txt").read_text() == "edited after the run"
+    runId, _, _, undone = UndoJournal(folder).runs()[-1]
+    assert runId == result[2]["journalRun"] and not undone
+
+
+def testUndoCountsFilesAlreadyBack(base):
+    folder = base / "in"
+    writeFile(folder / "a.txt", "a")
+    organizer = FileOrganizer(base)
+    assert organizer.organizeMyFolder("in", "fileExtensions.json")[0]
+    # The file is back already (moved by hand); undo counts it instead of failing
+    (folder / "documents" / "a.txt").rename(folder / "a.txt")
+
+    result = organizer.undoOrganize("in")
+
+    assert result[0], result[1]
+    assert result[2]["alreadyRestored"] == 1
+    assert UndoJournal(folder).undoMoves()[0] is False
+
+
+def testUncommittedBatchIsNotUndone(base):
+    folder = base / "in"
+    writeFile(folder / "a.txt", "a")
+    with UndoJournal(folder) as journal:
+        journal.record([(str(folder / "a.txt"), str(folder / "documents" / "a.txt"))])
+
+    assert UndoJournal(folder).undoMoves() == [False, "Nothing to undo"]